@@ -0,0 +1,174 @@
+"""
+Drive TimebutlerClient against the local mock server and report latency percentiles and throughput.
+
+Every worker calls the endpoints round-robin through one shared client (and thus one connection
+pool), so the run exercises connection reuse, concurrency limits, retries on 429/5xx and the
+parsing of real HTTP responses. Requests are not coalesced, so every call reaches the server.
+
+Usage:
+    python -m benchmarks.load_test [--requests 500] [--concurrency 16] [--latency 0.02] [--rate-limited-ratio 0.05]
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from timebutler_client import RetryPolicy, TimebutlerClient
+
+from .mock_server import ENDPOINTS, MockServerConfig, MockServerStats, MockTimebutlerServer
+
+#: The client call that fetches each endpoint.
+CALLS: dict[str, Callable[[TimebutlerClient], Awaitable[Any]]] = {
+    "absences": lambda client: client.get_absences(2026),
+    "projects": lambda client: client.get_projects(),
+    "services": lambda client: client.get_services(),
+    "users": lambda client: client.get_users(),
+    "workdays": lambda client: client.get_workdays(),
+    "worktime": lambda client: client.get_worktime(2026, 1),
+}
+
+
+@dataclass
+class LoadTestResult:
+    """Latencies and outcomes of all calls of a load test run."""
+
+    seconds: float
+    latencies: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter[str] = field(default_factory=Counter)
+    server: MockServerStats = field(default_factory=MockServerStats)
+
+    @property
+    def calls(self) -> int:
+        """Number of successful calls."""
+        return sum(len(latencies) for latencies in self.latencies.values())
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """The nearest-rank percentile (fraction between 0 and 1) of already sorted values."""
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[max(1, math.ceil(len(sorted_values) * fraction)) - 1]
+
+
+async def run_load_test(
+    config: MockServerConfig,
+    *,
+    requests: int,
+    concurrency: int,
+    endpoints: Sequence[str] = ENDPOINTS,
+    retry_policy: RetryPolicy | None = None,
+    parse_mode: str = "strict",
+) -> LoadTestResult:
+    """
+    Start a mock server and send `requests` calls through `concurrency` workers sharing one client.
+
+    Args:
+        config: How the mock server responds
+        requests: Total number of client calls
+        concurrency: Number of calls in flight at the same time
+        endpoints: Endpoints to call, round-robin
+        retry_policy: Retry policy of the client, None to count every 429/5xx as an error
+        parse_mode: Parse mode of the client
+
+    Returns:
+        Per-endpoint latencies of the successful calls, errors by type and the server's stats
+    """
+    next_call = iter(range(requests))
+    async with MockTimebutlerServer(config) as server:
+        client = TimebutlerClient(
+            api_key="load-test",
+            base_url=server.base_url,
+            retry_policy=retry_policy,
+            parse_mode=parse_mode,  # type: ignore[arg-type]
+            coalesce_requests=False,
+        )
+        result = LoadTestResult(seconds=0.0, server=server.stats)
+
+        async def _worker() -> None:
+            for call_number in next_call:
+                endpoint = endpoints[call_number % len(endpoints)]
+                started = time.perf_counter()
+                try:
+                    await CALLS[endpoint](client)
+                except Exception as e:  # pylint: disable=broad-exception-caught  # counted and reported
+                    result.errors[f"{endpoint}: {type(e).__name__}"] += 1
+                else:
+                    result.latencies[endpoint].append(time.perf_counter() - started)
+
+        async with client:
+            started = time.perf_counter()
+            await asyncio.gather(*(_worker() for _ in range(concurrency)))
+            result.seconds = time.perf_counter() - started
+    return result
+
+
+def _print_report(result: LoadTestResult) -> None:
+    print(f"{'endpoint':<9} {'calls':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for endpoint in sorted(result.latencies):
+        latencies = sorted(result.latencies[endpoint])
+        p50, p95, p99, p100 = (percentile(latencies, fraction) * 1000 for fraction in (0.5, 0.95, 0.99, 1))
+        print(f"{endpoint:<9} {len(latencies):>7,} {p50:>7.1f}ms {p95:>7.1f}ms {p99:>7.1f}ms {p100:>7.1f}ms")
+    print(f"\n{result.calls:,} successful calls in {result.seconds:.2f}s: {result.calls / result.seconds:,.1f} calls/s")
+    for error, count in sorted(result.errors.items()):
+        print(f"  failed: {count:,}x {error}")
+    server = result.server
+    print(
+        f"server: {server.requests.total():,} requests, statuses {dict(sorted(server.statuses.items()))}, "
+        f"{len(server.connections):,} connections, at most {server.max_in_flight} in flight, "
+        f"{server.bytes_sent / 2**20:,.1f} MiB sent"
+    )
+
+
+def main() -> None:
+    """Run a load test with the options from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Load test TimebutlerClient against the local mock server")
+    parser.add_argument("--requests", type=int, default=500, help="total number of client calls")
+    parser.add_argument("--concurrency", type=int, default=16, help="calls in flight at the same time")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument("--rows", type=int, help="rows of every response (default: per endpoint)")
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra server latency in seconds")
+    parser.add_argument("--bytes-per-second", type=float, help="download bandwidth per response")
+    parser.add_argument("--rate-limited-ratio", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--server-error-ratio", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After of 429 responses in seconds")
+    parser.add_argument("--max-attempts", type=int, default=3, help="attempts per call, 1 to not retry")
+    parser.add_argument("--parse-mode", choices=("strict", "fast"), default="strict")
+    args = parser.parse_args()
+    # retries and skipped users show up in the server stats instead of one log line each
+    logging.getLogger("timebutler_client").setLevel(logging.ERROR)
+
+    rows = dict.fromkeys(ENDPOINTS, args.rows) if args.rows else {}
+    if args.rows:
+        rows["workdays"] = 3 * args.rows  # three schedules for each user in /users
+    config = MockServerConfig(
+        rows=rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        bytes_per_second=args.bytes_per_second,
+        rate_limited_ratio=args.rate_limited_ratio,
+        retry_after=args.retry_after,
+        server_error_ratio=args.server_error_ratio,
+    )
+    retry_policy = RetryPolicy(max_attempts=args.max_attempts, initial_backoff=0.01, deadline=None)
+    result = asyncio.run(
+        run_load_test(
+            config,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            endpoints=args.endpoints,
+            retry_policy=retry_policy if args.max_attempts > 1 else None,
+            parse_mode=args.parse_mode,
+        )
+    )
+    _print_report(result)
+
+
+if __name__ == "__main__":
+    main()
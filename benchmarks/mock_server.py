@@ -0,0 +1,213 @@
+"""
+A local stand-in for the Timebutler API, for end-to-end and load tests over a real HTTP transport.
+
+The server answers POST requests to the six endpoints (/absences, /projects, /services, /users,
+/workdays, /worktime) with synthetic CSV responses from payloads.py. Latency, payload sizes,
+download bandwidth and injected 429/5xx responses (with a Retry-After header) are configurable:
+
+    async with MockTimebutlerServer(MockServerConfig(latency=0.05, rate_limited_ratio=0.1)) as server:
+        async with TimebutlerClient(api_key="test", base_url=server.base_url) as client:
+            entries = await client.get_worktime(2026, 1)
+        print(server.stats)
+
+Run it standalone to point other tools at it:
+
+    python -m benchmarks.mock_server --port 8080 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
+
+from aiohttp import web
+
+from .payloads import GENERATORS
+
+#: Endpoints the server implements.
+ENDPOINTS = tuple(sorted(GENERATORS))
+
+#: Rows per endpoint if not configured otherwise. /workdays has three schedules per user and
+#: needs all of its users in /users, so it must not have more than three times as many rows.
+DEFAULT_ROWS = {"absences": 1_000, "projects": 100, "services": 20, "users": 300, "workdays": 900, "worktime": 5_000}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class MockServerConfig:
+    """How the mock server responds."""
+
+    #: Data rows per endpoint; endpoints not listed get DEFAULT_ROWS.
+    rows: dict[str, int] = field(default_factory=dict)
+    #: Seconds before the response headers are sent.
+    latency: float = 0.0
+    #: Random extra seconds (uniform from 0 to this) added to the latency.
+    jitter: float = 0.0
+    #: Download bandwidth of the response body in bytes per second, None for unthrottled.
+    bytes_per_second: float | None = None
+    #: Fraction of the requests answered with 429 Too Many Requests.
+    rate_limited_ratio: float = 0.0
+    #: Value of the Retry-After header of 429 responses, None to send none.
+    retry_after: int | None = 1
+    #: Fraction of the requests answered with `server_error_status`.
+    server_error_ratio: float = 0.0
+    server_error_status: int = 503
+    #: The only accepted API key, None to accept any non-empty key.
+    api_key: str | None = None
+    #: Seed of the random latency jitter and error injection, for reproducible runs.
+    seed: int = 0
+
+
+@dataclass
+class MockServerStats:
+    """What the mock server has seen so far."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    #: Client addresses (host, port) of the connections used; fewer than requests means connections were reused.
+    connections: set[tuple[str, int]] = field(default_factory=set)
+    bytes_sent: int = 0
+    #: Requests being handled right now, and the most at any one time.
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+
+class MockTimebutlerServer:
+    """An aiohttp.web application serving synthetic Timebutler API responses on localhost."""
+
+    def __init__(self, config: MockServerConfig | None = None) -> None:
+        self.config = config or MockServerConfig()
+        self.stats = MockServerStats()
+        self._random = random.Random(self.config.seed)
+        self._bodies = {
+            endpoint: GENERATORS[endpoint](self.config.rows.get(endpoint, DEFAULT_ROWS[endpoint])).encode()
+            for endpoint in ENDPOINTS
+        }
+        self.app = web.Application()
+        self.app.router.add_post("/api/v1/{endpoint}", self._handle)
+        self._runner: web.AppRunner | None = None
+        self._base_url: str | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to TimebutlerClient; only available while the server is running."""
+        if self._base_url is None:
+            raise RuntimeError("The mock server is not running")
+        return self._base_url
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving (on a free port by default) and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self._base_url = f"http://{bound_host}:{bound_port}/api/v1"
+        return self._base_url
+
+    async def close(self) -> None:
+        """Stop serving and close all connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._base_url = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        endpoint = request.match_info["endpoint"]
+        stats = self.stats
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            stats.requests[endpoint] += 1
+            peer = request.transport.get_extra_info("peername") if request.transport else None
+            if peer:
+                stats.connections.add((peer[0], peer[1]))
+            response = await self._respond(request, endpoint)
+            stats.statuses[response.status] += 1
+            return response
+        finally:
+            stats.in_flight -= 1
+
+    async def _respond(self, request: web.Request, endpoint: str) -> web.StreamResponse:
+        config = self.config
+        form = await request.post()
+        if config.latency or config.jitter:
+            await asyncio.sleep(config.latency + self._random.uniform(0, config.jitter))
+        if endpoint not in self._bodies:
+            return web.Response(status=404, text=f"Unknown endpoint {endpoint}")
+        api_key = form.get("auth")
+        if not api_key or (config.api_key is not None and api_key != config.api_key):
+            return web.Response(status=401, text="Invalid API key")
+        roll = self._random.random()
+        if roll < config.rate_limited_ratio:
+            headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else {}
+            return web.Response(status=429, text="Too many requests", headers=headers)
+        if roll < config.rate_limited_ratio + config.server_error_ratio:
+            return web.Response(status=config.server_error_status, text="Injected server error")
+
+        body = self._bodies[endpoint]
+        self.stats.bytes_sent += len(body)
+        if config.bytes_per_second is None:
+            return web.Response(body=body, content_type="text/csv", charset="utf-8")
+        response = web.StreamResponse(headers={"Content-Type": "text/csv; charset=utf-8"})
+        response.content_length = len(body)
+        await response.prepare(request)
+        for offset in range(0, len(body), _CHUNK_SIZE):
+            chunk = body[offset : offset + _CHUNK_SIZE]
+            await response.write(chunk)
+            await asyncio.sleep(len(chunk) / config.bytes_per_second)
+        await response.write_eof()
+        return response
+
+
+async def _serve(config: MockServerConfig, host: str, port: int) -> None:
+    server = MockTimebutlerServer(config)
+    try:
+        print(f"Serving the Timebutler API on {await server.start(host, port)} (Ctrl+C to stop)")
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    """Run the mock server until interrupted."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Timebutler API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency in seconds")
+    parser.add_argument("--rate-limited-ratio", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--server-error-ratio", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of 429 responses in seconds")
+    args = parser.parse_args()
+    config = MockServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limited_ratio=args.rate_limited_ratio,
+        server_error_ratio=args.server_error_ratio,
+        retry_after=args.retry_after,
+    )
+    try:
+        asyncio.run(_serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
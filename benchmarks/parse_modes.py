@@ -0,0 +1,31 @@
+"""
+Compare the strict and the fast parse mode of TimebutlerClient on a synthetic /worktime response.
+
+Usage:
+    python -m benchmarks.parse_modes [number of rows]
+
+See benchmarks/parsing.py for all endpoints, peak memory and allocations.
+"""
+
+import sys
+import timeit
+
+from timebutler_client import TimebutlerClient
+
+from .payloads import make_worktime_csv
+
+
+def main(rows: int) -> None:
+    """Parse the same payload in both modes and print the timings and the speedup."""
+    csv_text = make_worktime_csv(rows)
+    timings: dict[str, float] = {}
+    for mode in ("strict", "fast"):
+        client = TimebutlerClient(api_key="benchmark", parse_mode=mode)
+        parse = client._parse_worktime_csv  # pylint: disable=protected-access
+        timings[mode] = min(timeit.repeat(lambda: parse(csv_text), number=1, repeat=3))  # noqa: B023
+        print(f"{mode:>6}: {timings[mode]:.3f}s ({rows / timings[mode]:,.0f} rows/s)")
+    print(f"speedup: {timings['strict'] / timings['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
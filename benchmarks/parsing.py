@@ -0,0 +1,174 @@
+"""
+Measure parse throughput, peak memory and allocations per endpoint on synthetic responses.
+
+Every endpoint's parser is run on a generated response (see payloads.py) in both parse modes, plus
+the columnar WorktimeTable for /worktime. For each run it reports:
+
+- rows/s: rows divided by the fastest of `--repeat` timed runs
+- peak: the peak memory traced by tracemalloc while parsing (in a separate, untimed run)
+- blocks: memory blocks (sys.getallocatedblocks()) held by the parse result, i.e. the allocations that live as
+  long as the models
+
+Usage:
+    python -m benchmarks.parsing [--rows 1000 100000 ...] [--endpoints worktime users ...] [--json]
+
+Parsing millions of rows in strict mode takes minutes and a few GB of memory; pass `--no-memory` to skip the
+(slower) traced run for the largest sizes.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from timebutler_client import TimebutlerClient, WorktimeTable
+from timebutler_client.fast_parsing import parse_worktime_table
+
+from .payloads import GENERATORS, employee_number_map
+
+#: Parse modes of the client, plus "table" for the columnar /worktime parser.
+MODES = ("strict", "fast", "table")
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Result of benchmarking one parser on one payload."""
+
+    endpoint: str
+    mode: str
+    rows: int
+    payload_bytes: int
+    seconds: float
+    peak_bytes: int | None
+    blocks: int
+
+    @property
+    def rows_per_second(self) -> float:
+        """Parsed rows per second of the fastest run."""
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def _parser(endpoint: str, mode: str, rows: int) -> Callable[[str], Any] | None:
+    """The function that parses a response of `endpoint` in `mode`; None if the combination doesn't exist."""
+    # pylint: disable=protected-access
+    if mode == "table":
+        return parse_worktime_table if endpoint == "worktime" else None
+    client = TimebutlerClient(api_key="benchmark", parse_mode=mode)  # type: ignore[arg-type]
+    if endpoint == "workdays":
+        employee_numbers = employee_number_map(rows)
+        return lambda csv_text: client._parse_workdays_csv(csv_text, employee_numbers)
+    parse: Callable[[str], Any] = getattr(client, f"_parse_{endpoint}_csv")
+    return parse
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, tuple):  # /users: (users, invalid employees)
+        return sum(len(part) for part in result)
+    return len(result) if isinstance(result, (list, WorktimeTable)) else 0
+
+
+def measure(endpoint: str, mode: str, csv_text: str, *, repeat: int = 3, memory: bool = True) -> Measurement | None:
+    """
+    Time `repeat` runs of one parser and, with `memory`, trace its peak memory in one more run.
+
+    Args:
+        endpoint: Key of payloads.GENERATORS
+        mode: One of MODES
+        csv_text: The response to parse
+        repeat: Number of timed runs; the fastest counts
+        memory: Also measure the peak memory with tracemalloc
+
+    Returns:
+        The measurement, or None if there is no parser for the endpoint in this mode
+    """
+    data_rows = csv_text.count("\n")
+    parse = _parser(endpoint, mode, data_rows)
+    if parse is None:
+        return None
+    timings: list[float] = []
+    rows = blocks = 0
+    for _ in range(repeat):
+        gc.collect()
+        allocated = sys.getallocatedblocks()
+        started = time.perf_counter()
+        result = parse(csv_text)
+        timings.append(time.perf_counter() - started)
+        rows, blocks = _row_count(result), sys.getallocatedblocks() - allocated
+        del result
+    if rows != data_rows:
+        raise AssertionError(f"{endpoint} ({mode}) parsed {rows} of {data_rows} rows")
+
+    peak_bytes = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            parse(csv_text)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Measurement(
+        endpoint=endpoint,
+        mode=mode,
+        rows=rows,
+        payload_bytes=len(csv_text.encode()),
+        seconds=min(timings),
+        peak_bytes=peak_bytes,
+        blocks=blocks,
+    )
+
+
+def _mib(size: int | None) -> str:
+    return "-" if size is None else f"{size / 2**20:.1f} MiB"
+
+
+def _print_header() -> None:
+    print(
+        f"{'endpoint':<9} {'mode':<6} {'rows':>9} {'payload':>11} {'time':>9} {'rows/s':>11} {'peak':>11}"
+        f" {'blocks':>11} {'blocks/row':>10}"
+    )
+
+
+def _print_row(m: Measurement) -> None:
+    blocks_per_row = m.blocks / max(m.rows, 1)
+    print(
+        f"{m.endpoint:<9} {m.mode:<6} {m.rows:>9,} {_mib(m.payload_bytes):>11} {m.seconds:>8.3f}s"
+        f" {m.rows_per_second:>11,.0f} {_mib(m.peak_bytes):>11} {m.blocks:>11,} {blocks_per_row:>10.1f}",
+        flush=True,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Generate the payloads, run every parser on them and print each measurement as it is taken."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="payload sizes")
+    parser.add_argument("--endpoints", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per parser; the fastest counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run for the peak memory")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per measurement")
+    args = parser.parse_args(argv)
+
+    if not args.json:
+        _print_header()
+    for endpoint in args.endpoints:
+        for rows in args.rows:
+            csv_text = GENERATORS[endpoint](rows)
+            for mode in args.modes:
+                measurement = measure(endpoint, mode, csv_text, repeat=args.repeat, memory=not args.no_memory)
+                if measurement is None:
+                    continue
+                if args.json:
+                    row = {**asdict(measurement), "rows_per_second": measurement.rows_per_second}
+                    print(json.dumps(row), flush=True)
+                else:
+                    _print_row(measurement)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Synthetic Timebutler API responses for benchmarks.
+
+Every generator returns a semicolon-delimited CSV body with the exact header of its endpoint and
+`rows` deterministic data rows. The values cycle through the shapes the real API returns, including
+the edge cases the parsers have to handle:
+
+- employee numbers with leading zeros ("00042") and, in /users, a few unusable ones ("", "EXT-7")
+- "unlimited" as start date of the first workday schedule of every user
+- blank (" ") and empty optional fields, comments with umlauts and quotes
+- half-day absences, worktime entries running past midnight and auto-stopped entries
+
+User IDs and employee numbers are shared between the endpoints: user `i` (0-based) has the user ID
+900000 + i and the employee number f"{i:05d}", see employee_number_map().
+"""
+
+from collections.abc import Callable
+
+ABSENCES_HEADER = (
+    "ID;From;To;Half a day;Morning;User ID;Employee number;Type;Extra vacation day;State;Substitute state;"
+    "Workdays;Hours;Medical certificate (sick leave only);Comments;User ID of the substitute"
+)
+PROJECTS_HEADER = "ID of the project;Name;State;Budget in hours;Comments;Creation date"
+SERVICES_HEADER = "ID of the service;Name;State;Billable;Comments;Creation date"
+USERS_HEADER = (
+    "User ID;Last name;First name;Employee number;E-mail address;Phone;Mobile phone;Cost center;Branch office;"
+    "Department;User type;Language;User ID list of the user's manager;User account locked;Additional Information;"
+    "Date of entry (dd/mm/yyyy);Date of separation from company (dd/mm/yyyy);Day of birth (dd/mm/yyyy)"
+)
+WORKDAYS_HEADER = (
+    "User ID;Valid from (dd/mm/yyyy);Monday working time in minutes;Tuesday working time in minutes;"
+    "Wednesday working time in minutes;Thursday working time in minutes;Friday working time in minutes;"
+    "Saturday working time in minutes;Sunday working time in minutes;ID of the holiday set"
+)
+WORKTIME_HEADER = (
+    "ID of the work time entry;User ID;Employee number;Date (dd/mm/yyyy);Start time (hh:mm);End time (hh:mm);"
+    "Working time in seconds;Pause in seconds;State;ID of the project;ID of the service;Comments;Auto stopped"
+)
+
+_FIRST_USER_ID = 900_000
+_LAST_NAMES = ("Müller", "Schmidt", "Özdemir", "Weiß", "Nguyen", "O'Brien")
+_FIRST_NAMES = ("Anna", "Bob", "Jürgen", "Zoë", "Mia", "Lars")
+_ABSENCE_TYPES = ("Vacation", "Sickness", "Home office", "Overtime reduction", "Parental leave")
+_ABSENCE_STATES = ("Approved", "Approved", "Approved", "Requested", "Rejected")
+#: A comment with the delimiter and quotes in it, quoted as CSV.
+_QUOTED_COMMENT = '"Daily; ""Ärztin"" um 9:00"'
+_WORKTIME_STATES = ("Done", "Done", "Done", "Accepted", "Requested", "In process", "Rejected")
+
+
+def _user_id(user: int) -> int:
+    return _FIRST_USER_ID + user
+
+
+def _employee_number(user: int) -> str:
+    return f"{user:05d}"
+
+
+def _day(i: int, year: int = 2026) -> str:
+    """A valid dd/mm/yyyy date, cycling through the year."""
+    return f"{1 + i % 28:02d}/{1 + i // 28 % 12:02d}/{year}"
+
+
+def employee_number_map(users: int) -> dict[int, str]:
+    """The user ID to employee number mapping of the first `users` users, as needed to parse /workdays."""
+    return {_user_id(user): _employee_number(user) for user in range(users)}
+
+
+def make_absences_csv(rows: int, users: int = 300) -> str:
+    """Build an /absences response; every 7th absence is a half day, every 5th spans a working week."""
+    lines = [ABSENCES_HEADER]
+    for i in range(rows):
+        user = i % users
+        half_day = i % 7 == 0
+        days = 1 if half_day or i % 5 else 5
+        lines.append(
+            f"{20_000_000 + i};{_day(i)};{_day(i + days - 1)};{str(half_day).lower()};{str(i % 14 == 0).lower()};"
+            f"{_user_id(user)};{_employee_number(user)};{_ABSENCE_TYPES[i % 5]};{str(i % 31 == 0).lower()};"
+            f"{_ABSENCE_STATES[i % 5]};No approval required;{0.5 if half_day else float(days)};0.0;"
+            f"{'yes' if i % 5 == 1 else ' '};{_QUOTED_COMMENT if i % 13 == 0 else ' '};"
+            f"{_user_id((user + 1) % users) if i % 3 else ''}"
+        )
+    return "\n".join(lines)
+
+
+def make_projects_csv(rows: int) -> str:
+    """Build a /projects response; names carry the padding and separators of real project names."""
+    lines = [PROJECTS_HEADER]
+    for i in range(rows):
+        lines.append(
+            f"{30_000 + i};PRJ{i:05d} | Kunde {i % 97} - Projekt {i}{'   ' if i % 4 == 0 else ''};"
+            f"{'Active' if i % 10 else 'Inactive'};{(i % 5) * 100};{'Festpreis' if i % 6 == 0 else ' '};{_day(i, 2024)}"
+        )
+    return "\n".join(lines)
+
+
+def make_services_csv(rows: int) -> str:
+    """Build a /services response."""
+    lines = [SERVICES_HEADER]
+    for i in range(rows):
+        lines.append(
+            f"{1000 + i};Service {i};{'Active' if i % 10 else 'Inactive'};{str(i % 3 != 0).lower()};"
+            f"{'Intern' if i % 4 == 0 else ' '};{_day(i, 2023)}"
+        )
+    return "\n".join(lines)
+
+
+def make_users_csv(rows: int) -> str:
+    """Build a /users response; every 50th user has an unusable employee number and is skipped by the parsers."""
+    lines = [USERS_HEADER]
+    for i in range(rows):
+        employee_number = _employee_number(i) if i % 50 != 49 else ("" if i % 100 == 49 else f"EXT-{i}")
+        managers = f"{_user_id(0)},{_user_id(1)}" if i % 9 == 0 else f"{_user_id(0)}" if i else ""
+        separated = _day(i, 2027) if i % 20 == 0 else ""
+        lines.append(
+            f"{_user_id(i)};{_LAST_NAMES[i % 6]};{_FIRST_NAMES[i % 6]};{employee_number};user{i}@example.com;"
+            f"{'+49 211 123456' if i % 2 else ''};;CC-{i % 8:02d};Düsseldorf;Engineering;"
+            f"{'Admin' if i % 40 == 0 else 'Employee'};de_DE;{managers};{str(i % 25 == 0).lower()};;"
+            f"{_day(i, 2015 + i % 10)};{separated};{_day(i, 1960 + i % 40) if i % 3 else ''}"
+        )
+    return "\n".join(lines)
+
+
+def make_workdays_csv(rows: int, schedules_per_user: int = 3) -> str:
+    """
+    Build a /workdays response with `schedules_per_user` consecutive schedules per user.
+
+    The first schedule of every user starts "unlimited"; parse it with employee_number_map() of
+    at least rows // schedules_per_user + 1 users.
+    """
+    lines = [WORKDAYS_HEADER]
+    for i in range(rows):
+        user, schedule = divmod(i, schedules_per_user)
+        friday = 480 if schedule % 2 == 0 else 240
+        lines.append(
+            f"{_user_id(user)};{'unlimited' if schedule == 0 else _day(user, 2020 + schedule)};"
+            f"480;480;480;480;{friday};0;0;{40 + user % 3 if schedule else ''}"
+        )
+    return "\n".join(lines)
+
+
+def make_worktime_csv(rows: int, users: int = 300) -> str:
+    """Build a /worktime response spread over `users` users and one year; every 23rd entry runs past midnight."""
+    lines = [WORKTIME_HEADER]
+    for i in range(rows):
+        user = i % users
+        start, end = (f"{7 + i % 4:02d}:{i % 60:02d}", f"{12 + i % 6:02d}:{(i * 7) % 60:02d}")
+        if i % 23 == 0:
+            start, end = "22:00", "02:30"
+        lines.append(
+            f"{10_000_000 + i};{_user_id(user)};{_employee_number(user)};{_day(i // users)};{start};{end};"
+            f"{18000 + i % 9000};{(i % 4) * 900 if i % 4 else ''};{_WORKTIME_STATES[i % 7]};"
+            f"{20000 + i % 40 if i % 8 else 0};{i % 5};{_QUOTED_COMMENT if i % 17 == 0 else ' '};"
+            f"{str(i % 101 == 0).lower()}"
+        )
+    return "\n".join(lines)
+
+
+#: Generator of each endpoint, called with the number of rows.
+GENERATORS: dict[str, Callable[[int], str]] = {
+    "absences": make_absences_csv,
+    "projects": make_projects_csv,
+    "services": make_services_csv,
+    "users": make_users_csv,
+    "workdays": make_workdays_csv,
+    "worktime": make_worktime_csv,
+}
@@ -0,0 +1 @@
+version = "0.1.dev1+gc29d28cfe"
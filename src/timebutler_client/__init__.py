@@ -1,7 +1,10 @@
 """Async Python client for the Timebutler API."""
 
 # pylint: disable=duplicate-code
+from timebutler_client.absence_index import AbsenceIndex
+from timebutler_client.aggregation import WorktimeAggregate, aggregate_worktime
 from timebutler_client.client import TimebutlerClient
+from timebutler_client.diff import FieldChange, RecordUpdate, SnapshotDiff, diff_snapshots
 from timebutler_client.exceptions import (
     TimebutlerAuthenticationError,
     TimebutlerError,
@@ -9,6 +12,13 @@ from timebutler_client.exceptions import (
     TimebutlerRateLimitError,
     TimebutlerServerError,
 )
+from timebutler_client.instrumentation import (
+    HistogramInstrumentation,
+    Instrumentation,
+    ParseTimings,
+    RequestTimings,
+)
+from timebutler_client.metrics import PrometheusMetrics
 from timebutler_client.models import (
     Absence,
     InvalidEmployee,
@@ -18,18 +28,45 @@ from timebutler_client.models import (
     WorkdaySchedule,
     WorkdaysResult,
     WorktimeEntry,
+    WorktimeTable,
 )
 from timebutler_client.models.absence import EmployeeNumber, EuropeanDate
 from timebutler_client.models.worktime import HHMMTime
+from timebutler_client.overlaps import (
+    AbsenceConflict,
+    WorktimeOverlap,
+    find_overlapping_worktime,
+    find_worktime_during_absences,
+)
+from timebutler_client.rate_limit import RateLimiter
+from timebutler_client.response_cache import CachedResponse, SQLiteResponseCache
+from timebutler_client.retry import RetryPolicy
+from timebutler_client.schedules import ScheduleIndex
+from timebutler_client.sync import WorktimeSync, WorktimeSyncResult, WorktimeSyncState
 
 __all__ = [
     "Absence",
+    "AbsenceConflict",
+    "AbsenceIndex",
+    "CachedResponse",
     "EmployeeNumber",
     "EuropeanDate",
+    "FieldChange",
     "HHMMTime",
+    "HistogramInstrumentation",
+    "Instrumentation",
     "InvalidEmployee",
+    "ParseTimings",
     "Project",
+    "PrometheusMetrics",
+    "RateLimiter",
+    "RecordUpdate",
+    "RequestTimings",
+    "RetryPolicy",
+    "SQLiteResponseCache",
+    "ScheduleIndex",
     "Service",
+    "SnapshotDiff",
     "TimebutlerAuthenticationError",
     "TimebutlerClient",
     "TimebutlerError",
@@ -39,5 +76,15 @@ __all__ = [
     "User",
     "WorkdaySchedule",
     "WorkdaysResult",
+    "WorktimeAggregate",
     "WorktimeEntry",
+    "WorktimeOverlap",
+    "WorktimeSync",
+    "WorktimeSyncResult",
+    "WorktimeSyncState",
+    "WorktimeTable",
+    "aggregate_worktime",
+    "diff_snapshots",
+    "find_overlapping_worktime",
+    "find_worktime_during_absences",
 ]
@@ -0,0 +1,179 @@
+"""Calendar index answering "who is absent when" without scanning all absences."""
+
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import Literal
+
+from timebutler_client.models import Absence
+
+__all__ = ["AbsenceIndex", "DayPart"]
+
+#: Half of a day; absences are indexed with half-day resolution.
+DayPart = Literal["morning", "afternoon"]
+
+
+def _slot_bits(absence: Absence) -> int:
+    """Bits of a single day covered by the absence: 0b01 morning, 0b10 afternoon."""
+    if absence.is_morning_half_day:
+        return 0b01
+    if absence.is_afternoon_half_day:
+        return 0b10
+    return 0b11
+
+
+def _repeat(bits: int, days: int) -> int:
+    """The two bits of a day repeated for `days` consecutive days (sum of bits * 4**d = bits * (4**days - 1) / 3)."""
+    return bits * (((1 << 2 * days) - 1) // 3)
+
+
+def _set_bits(bitmap: int) -> Iterator[int]:
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+class AbsenceIndex:
+    """
+    Day bitmaps of absences, for fast availability queries.
+
+    Every day is split into two slots (morning and afternoon) and every absence is expanded
+    into the slots it covers: both for full-day absences, one for half-day absences
+    (is_morning_half_day / is_afternoon_half_day). The index keeps two views of the same bits:
+
+    * per user, one int whose bit 2*d (+1) is set if the user is absent on the morning
+      (afternoon) of day d; "is X absent between A and B" is a single AND with a range mask
+    * per slot, one int with a bit per user; "who is absent between A and B" ORs the slots of
+      the range instead of looking at every absence
+
+    Absences are assigned to users by Absence.user_id.
+
+    Example:
+        index = AbsenceIndex(await client.get_absences(year=2026), states=["Approved"])
+        out_today = index.absent_users(date.today())
+        team_out = index.absent_users(date(2026, 8, 3), date(2026, 8, 7), user_ids=team)
+    """
+
+    def __init__(self, absences: Iterable[Absence], *, states: Iterable[str] | None = None) -> None:
+        """
+        Build the index.
+
+        Args:
+            absences: Absences of any number of users
+            states: Only index absences in one of these states, e.g. ["Approved"]; None for all
+        """
+        state_filter = frozenset(states) if states is not None else None
+        indexed = [a for a in absences if state_filter is None or a.state in state_filter]
+        self._first_ordinal = min((a.from_date.toordinal() for a in indexed), default=0)
+        self._last_ordinal = max((a.to_date.toordinal() for a in indexed), default=-1)
+        self._rows: dict[int, int] = {}  # user ID -> bit position in the slot bitmaps
+        self._user_ids: list[int] = []
+        self._by_user: dict[int, int] = {}
+        self._by_slot = [0] * (2 * (self._last_ordinal - self._first_ordinal + 1))
+        for absence in indexed:
+            if absence.to_date < absence.from_date:
+                continue
+            row = self._rows.get(absence.user_id)
+            if row is None:
+                row = self._rows[absence.user_id] = len(self._user_ids)
+                self._user_ids.append(absence.user_id)
+            first_slot = 2 * (absence.from_date.toordinal() - self._first_ordinal)
+            last_slot = 2 * (absence.to_date.toordinal() - self._first_ordinal) + 1
+            bits = _slot_bits(absence)
+            pattern = _repeat(bits, (last_slot - first_slot + 1) // 2) << first_slot
+            self._by_user[absence.user_id] = self._by_user.get(absence.user_id, 0) | pattern
+            user_bit = 1 << row
+            for slot in range(first_slot, last_slot + 1):
+                if bits >> (slot & 1) & 1:
+                    self._by_slot[slot] |= user_bit
+
+    def __repr__(self) -> str:
+        return f"AbsenceIndex(users={len(self._user_ids)}, days={len(self._by_slot) // 2})"
+
+    def __contains__(self, user_id: object) -> bool:
+        """Whether the user has at least one indexed absence."""
+        return user_id in self._by_user
+
+    def _slot_range(self, start: date, end: date | None, part: DayPart | None) -> tuple[int, int, int] | None:
+        """First and last slot of the range within the index, and a per-day bit filter for `part`."""
+        end = end or start
+        if end < start:
+            raise ValueError(f"End date must not be before start date, got {start} - {end}")
+        first_day = max(start.toordinal(), self._first_ordinal)
+        last_day = min(end.toordinal(), self._last_ordinal)
+        if first_day > last_day:
+            return None
+        day_filter = {None: 0b11, "morning": 0b01, "afternoon": 0b10}[part]
+        return 2 * (first_day - self._first_ordinal), 2 * (last_day - self._first_ordinal) + 1, day_filter
+
+    @staticmethod
+    def _user_mask(first_slot: int, last_slot: int, day_filter: int) -> int:
+        return _repeat(day_filter, (last_slot - first_slot + 1) // 2) << first_slot
+
+    def is_absent(self, user_id: int, start: date, end: date | None = None, *, part: DayPart | None = None) -> bool:
+        """
+        Whether a user is absent at any time between start and end.
+
+        Args:
+            user_id: The user to check
+            start: First day (inclusive)
+            end: Last day (inclusive); defaults to start
+            part: Only consider mornings or afternoons; None for whole days
+
+        Raises:
+            ValueError: If end is before start
+        """
+        slots = self._slot_range(start, end, part)
+        if slots is None:
+            return False
+        return bool(self._by_user.get(user_id, 0) & self._user_mask(*slots))
+
+    def absent_users(
+        self,
+        start: date,
+        end: date | None = None,
+        *,
+        part: DayPart | None = None,
+        user_ids: Iterable[int] | None = None,
+    ) -> list[int]:
+        """
+        Return the users that are absent at any time between start and end.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (inclusive); defaults to start
+            part: Only consider mornings or afternoons; None for whole days
+            user_ids: Only consider these users, e.g. the members of a team; None for everyone
+
+        Returns:
+            IDs of the absent users; in the order of `user_ids` if given
+
+        Raises:
+            ValueError: If end is before start
+        """
+        slots = self._slot_range(start, end, part)
+        if slots is None:
+            return []
+        if user_ids is not None:
+            mask = self._user_mask(*slots)
+            return [user_id for user_id in user_ids if self._by_user.get(user_id, 0) & mask]
+        first_slot, last_slot, day_filter = slots
+        absent = 0
+        for slot in range(first_slot, last_slot + 1):
+            if day_filter >> (slot & 1) & 1:
+                absent |= self._by_slot[slot]
+        return sorted(self._user_ids[row] for row in _set_bits(absent))
+
+    def absent_days(self, user_id: int, start: date, end: date | None = None) -> float:
+        """
+        Count the absent days of a user between start and end, with half days counting as 0.5.
+
+        Overlapping absences are only counted once. Weekends and holidays are not excluded.
+
+        Raises:
+            ValueError: If end is before start
+        """
+        slots = self._slot_range(start, end, None)
+        if slots is None:
+            return 0.0
+        return (self._by_user.get(user_id, 0) & self._user_mask(*slots)).bit_count() / 2
@@ -0,0 +1,225 @@
+"""Grouped sums of worktime by project, service, user and period."""
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, timedelta
+from operator import attrgetter
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from timebutler_client.models import Project, Service, User, WorktimeEntry, WorktimeTable
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NUMPY_AVAILABLE = False
+
+__all__ = ["GroupBy", "Period", "WorktimeAggregate", "aggregate_worktime"]
+
+#: Worktime fields that aggregate_worktime() can group by.
+GroupBy = Literal["project_id", "service_id", "user_id", "employee_number"]
+
+#: Calendar period that entries are grouped by; weeks start on Monday.
+Period = Literal["day", "week", "month"]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class WorktimeAggregate(BaseModel):
+    """
+    Summed worktime of one group.
+
+    Only the fields that were grouped by are set; the others are None.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    project_id: int | None = None
+    service_id: int | None = None
+    user_id: int | None = None
+    employee_number: str | None = None
+    period_start: date | None = Field(default=None, description="First day of the day, week or month")
+    project_name: str | None = Field(default=None, description="Joined from the projects passed in, if any")
+    service_name: str | None = Field(default=None, description="Joined from the services passed in, if any")
+    user_name: str | None = Field(default=None, description="Full name joined from the users passed in, if any")
+    working_time_seconds: int = 0
+    pause_seconds: int = 0
+    entry_count: int = 0
+
+    @property
+    def working_time(self) -> timedelta:
+        """Summed working time as timedelta."""
+        return timedelta(seconds=self.working_time_seconds)
+
+    @property
+    def pause(self) -> timedelta:
+        """Summed pauses as timedelta."""
+        return timedelta(seconds=self.pause_seconds)
+
+
+def _period_start(period: Period) -> Callable[[int], date]:
+    """Map a date ordinal to the first day of its period."""
+
+    def _day(ordinal: int) -> date:
+        return date.fromordinal(ordinal)
+
+    def _week(ordinal: int) -> date:
+        return date.fromordinal(ordinal - (ordinal - 1) % 7)  # ordinal 1 (0001-01-01) was a Monday
+
+    def _month(ordinal: int) -> date:
+        return date.fromordinal(ordinal).replace(day=1)
+
+    return {"day": _day, "week": _week, "month": _month}[period]
+
+
+def _aggregate_entries(
+    worktime: Iterable[WorktimeEntry], by: Sequence[GroupBy], period: Period | None
+) -> list[tuple[tuple[Any, ...], list[int]]]:
+    """Single pass over the entries, with one [working seconds, pause seconds, count] accumulator per group."""
+    field_key = attrgetter(*by) if by else (lambda _: ())
+    period_start = _period_start(period) if period else None
+    period_cache: dict[date, date] = {}
+    accumulators: dict[tuple[Any, ...], list[int]] = {}
+    for entry in worktime:
+        key = field_key(entry)
+        if len(by) == 1:
+            key = (key,)
+        if period_start is not None:
+            start = period_cache.get(entry.date)
+            if start is None:
+                start = period_cache[entry.date] = period_start(entry.date.toordinal())
+            key = (*key, start)
+        accumulator = accumulators.get(key)
+        if accumulator is None:
+            accumulators[key] = [entry.working_time_seconds, entry.pause_seconds, 1]
+        else:
+            accumulator[0] += entry.working_time_seconds
+            accumulator[1] += entry.pause_seconds
+            accumulator[2] += 1
+    return sorted(accumulators.items(), key=lambda item: item[0])
+
+
+def _table_column(table: WorktimeTable, field: GroupBy) -> Any:
+    if field == "employee_number":
+        return table.employee_number_codes()[0]
+    return {"project_id": table.project_ids, "service_id": table.service_ids, "user_id": table.user_ids}[field]
+
+
+def _aggregate_table(
+    table: WorktimeTable, by: Sequence[GroupBy], period: Period | None
+) -> list[tuple[tuple[Any, ...], list[int]]]:
+    """Group the table's column buffers with NumPy: factorize the key columns, then bincount the sums."""
+    columns = [
+        np.frombuffer(_table_column(table, field), dtype=np.int64 if field != "employee_number" else np.int32)
+        for field in by
+    ]
+    ordinals = np.frombuffer(table.date_ordinals, dtype=np.int32).astype(np.int64)
+    if period == "day":
+        columns.append(ordinals)
+    elif period == "week":
+        columns.append(ordinals - (ordinals - 1) % 7)
+    elif period == "month":
+        columns.append((ordinals - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64))
+    if not len(table):
+        return []
+    group = np.zeros(len(table), dtype=np.int64)
+    group_count = 1  # upper bound of the combined codes in `group`
+    for column in columns:
+        low, high = int(column.min()), int(column.max())
+        if high - low < len(table):  # dense values (IDs of a few projects, days of a year, ...) need no sort
+            codes, value_count = column.astype(np.int64) - low, high - low + 1
+        else:
+            values, codes = np.unique(column, return_inverse=True)
+            value_count = len(values)
+        if group_count * value_count >= 1 << 62:
+            _, group = np.unique(group, return_inverse=True)
+            group_count = int(group.max()) + 1
+        group = group * value_count + codes
+        group_count *= value_count
+    _, first_rows, group = np.unique(group, return_index=True, return_inverse=True)
+    working = np.bincount(group, weights=np.frombuffer(table.working_time_seconds, dtype=np.int64))
+    pauses = np.bincount(group, weights=np.frombuffer(table.pause_seconds, dtype=np.int64))
+    counts = np.bincount(group)
+
+    _, employee_numbers = table.employee_number_codes()
+    key_columns: list[list[Any]] = []
+    for field, column in zip(by, columns, strict=False):
+        firsts = column[first_rows].tolist()
+        key_columns.append([employee_numbers[code] for code in firsts] if field == "employee_number" else firsts)
+    if period is not None:
+        firsts = columns[-1][first_rows].tolist()
+        if period == "month":
+            key_columns.append([date(1970 + months // 12, months % 12 + 1, 1) for months in firsts])
+        else:
+            key_columns.append([date.fromordinal(ordinal) for ordinal in firsts])
+    keys = list(zip(*key_columns, strict=True)) if key_columns else [()]
+    groups = [
+        (key, [int(working_time), int(pause), int(count)])
+        for key, working_time, pause, count in zip(
+            keys, working.tolist(), pauses.tolist(), counts.tolist(), strict=True
+        )
+    ]
+    return sorted(groups, key=lambda item: item[0])  # employee number codes are not in value order
+
+
+def aggregate_worktime(
+    worktime: Iterable[WorktimeEntry] | WorktimeTable,
+    by: Sequence[GroupBy] = ("project_id",),
+    *,
+    period: Period | None = None,
+    projects: Iterable[Project] | None = None,
+    services: Iterable[Service] | None = None,
+    users: Iterable[User] | None = None,
+) -> list[WorktimeAggregate]:
+    """
+    Sum working time and pauses of worktime entries per group.
+
+    Entries are grouped by any combination of the fields in `by` and, optionally, by the day,
+    week or month of their date, in a single pass with one accumulator per group. For a
+    WorktimeTable, the column buffers are aggregated with NumPy if it is installed (see the
+    `numpy` extra), without materializing any entries.
+
+    Args:
+        worktime: Worktime entries from get_worktime() or get_worktime_table()
+        by: Fields to group by; empty to only group by period (or to get a single total)
+        period: Also group by "day", "week" (starting on Monday) or "month" of the entry date
+        projects: Projects to join names from, e.g. from get_projects() with a cache_ttl
+        services: Services to join names from
+        users: Users to join full names from
+
+    Returns:
+        One WorktimeAggregate per group, sorted by the grouped fields (in the order of `by`) and period
+
+    Raises:
+        ValueError: If `by` contains an unknown or duplicate field
+    """
+    unknown = set(by) - {"project_id", "service_id", "user_id", "employee_number"}
+    if unknown or len(set(by)) != len(by):
+        raise ValueError(
+            f"Cannot group by {list(by)}; use distinct fields of project_id, service_id, user_id, employee_number"
+        )
+    if isinstance(worktime, WorktimeTable) and _NUMPY_AVAILABLE:
+        groups = _aggregate_table(worktime, by, period)
+    else:
+        groups = _aggregate_entries(worktime, by, period)
+
+    project_names = {project.id: project.name_stripped for project in projects} if projects is not None else None
+    service_names = {service.id: service.name_stripped for service in services} if services is not None else None
+    user_names = {user.user_id: user.full_name for user in users} if users is not None else None
+    result: list[WorktimeAggregate] = []
+    for key, (working_time, pause, count) in groups:
+        fields: dict[str, Any] = dict.fromkeys(WorktimeAggregate.model_fields)  # model_construct() is slow for defaults
+        fields.update(zip(by, key, strict=False))
+        if period is not None:
+            fields["period_start"] = key[-1]
+        if project_names is not None and "project_id" in fields:
+            fields["project_name"] = project_names.get(fields["project_id"])
+        if service_names is not None and "service_id" in fields:
+            fields["service_name"] = service_names.get(fields["service_id"])
+        if user_names is not None and "user_id" in fields:
+            fields["user_name"] = user_names.get(fields["user_id"])
+        fields.update(working_time_seconds=working_time, pause_seconds=pause, entry_count=count)
+        result.append(WorktimeAggregate.model_construct(**fields))  # the values come from validated entries already
+    return result
@@ -0,0 +1,601 @@
+"""
+Apache Arrow / Parquet export of Timebutler responses (requires the `arrow` extra).
+
+The CSV responses are read by pyarrow and converted column by column into typed
+pyarrow.Tables, without building Pydantic models or Python dicts in between. Columns are
+named like the model fields and follow the same semantics: employee numbers are strings
+with leading zeros, dates are date32, times time32[ms], optional numbers default to 0 and
+empty comments are null.
+
+    from timebutler_client import arrow
+
+    table = await arrow.get_worktime(client, year=2026, month=1)
+    arrow.write_parquet(table, "worktime-2026-01.parquet")
+"""
+
+# pylint: disable=protected-access  # the fetch functions reuse the request pipeline of TimebutlerClient
+
+import asyncio
+import copy
+import csv
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import StringIO
+from os import PathLike
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "timebutler_client.arrow requires pyarrow; install it with: pip install 'timebutler-client[arrow]'"
+    ) from e
+
+from timebutler_client.client import TimebutlerClient
+from timebutler_client.exceptions import TimebutlerParseError
+from timebutler_client.models import InvalidEmployee
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+__all__ = [
+    "ABSENCES_SCHEMA",
+    "PROJECTS_SCHEMA",
+    "SERVICES_SCHEMA",
+    "USERS_SCHEMA",
+    "WORKDAYS_SCHEMA",
+    "WORKTIME_SCHEMA",
+    "absences_from_csv",
+    "get_absences",
+    "get_projects",
+    "get_services",
+    "get_users",
+    "get_workdays",
+    "get_worktime",
+    "projects_from_csv",
+    "services_from_csv",
+    "users_from_csv",
+    "workdays_from_csv",
+    "worktime_from_csv",
+    "write_parquet",
+]
+
+_EMPLOYEE_NUMBER_REGEX = r"^\d+$"
+_USER_TYPES = ["Employee", "Manager", "Admin"]
+#: Absence.workdays and Absence.hours are Decimals; half days and quarter hours need a few decimal places.
+_DECIMAL = pa.decimal128(18, 6)
+
+ABSENCES_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("from_date", pa.date32()),
+        ("to_date", pa.date32()),
+        ("employee_number", pa.string()),
+        ("user_id", pa.int64()),
+        ("half_day", pa.bool_()),
+        ("morning", pa.bool_()),
+        ("absence_type", pa.string()),
+        ("extra_vacation", pa.bool_()),
+        ("state", pa.string()),
+        ("substitute_state", pa.string()),
+        ("workdays", _DECIMAL),
+        ("hours", _DECIMAL),
+        ("medical_certificate", pa.string()),
+        ("comments", pa.string()),
+        ("substitute_user_id", pa.int64()),
+    ]
+)
+
+PROJECTS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("state", pa.string()),
+        ("budget_hours", pa.int64()),
+        ("comments", pa.string()),
+        ("creation_date", pa.date32()),
+    ]
+)
+
+SERVICES_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("state", pa.string()),
+        ("billable", pa.bool_()),
+        ("comments", pa.string()),
+        ("creation_date", pa.date32()),
+    ]
+)
+
+USERS_SCHEMA = pa.schema(
+    [
+        ("user_id", pa.int64()),
+        ("last_name", pa.string()),
+        ("first_name", pa.string()),
+        ("employee_number", pa.string()),
+        ("email", pa.string()),
+        ("phone", pa.string()),
+        ("mobile_phone", pa.string()),
+        ("cost_center", pa.string()),
+        ("branch_office", pa.string()),
+        ("department", pa.string()),
+        ("user_type", pa.string()),
+        ("language", pa.string()),
+        ("manager_user_ids", pa.list_(pa.int64())),
+        ("account_locked", pa.bool_()),
+        ("additional_information", pa.string()),
+        ("date_of_entry", pa.date32()),
+        ("date_of_separation", pa.date32()),
+        ("date_of_birth", pa.date32()),
+    ]
+)
+
+WORKDAYS_SCHEMA = pa.schema(
+    [
+        ("user_id", pa.int64()),
+        ("valid_from", pa.date32()),
+        ("employee_number", pa.string()),
+        ("monday_minutes", pa.int64()),
+        ("tuesday_minutes", pa.int64()),
+        ("wednesday_minutes", pa.int64()),
+        ("thursday_minutes", pa.int64()),
+        ("friday_minutes", pa.int64()),
+        ("saturday_minutes", pa.int64()),
+        ("sunday_minutes", pa.int64()),
+        ("holiday_set_id", pa.int64()),
+    ]
+)
+
+WORKTIME_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("employee_number", pa.string()),
+        ("date", pa.date32()),
+        ("start_time", pa.time32("ms")),
+        ("end_time", pa.time32("ms")),
+        ("working_time_seconds", pa.int64()),
+        ("pause_seconds", pa.int64()),
+        ("state", pa.string()),
+        ("project_id", pa.int64()),
+        ("service_id", pa.int64()),
+        ("comments", pa.string()),
+        ("auto_stopped", pa.bool_()),
+    ]
+)
+
+
+@contextmanager
+def _parse_errors() -> Iterator[None]:
+    """Turn conversion errors (missing columns, malformed values) into TimebutlerParseError."""
+    try:
+        yield
+    except (KeyError, ValueError, pa.ArrowException) as e:
+        raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
+
+
+class _CsvColumns:
+    """The columns of a CSV response, read by pyarrow as strings (empty cells are null)."""
+
+    def __init__(self, csv_text: str) -> None:
+        header = csv_text.split("\n", 1)[0].rstrip("\r").split(";")
+        ragged_rows: list[int] = []
+
+        def _on_invalid_row(row: Any) -> str:
+            ragged_rows.append(row.number)
+            return "skip"
+
+        self._table = pa_csv.read_csv(
+            # pyarrow cannot read a header without a line break (an empty result)
+            pa.py_buffer(csv_text.encode() if csv_text.endswith("\n") else f"{csv_text}\n".encode()),
+            parse_options=pa_csv.ParseOptions(delimiter=";", invalid_row_handler=_on_invalid_row),
+            convert_options=pa_csv.ConvertOptions(
+                # every column is a string first, so that "00123" keeps its leading zeros
+                column_types=dict.fromkeys(header, pa.string()),
+                null_values=[""],
+                strings_can_be_null=True,
+            ),
+        )
+        if ragged_rows:
+            # Timebutler omits trailing empty cells in some rows, which pyarrow cannot read; pad them like DictReader
+            self._table = self._read_padded(csv_text)
+        self.num_rows: int = self._table.num_rows
+
+    @staticmethod
+    def _read_padded(csv_text: str) -> Any:
+        reader = csv.reader(StringIO(csv_text), delimiter=";")
+        header = next(reader)
+        rows = [(row + [""] * (len(header) - len(row)))[: len(header)] for row in reader if row]
+        columns = zip(*rows, strict=True) if rows else ([] for _ in header)
+        return pa.table(
+            {
+                name: pa.array([value or None for value in values], pa.string())
+                for name, values in zip(header, columns, strict=True)
+            }
+        )
+
+    def required(self, name: str) -> Any:
+        """Column that must be present (raises KeyError otherwise)."""
+        if name not in self._table.column_names:
+            raise KeyError(name)
+        return self._table[name]
+
+    def optional(self, name: str) -> Any:
+        """Column that may be missing; a missing column reads as all null."""
+        if name not in self._table.column_names:
+            return pa.nulls(self.num_rows, pa.string())
+        return self._table[name]
+
+    def filter(self, mask: Any) -> "_CsvColumns":
+        """The columns of only the rows where `mask` is true."""
+        filtered = copy.copy(self)
+        filtered._table = self._table.filter(mask)
+        filtered.num_rows = filtered._table.num_rows
+        return filtered
+
+
+def _has_header(csv_text: str) -> bool:
+    return bool(csv_text.strip())
+
+
+def _int(column: Any, name: str, default: int | None = None) -> Any:
+    """Cast to int64; empty cells become `default`, or are an error if there is none."""
+    values = pc.cast(column, pa.int64())
+    if default is not None:
+        return pc.fill_null(values, default)
+    if values.null_count:
+        raise ValueError(f"Column {name!r} contains empty values")
+    return values
+
+
+def _bool(column: Any) -> Any:
+    """'true' (any case) is True, everything else (including empty) is False."""
+    return pc.fill_null(pc.equal(pc.utf8_lower(column), "true"), False)
+
+
+def _text(column: Any) -> Any:
+    """Raw string column; empty cells are empty strings."""
+    return pc.fill_null(column, "")
+
+
+def _stripped(column: Any) -> Any:
+    """Whitespace-stripped string column; empty cells are empty strings."""
+    return pc.fill_null(pc.utf8_trim_whitespace(column), "")
+
+
+def _stripped_or_null(column: Any) -> Any:
+    """Whitespace-stripped string column; empty and whitespace-only cells are null."""
+    stripped = pc.utf8_trim_whitespace(column)
+    return pc.if_else(pc.equal(stripped, ""), pa.scalar(None, pa.string()), stripped)
+
+
+def _date(column: Any, name: str, *, required: bool = True) -> Any:
+    """Parse dd/mm/yyyy strings into date32; empty cells are null or, if `required`, an error."""
+    if required and column.null_count:
+        raise ValueError(f"Column {name!r} contains empty values")
+    stripped = _stripped_or_null(column)
+    return pc.cast(pc.strptime(stripped, format="%d/%m/%Y", unit="s"), pa.date32())
+
+
+def _time(column: Any, name: str) -> Any:
+    """Parse HH:MM strings into time32[ms]."""
+    if column.null_count:
+        raise ValueError(f"Column {name!r} contains empty values")
+    # parsed as a timestamp on 1900-01-01; the cast keeps the time of day
+    return pc.cast(pc.strptime(column, format="%H:%M", unit="s"), pa.time32("ms"))
+
+
+def _decimal(column: Any) -> Any:
+    """Cast to a decimal; empty cells are 0."""
+    return pc.fill_null(pc.cast(column, _DECIMAL), pa.scalar(0, _DECIMAL))
+
+
+def _check_employee_numbers(column: Any) -> None:
+    """Raise ValueError unless every employee number consists of digits only, like the EmployeeNumber type."""
+    invalid = pc.invert(pc.fill_null(pc.match_substring_regex(column, _EMPLOYEE_NUMBER_REGEX), False))
+    if pc.any(invalid).as_py():
+        first_invalid = column.filter(invalid)[0].as_py()
+        raise ValueError(f"Employee number must consist of digits only, got: {first_invalid!r}")
+
+
+def worktime_from_csv(csv_text: str) -> Any:
+    """
+    Parse a /worktime response into a pyarrow.Table with WORKTIME_SCHEMA.
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed
+    """
+    if not _has_header(csv_text):
+        return WORKTIME_SCHEMA.empty_table()
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        employee_numbers = columns.required("Employee number")
+        _check_employee_numbers(employee_numbers)
+        return pa.Table.from_arrays(
+            [
+                _int(columns.required("ID of the work time entry"), "ID of the work time entry"),
+                _int(columns.required("User ID"), "User ID"),
+                employee_numbers,
+                _date(columns.required("Date (dd/mm/yyyy)"), "Date (dd/mm/yyyy)"),
+                _time(columns.required("Start time (hh:mm)"), "Start time (hh:mm)"),
+                _time(columns.required("End time (hh:mm)"), "End time (hh:mm)"),
+                _int(columns.required("Working time in seconds"), "Working time in seconds"),
+                _int(columns.optional("Pause in seconds"), "Pause in seconds", default=0),
+                _text(columns.required("State")),
+                _int(columns.optional("ID of the project"), "ID of the project", default=0),
+                _int(columns.optional("ID of the service"), "ID of the service", default=0),
+                _stripped_or_null(columns.optional("Comments")),
+                _bool(columns.optional("Auto stopped")),
+            ],
+            schema=WORKTIME_SCHEMA,
+        )
+
+
+def absences_from_csv(csv_text: str) -> Any:
+    """
+    Parse an /absences response into a pyarrow.Table with ABSENCES_SCHEMA.
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed
+    """
+    if not _has_header(csv_text):
+        return ABSENCES_SCHEMA.empty_table()
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        employee_numbers = columns.required("Employee number")
+        _check_employee_numbers(employee_numbers)
+        return pa.Table.from_arrays(
+            [
+                _int(columns.required("ID"), "ID"),
+                _date(columns.required("From"), "From"),
+                _date(columns.required("To"), "To"),
+                employee_numbers,
+                _int(columns.optional("User ID"), "User ID", default=0),
+                _bool(columns.optional("Half a day")),
+                _bool(columns.optional("Morning")),
+                _text(columns.optional("Type")),
+                _bool(columns.optional("Extra vacation day")),
+                _text(columns.optional("State")),
+                _text(columns.optional("Substitute state")),
+                _decimal(columns.optional("Workdays")),
+                _decimal(columns.optional("Hours")),
+                _stripped_or_null(columns.optional("Medical certificate (sick leave only)")),
+                _stripped_or_null(columns.optional("Comments")),
+                _int(columns.optional("User ID of the substitute"), "User ID of the substitute", default=0),
+            ],
+            schema=ABSENCES_SCHEMA,
+        )
+
+
+def projects_from_csv(csv_text: str) -> Any:
+    """
+    Parse a /projects response into a pyarrow.Table with PROJECTS_SCHEMA.
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed
+    """
+    if not _has_header(csv_text):
+        return PROJECTS_SCHEMA.empty_table()
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        return pa.Table.from_arrays(
+            [
+                _int(columns.required("ID of the project"), "ID of the project"),
+                _text(columns.required("Name")),
+                _text(columns.required("State")),
+                _int(columns.optional("Budget in hours"), "Budget in hours", default=0),
+                _stripped_or_null(columns.optional("Comments")),
+                _date(columns.required("Creation date"), "Creation date"),
+            ],
+            schema=PROJECTS_SCHEMA,
+        )
+
+
+def services_from_csv(csv_text: str) -> Any:
+    """
+    Parse a /services response into a pyarrow.Table with SERVICES_SCHEMA.
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed
+    """
+    if not _has_header(csv_text):
+        return SERVICES_SCHEMA.empty_table()
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        return pa.Table.from_arrays(
+            [
+                _int(columns.required("ID of the service"), "ID of the service"),
+                _text(columns.required("Name")),
+                _text(columns.required("State")),
+                _bool(columns.optional("Billable")),
+                _stripped_or_null(columns.optional("Comments")),
+                _date(columns.required("Creation date"), "Creation date"),
+            ],
+            schema=SERVICES_SCHEMA,
+        )
+
+
+def users_from_csv(csv_text: str) -> tuple[Any, list[InvalidEmployee]]:
+    """
+    Parse a /users response into a pyarrow.Table with USERS_SCHEMA.
+
+    Like TimebutlerClient.get_users(), users with missing or non-numeric employee
+    numbers are not part of the table.
+
+    Returns:
+        Tuple of the users table and the users that were left out as InvalidEmployee objects
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed
+    """
+    if not _has_header(csv_text):
+        return USERS_SCHEMA.empty_table(), []
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        employee_numbers = _stripped(columns.optional("Employee number"))
+        valid = pc.match_substring_regex(employee_numbers, _EMPLOYEE_NUMBER_REGEX)
+        invalid_employees = [
+            InvalidEmployee(
+                user_id=int(row["user_id"]) if row["user_id"].isdigit() else None,
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                raw_employee_number=row["employee_number"],
+            )
+            for row in pa.table(
+                {
+                    "user_id": _stripped(columns.optional("User ID")),
+                    "first_name": _stripped(columns.optional("First name")),
+                    "last_name": _stripped(columns.optional("Last name")),
+                    "employee_number": employee_numbers,
+                }
+            )
+            .filter(pc.invert(valid))
+            .to_pylist()
+        ]
+        # like the strict parser, convert the other fields of valid users only
+        columns, employee_numbers = columns.filter(valid), employee_numbers.filter(valid)
+        user_types = _stripped_or_null(columns.optional("User type"))
+        unknown_user_types = pc.invert(pc.fill_null(pc.is_in(user_types, pa.array(_USER_TYPES)), True))
+        if pc.any(unknown_user_types).as_py():
+            raise ValueError(f"Unknown user type: {user_types.filter(unknown_user_types)[0].as_py()!r}")
+        manager_user_ids = pa.array(
+            [
+                [int(uid) for uid in value.split(",") if uid.strip()] if value else []
+                for value in columns.optional("User ID list of the user's manager").to_pylist()
+            ],
+            pa.list_(pa.int64()),
+        )
+        table = pa.Table.from_arrays(
+            [
+                pc.cast(columns.required("User ID"), pa.int64()),
+                _text(columns.required("Last name")),
+                _text(columns.required("First name")),
+                employee_numbers,
+                _stripped(columns.optional("E-mail address")),
+                _stripped(columns.optional("Phone")),
+                _stripped(columns.optional("Mobile phone")),
+                _stripped(columns.optional("Cost center")),
+                _stripped(columns.optional("Branch office")),
+                _stripped(columns.optional("Department")),
+                user_types,
+                _stripped(columns.optional("Language")),
+                manager_user_ids,
+                _bool(columns.optional("User account locked")),
+                _stripped(columns.optional("Additional Information")),
+                _date(columns.optional("Date of entry (dd/mm/yyyy)"), "", required=False),
+                _date(columns.optional("Date of separation from company (dd/mm/yyyy)"), "", required=False),
+                _date(columns.optional("Day of birth (dd/mm/yyyy)"), "", required=False),
+            ],
+            schema=USERS_SCHEMA,
+        )
+        return table, invalid_employees
+
+
+def workdays_from_csv(csv_text: str, users: Any, invalid_employees: list[InvalidEmployee] | None = None) -> Any:
+    """
+    Parse a /workdays response into a pyarrow.Table with WORKDAYS_SCHEMA.
+
+    Employee numbers are joined from the users table returned by users_from_csv().
+    Schedules of the users in `invalid_employees` are left out.
+
+    Raises:
+        TimebutlerParseError: If the response cannot be parsed or a schedule belongs to an unknown user
+    """
+    if not _has_header(csv_text):
+        return WORKDAYS_SCHEMA.empty_table()
+    with _parse_errors():
+        columns = _CsvColumns(csv_text)
+        user_ids = _int(columns.required("User ID"), "User ID")
+        skip_user_ids = [inv.user_id for inv in invalid_employees or [] if inv.user_id is not None]
+        keep = pc.invert(pc.is_in(user_ids, pa.array(skip_user_ids, pa.int64())))
+        user_positions = pc.index_in(user_ids, users["user_id"])
+        unknown = pc.and_(keep, pc.is_null(user_positions))
+        if pc.any(unknown).as_py():
+            raise TimebutlerParseError(
+                f"No user found for user ID {user_ids.filter(unknown)[0].as_py()} in users response"
+            )
+        valid_from = columns.required("Valid from (dd/mm/yyyy)")
+        unlimited = pc.equal(pc.utf8_lower(pc.utf8_trim_whitespace(valid_from)), "unlimited")
+        valid_from = _date(
+            pc.if_else(unlimited, UNLIMITED_DATE.strftime("%d/%m/%Y"), valid_from), "Valid from (dd/mm/yyyy)"
+        )
+        table = pa.Table.from_arrays(
+            [
+                user_ids,
+                valid_from,
+                users["employee_number"].take(user_positions),
+                *(
+                    _int(columns.optional(f"{day} working time in minutes"), day, default=0)
+                    for day in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+                ),
+                _int(columns.optional("ID of the holiday set"), "ID of the holiday set", default=0),
+            ],
+            schema=WORKDAYS_SCHEMA,
+        )
+        return table.filter(keep)
+
+
+def write_parquet(table: Any, where: str | PathLike[str], **kwargs: Any) -> None:
+    """
+    Write a table to a Parquet file.
+
+    Args:
+        table: pyarrow.Table, e.g. returned by get_worktime()
+        where: Path of the Parquet file
+        **kwargs: Passed on to pyarrow.parquet.write_table (e.g. compression="zstd")
+    """
+    pq.write_table(table, where, **kwargs)
+
+
+async def get_worktime(
+    client: TimebutlerClient,
+    year: int | None = None,
+    month: int | None = None,
+    user_id: int | None = None,
+) -> Any:
+    """
+    Fetch worktime entries as a pyarrow.Table; see TimebutlerClient.get_worktime().
+
+    Raises:
+        ValueError: If month is outside 1-12 range
+        TimebutlerParseError: If response cannot be parsed
+    """
+    params = TimebutlerClient._worktime_params(year, month, user_id)
+    return worktime_from_csv(await client._fetch_csv("worktime", params))
+
+
+async def get_absences(client: TimebutlerClient, year: int) -> Any:
+    """Fetch absences for a given year as a pyarrow.Table; see TimebutlerClient.get_absences()."""
+    client._check_year(year)
+    return absences_from_csv(await client._fetch_csv("absences", {"year": str(year)}))
+
+
+async def get_projects(client: TimebutlerClient) -> Any:
+    """Fetch all projects as a pyarrow.Table; see TimebutlerClient.get_projects()."""
+    return projects_from_csv(await client._fetch_csv("projects"))
+
+
+async def get_services(client: TimebutlerClient) -> Any:
+    """Fetch all services as a pyarrow.Table; see TimebutlerClient.get_services()."""
+    return services_from_csv(await client._fetch_csv("services"))
+
+
+async def get_users(client: TimebutlerClient) -> Any:
+    """Fetch all users as a pyarrow.Table; users with invalid employee numbers are left out and logged."""
+    users, invalid_employees = users_from_csv(await client._fetch_csv("users"))
+    client._log_invalid_employees(invalid_employees)
+    return users
+
+
+async def get_workdays(client: TimebutlerClient) -> Any:
+    """
+    Fetch workday schedules as a pyarrow.Table, enriched with employee numbers; see TimebutlerClient.get_workdays().
+
+    Schedules of users with invalid employee numbers are left out and logged.
+    """
+    workdays_csv, users_csv = await asyncio.gather(client._fetch_csv("workdays"), client._fetch_csv("users"))
+    users, invalid_employees = users_from_csv(users_csv)
+    client._log_invalid_employees(invalid_employees)
+    return workdays_from_csv(workdays_csv, users, invalid_employees)
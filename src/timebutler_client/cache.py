@@ -0,0 +1,153 @@
+"""In-memory caching and request coalescing for Timebutler responses."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Literal, TypeVar, cast
+
+__all__ = ["CachedEndpoint", "SingleFlight", "TTLCache"]
+
+_T = TypeVar("_T")
+
+#: Endpoints whose parsed responses TimebutlerClient can cache (reference data that rarely changes).
+CachedEndpoint = Literal["projects", "services", "users"]
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    While a call for a key is in flight, further calls with that key wait for it and get its
+    result (or its error) instead of starting their own. The call runs in its own task, so a
+    caller that is cancelled does not cancel it for the others. Nothing is kept once the call
+    has finished: the next call with the key starts a new execution.
+
+    Example:
+        flights = SingleFlight()
+        results = await asyncio.gather(*(flights.do("projects", fetch_projects) for _ in range(10)))
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(in_flight={len(self._in_flight)})"
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a call for the key is in flight."""
+        return key in self._in_flight
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run `call`, or wait for the call already in flight for `key`.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            call: Coroutine function to run if no call for the key is in flight
+
+        Returns:
+            The result of the (shared) call
+
+        Raises:
+            Whatever the shared call raises
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return cast(_T, await asyncio.shield(task))
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if not task.cancelled():
+            task.exception()  # marks the error as retrieved, even if every caller was cancelled
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def forget(self, key: Hashable | None = None) -> None:
+        """
+        Let the next call for `key` (or for any key) start a new execution.
+
+        Calls already waiting for the forgotten execution still get its result.
+        """
+        if key is None:
+            self._in_flight.clear()
+        else:
+            self._in_flight.pop(key, None)
+
+
+class TTLCache:
+    """
+    Async-safe cache whose entries expire a fixed time after they were loaded.
+
+    Loading is single-flight (see SingleFlight): while a value is being loaded, concurrent
+    callers asking for the same key wait for that load instead of starting their own.
+    Failed loads are not cached.
+
+    Example:
+        cache = TTLCache()
+        projects = await cache.get_or_load("projects", 3600, fetch_projects)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            clock: Source of the current time in seconds (monotonic by default)
+        """
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._flights = SingleFlight()
+        self._generation = 0  # bumped by every invalidation, so loads started before it are not stored
+
+    def __repr__(self) -> str:
+        return f"TTLCache(entries={len(self._entries)}, {self._flights!r})"
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a fresh (not yet expired) value is cached for the key."""
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    async def get_or_load(self, key: Hashable, ttl: float, load: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Return the cached value for `key`, loading (and caching it for `ttl` seconds) if missing or expired.
+
+        Args:
+            key: Cache key
+            ttl: Seconds the loaded value stays valid
+            load: Coroutine function producing the value; only called if no fresh value and no load is in flight
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            Whatever `load` raises; the error is shared by all callers waiting for that load
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            return cast(_T, entry[1])
+
+        generation = self._generation
+
+        async def _load_and_store() -> _T:
+            value = await load()
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + ttl, value)
+            return value
+
+        return await self._flights.do(key, _load_and_store)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Drop the cached value for `key`, or all values if no key is given.
+
+        A load that is in flight for an invalidated key still completes for its callers,
+        but its result is not cached.
+        """
+        self._generation += 1
+        self._flights.forget(key)
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -3,19 +3,38 @@
 import asyncio
 import csv
 import logging
+import math
 import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable, Mapping
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+from datetime import UTC, date, datetime
 from decimal import Decimal
+from email.utils import parsedate_to_datetime
+from functools import partial
 from io import StringIO
+from types import TracebackType
+from typing import TYPE_CHECKING, Literal, Self, TypeVar
 
 import aiohttp
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
 
+from timebutler_client import fast_parsing
+from timebutler_client.cache import CachedEndpoint, SingleFlight, TTLCache
 from timebutler_client.exceptions import (
     TimebutlerAuthenticationError,
     TimebutlerParseError,
     TimebutlerRateLimitError,
     TimebutlerServerError,
 )
+from timebutler_client.instrumentation import (
+    Instrumentation,
+    ParseTimings,
+    RequestTimings,
+    RequestTrace,
+    _row_count,
+    create_trace_config,
+)
 from timebutler_client.models import (
     Absence,
     InvalidEmployee,
@@ -25,12 +44,79 @@ from timebutler_client.models import (
     WorkdaySchedule,
     WorkdaysResult,
     WorktimeEntry,
+    WorktimeTable,
 )
+from timebutler_client.rate_limit import RateLimiter
+from timebutler_client.response_cache import SQLiteResponseCache
+from timebutler_client.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
+    from timebutler_client.tracing import ClientTracing
 
 logger = logging.getLogger(__name__)
+_T = TypeVar("_T")
 _EMPLOYEE_NUMBER_PATTERN = re.compile(r"^\d+$")
 
 
+def _parse_retry_after(value: str | None) -> int | None:
+    """
+    The Retry-After header in seconds, given as delta-seconds or as an HTTP-date.
+
+    A date in the past means 0; a header that is neither (or missing) means None.
+    """
+    if not value:
+        return None
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)  # an HTTP-date is always in GMT
+    return max(math.ceil((retry_at - datetime.now(UTC)).total_seconds()), 0)
+
+
+def _months_between(start: date, end: date) -> list[tuple[int, int]]:
+    """All (year, month) pairs touched by the date range, in chronological order."""
+    months: list[tuple[int, int]] = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+async def _iter_csv_rows(response: aiohttp.ClientResponse) -> AsyncIterator[dict[str, str]]:
+    """
+    Read a semicolon-delimited CSV response line by line and yield one dict per row.
+
+    Rows are keyed by the header line, like csv.DictReader. A quoted field may span
+    several lines; lines are buffered until all quotes are balanced.
+    """
+    encoding = response.charset or "utf-8"
+    fieldnames: list[str] | None = None
+    pending = ""
+    async for raw_line in response.content:
+        pending += raw_line.decode(encoding)
+        if pending.count('"') % 2:
+            continue  # a quoted field continues on the next line
+        values = next(csv.reader([pending], delimiter=";"), [])
+        pending = ""
+        if not values:
+            continue
+        if fieldnames is None:
+            fieldnames = values
+            continue
+        yield dict(zip(fieldnames, values, strict=False))
+    if pending.strip():
+        raise TimebutlerParseError("Failed to parse API response: unterminated quoted field")
+
+
 class TimebutlerClient(BaseModel):
     """
     Async client for the Timebutler API.
@@ -38,24 +124,534 @@ class TimebutlerClient(BaseModel):
     Example:
         client = TimebutlerClient(api_key="your-api-key")
         absences = await client.get_absences(year=2026)
+
+    Used as an async context manager, the client keeps one pooled session
+    (and thus TCP/TLS connections) open for all calls made inside the block:
+
+        async with TimebutlerClient(api_key="your-api-key") as client:
+            absences = await client.get_absences(year=2026)
+            users = await client.get_users()
+
+    Outside of a context manager (and without an injected session) every call
+    opens and closes its own session.
+
+    Pass a RetryPolicy to retry rate-limited (429) and failed (5xx) requests:
+
+        client = TimebutlerClient(api_key="your-api-key", retry_policy=RetryPolicy(max_attempts=5))
+
+    A RateLimiter and max_concurrency throttle all requests of the client, which keeps
+    fan-outs via asyncio.gather below the API's rate limit:
+
+        client = TimebutlerClient(api_key="your-api-key", rate_limiter=RateLimiter(rate=5, burst=10), max_concurrency=8)
+
+    Projects, services and users rarely change; cache_ttl keeps their parsed responses for
+    the given number of seconds, and concurrent calls share a single request:
+
+        client = TimebutlerClient(api_key="your-api-key", cache_ttl={"projects": 3600, "users": 600})
+
+    Identical get_* calls that run at the same time share one request and one parsed
+    result (set coalesce_requests=False to send every call on its own).
+
+    A SQLiteResponseCache keeps raw responses on disk across restarts:
+
+        client = TimebutlerClient(api_key="your-api-key", response_cache=SQLiteResponseCache("cache.sqlite3"))
+
+    An Instrumentation receives the connect, download and parse timings of every call:
+
+        client = TimebutlerClient(api_key="your-api-key", instrumentation=HistogramInstrumentation())
+
+    An OpenTelemetry tracer gets a span per call, with child spans for its HTTP attempts and parses:
+
+        client = TimebutlerClient(api_key="your-api-key", tracer=trace.get_tracer("timebutler_client"))
     """
 
     base_url: str = "https://app.timebutler.com/api/v1"
     timeout: float = 30.0
+    connection_limit: int = 100
+    connection_limit_per_host: int = 0
+    dns_cache_ttl: int | None = 300
+    keepalive_timeout: float = 15.0
+    retry_policy: RetryPolicy | None = None
+    parse_mode: Literal["strict", "fast"] = "strict"
+    cache_ttl: dict[CachedEndpoint, float] = Field(default_factory=dict)
+    coalesce_requests: bool = True
     _api_key: str = PrivateAttr()
+    _session: aiohttp.ClientSession | None = PrivateAttr(default=None)
+    _owns_session: bool = PrivateAttr(default=False)
+    _rate_limiter: RateLimiter | None = PrivateAttr(default=None)
+    _concurrency: asyncio.Semaphore | None = PrivateAttr(default=None)
+    _cache: TTLCache = PrivateAttr(default_factory=TTLCache)
+    _flights: SingleFlight = PrivateAttr(default_factory=SingleFlight)
+    _response_cache: SQLiteResponseCache | None = PrivateAttr(default=None)
+    _instrumentation: Instrumentation | None = PrivateAttr(default=None)
+    _tracing: "ClientTracing | None" = PrivateAttr(default=None)
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://app.timebutler.com/api/v1",
         timeout: float = 30.0,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        dns_cache_ttl: int | None = 300,
+        keepalive_timeout: float = 15.0,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_concurrency: int | None = None,
+        parse_mode: Literal["strict", "fast"] = "strict",
+        cache_ttl: dict[CachedEndpoint, float] | None = None,
+        coalesce_requests: bool = True,
+        response_cache: SQLiteResponseCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        tracer: "Tracer | None" = None,
     ) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+        """
+        Create a new client.
+
+        Args:
+            api_key: Timebutler API key (admin key)
+            base_url: Base URL of the Timebutler API
+            timeout: Total timeout per request in seconds
+            session: Existing aiohttp session to use for all requests. The client never closes
+                an injected session; its owner is responsible for that.
+            connection_limit: Maximum number of simultaneous connections in the pool (0 = unlimited)
+            connection_limit_per_host: Maximum number of simultaneous connections per host (0 = unlimited)
+            dns_cache_ttl: Seconds to cache DNS lookups, None to cache forever
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            retry_policy: How to retry 429/5xx responses, None to never retry
+            rate_limiter: Token bucket that every request (including retries) has to pass, None for no limit
+            max_concurrency: Maximum number of requests in flight at the same time, None for no limit
+            parse_mode: "strict" validates every field of every row via Pydantic. "fast" trusts the API
+                and builds the models without validation, which is faster for large responses
+                (see timebutler_client.fast_parsing and benchmarks/parse_modes.py). Streaming iter_*
+                methods always parse strictly.
+            cache_ttl: Seconds to cache the responses of get_projects(), get_services() and get_users(),
+                keyed by endpoint ("projects", "services", "users"); endpoints not listed are not cached.
+                Streaming iter_* methods always fetch.
+            coalesce_requests: Let concurrent identical calls (same endpoint and parameters) share one
+                request and its parsed result. Streaming iter_* methods are never coalesced.
+            response_cache: Persistent store of raw responses that fresh responses are served from,
+                None to always fetch. Streaming iter_* methods bypass it.
+            instrumentation: Receives the timings of every request and parse (see
+                timebutler_client.instrumentation), None to not measure them. Streaming iter_* methods
+                report nothing.
+            tracer: OpenTelemetry tracer to open a span per get_* call, HTTP attempt and parse with
+                (see timebutler_client.tracing; requires the `opentelemetry` extra), None to open no
+                spans. Streaming iter_* methods are not traced.
+        """
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            connection_limit=connection_limit,
+            connection_limit_per_host=connection_limit_per_host,
+            dns_cache_ttl=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+            retry_policy=retry_policy,
+            parse_mode=parse_mode,
+            cache_ttl=cache_ttl or {},
+            coalesce_requests=coalesce_requests,
+        )
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self._api_key = api_key
+        self._session = session
+        self._rate_limiter = rate_limiter
+        self._concurrency = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        self._response_cache = response_cache
+        self._instrumentation = instrumentation
+        if tracer is not None:
+            # imported only here, so that opentelemetry is needed only if a tracer is given
+            from timebutler_client.tracing import ClientTracing  # noqa: PLC0415
+
+            self._tracing = ClientTracing(tracer)
 
     def __repr__(self) -> str:
         return f"TimebutlerClient(base_url={self.base_url!r}, api_key='****')"
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The rate limiter shared by all requests of this client, if any."""
+        return self._rate_limiter
+
+    @property
+    def response_cache(self) -> SQLiteResponseCache | None:
+        """The persistent response cache of this client, if any."""
+        return self._response_cache
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """The instrumentation that receives the timings of this client's calls, if any."""
+        return self._instrumentation
+
+    def _call_span(
+        self, method: str, endpoint: str, params: Mapping[str, object] | None = None
+    ) -> AbstractContextManager[object]:
+        """The span of a get_* call if the client has a tracer, otherwise a context that does nothing."""
+        if self._tracing is None:
+            return nullcontext()
+        return self._tracing.call(method, endpoint, params)
+
+    def invalidate_cache(self, endpoint: CachedEndpoint | None = None) -> None:
+        """
+        Drop the cached response of an endpoint, or of all endpoints if none is given.
+
+        The next call fetches fresh data. A fetch already in flight is not cancelled,
+        but its result is not cached.
+        """
+        self._cache.invalidate(endpoint)
+
+    async def _cached(self, endpoint: CachedEndpoint, load: Callable[[], Awaitable[_T]]) -> _T:
+        """Run `load`, or return its cached result if a TTL is configured for the endpoint."""
+        ttl = self.cache_ttl.get(endpoint)
+        if ttl is None:
+            return await self._coalesced(endpoint, load)
+        return await self._cache.get_or_load(endpoint, ttl, load)
+
+    async def _coalesced(self, key: Hashable, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Run `call`, or join the identical call in flight (unless coalesce_requests is off)."""
+        if not self.coalesce_requests:
+            return await call()
+        return await self._flights.do(key, call)
+
+    async def __aenter__(self) -> Self:
+        if self._session is None:
+            self._session = self._create_session()
+            self._owns_session = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled session if it was opened by this client. Injected sessions are left open."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session backed by a connection pool configured from the client settings."""
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[create_trace_config()] if self._instrumentation is not None else None,
+        )
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session if there is one, otherwise a session that lives only for this scope."""
+        if self._session is not None:
+            yield self._session
+            return
+        async with self._create_session() as session:
+            yield session
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+    ) -> str:
+        """POST to an endpoint (adding the auth key to the form data) and return the CSV body."""
+        observed = self._instrumentation is not None or self._tracing is not None
+        attempts = 0
+
+        async def _attempt() -> str:
+            nonlocal attempts
+            attempts += 1
+            await self._wait_for_token()
+            async with self._concurrency or nullcontext():
+                if observed:
+                    return await self._observed_attempt(session, endpoint, params, attempts)
+                async with await self._send(session, endpoint, params) as response:
+                    return await response.text()
+
+        return await self._retrying(endpoint, _attempt)
+
+    async def _observed_attempt(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: str,
+        params: dict[str, str] | None,
+        attempt: int,
+    ) -> str:
+        """Like one attempt of _request, but report its timings to the instrumentation and trace it as a span."""
+        instrumentation = self._instrumentation
+        tracing = self._tracing
+        with (
+            tracing.request(f"{self.base_url}/{endpoint}", endpoint, params, attempt)
+            if tracing is not None
+            else nullcontext()
+        ) as span:
+            trace = RequestTrace()
+            body_bytes = 0
+            download_seconds: float | None = None
+            error: BaseException | None = None
+            try:
+                async with await self._send(session, endpoint, params, trace) as response:
+                    started = time.perf_counter()
+                    body = await response.read()
+                    download_seconds = time.perf_counter() - started
+                    body_bytes = len(body)
+                    return await response.text()
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                traced_span = span if span is not None and span.is_recording() else None
+                if instrumentation is not None or traced_span is not None:
+                    timings = RequestTimings(
+                        endpoint=endpoint,
+                        attempt=attempt,
+                        status=trace.status,
+                        error=type(error).__name__ if error is not None else None,
+                        retry_after=error.retry_after if isinstance(error, TimebutlerRateLimitError) else None,
+                        dns_seconds=trace.dns_seconds,
+                        connect_seconds=trace.connect_seconds,
+                        connection_reused=trace.connection_reused,
+                        ttfb_seconds=trace.ttfb_seconds,
+                        download_seconds=download_seconds,
+                        body_bytes=body_bytes,
+                    )
+                    if instrumentation is not None:
+                        instrumentation.on_request(timings)
+                    if tracing is not None and traced_span is not None:
+                        tracing.record_request(traced_span, timings)
+
+    async def _fetch_csv(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> str:
+        """
+        Return the raw CSV body of an endpoint, from the response cache if it holds a fresh one.
+
+        The request is sent with the given session, or within the client's own session scope.
+        """
+
+        async def _fetch() -> str:
+            cache = self._response_cache
+            if cache is not None:
+                cached_body = await asyncio.to_thread(cache.get_fresh, endpoint, params)
+                if cached_body is not None:
+                    return cached_body
+            if session is not None:
+                body = await self._request(session, endpoint, params)
+            else:
+                async with self._session_scope() as scoped_session:
+                    body = await self._request(scoped_session, endpoint, params)
+            if cache is not None:
+                await asyncio.to_thread(cache.put, endpoint, params, body)
+            return body
+
+        # keyed without the auth key, which _send adds and which is the same for all calls of this client
+        return await self._coalesced(("csv", endpoint, *sorted((params or {}).items())), _fetch)
+
+    def _parse_response(self, kind: str, csv_text: str, parse: Callable[[str], _T]) -> _T:
+        """
+        Parse a response body; with a response cache, an unchanged body reuses its earlier result.
+
+        Results are memoized per parse mode, so clients that share a response cache never get
+        the models of the other mode.
+        """
+        parse = self._observed_parse(kind, parse)
+        if self._response_cache is None:
+            return parse(csv_text)
+        return self._response_cache.parse(f"{kind}:{self.parse_mode}", csv_text, parse)
+
+    def _observed_parse(self, endpoint: str, parse: Callable[[str], _T]) -> Callable[[str], _T]:
+        """
+        Wrap a parser so that it reports its row count and timings to the instrumentation, if there is one,
+        and runs within a span, if the client has a tracer.
+        """
+        instrumentation = self._instrumentation
+        measured = parse if instrumentation is None else self._measured_parse(instrumentation, endpoint, parse)
+        tracing = self._tracing
+        if tracing is None:
+            return measured
+
+        def _traced_parse(csv_text: str) -> _T:
+            with tracing.parse(endpoint, csv_text) as span:
+                result = measured(csv_text)
+                tracing.record_parse(span, result)
+                return result
+
+        return _traced_parse
+
+    @staticmethod
+    def _measured_parse(
+        instrumentation: Instrumentation, endpoint: str, parse: Callable[[str], _T]
+    ) -> Callable[[str], _T]:
+        """Wrap a parser so that it reports its row count and timings to the instrumentation."""
+
+        def _parse(csv_text: str) -> _T:
+            started = time.perf_counter()
+            rows = 0
+            error: BaseException | None = None
+            try:
+                result = parse(csv_text)
+                rows = _row_count(result) or 0
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                instrumentation.on_parse(
+                    ParseTimings(
+                        endpoint=endpoint,
+                        rows=rows,
+                        parse_seconds=time.perf_counter() - started,
+                        error=type(error).__name__ if error is not None else None,
+                    )
+                )
+
+        return _parse
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        POST to an endpoint and yield the response with its body not read yet.
+
+        The session, the concurrency slot and the connection are held until the block is left.
+        """
+        concurrency = self._concurrency
+        async with self._session_scope() as session:
+
+            async def _attempt() -> aiohttp.ClientResponse:
+                await self._wait_for_token()
+                if concurrency is not None:
+                    await concurrency.acquire()
+                try:
+                    return await self._send(session, endpoint, params)
+                except BaseException:
+                    if concurrency is not None:
+                        concurrency.release()  # not held during the retry backoff either
+                    raise
+
+            response = await self._retrying(endpoint, _attempt)
+            try:
+                async with response:
+                    yield response
+            finally:
+                if concurrency is not None:
+                    concurrency.release()
+
+    async def _iter_models(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None,
+        convert: Callable[[dict[str, str]], _T],
+    ) -> AsyncIterator[_T]:
+        """Stream an endpoint's CSV response and yield each row converted into a model."""
+        async with self._open_stream(endpoint, params) as response:
+            async for row in _iter_csv_rows(response):
+                try:
+                    model = convert(row)
+                except (KeyError, ValueError) as e:
+                    raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
+                yield model
+
+    async def _retrying(self, endpoint: str, attempt: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run an attempt, retrying transient errors according to the retry policy.
+
+        The last error is re-raised once attempts or the deadline budget are exhausted.
+        """
+        policy = self.retry_policy
+        if policy is None:
+            return await attempt()
+        started = time.monotonic()
+        attempt_number = 1
+        while True:
+            try:
+                return await attempt()
+            except (TimebutlerRateLimitError, TimebutlerServerError, aiohttp.ClientError, TimeoutError) as e:
+                if attempt_number >= policy.max_attempts or isinstance(e, aiohttp.ClientResponseError):
+                    raise  # out of attempts, or a 4xx error that will not go away by retrying
+                if isinstance(e, aiohttp.ClientError | TimeoutError) and not policy.retry_on_connection_errors:
+                    raise
+                delay = policy.backoff(
+                    attempt_number, e.retry_after if isinstance(e, TimebutlerRateLimitError) else None
+                )
+                if policy.deadline is not None and time.monotonic() - started + delay > policy.deadline:
+                    raise
+                logger.warning(
+                    "Request to /%s failed (%s), retrying in %.2fs (attempt %d of %d)",
+                    endpoint,
+                    e,
+                    delay,
+                    attempt_number + 1,
+                    policy.max_attempts,
+                )
+                await asyncio.sleep(delay)
+                attempt_number += 1
+
+    async def _wait_for_token(self) -> None:
+        """
+        Pass the rate limiter, if any.
+
+        Called before a concurrency slot is taken, so a request waiting for a token does not
+        keep a slot from a request that already has one.
+        """
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+        trace: RequestTrace | None = None,
+    ) -> aiohttp.ClientResponse:
+        """
+        Perform a single POST and check its status; the caller has passed _wait_for_token() already.
+
+        With a trace, the status and the time until the response headers arrived are recorded in it.
+        The caller is responsible for releasing the returned response.
+        """
+        data = {"auth": self._api_key, **(params or {})}
+        limiter = self._rate_limiter
+        if trace is None:
+            response = await session.post(f"{self.base_url}/{endpoint}", data=data)
+        else:
+            started = time.perf_counter()
+            response = await session.post(
+                f"{self.base_url}/{endpoint}", data=data, trace_request_ctx=trace.trace_request_ctx
+            )
+            trace.ttfb_seconds = time.perf_counter() - started
+            trace.status = response.status
+        try:
+            await self._check_response(response)
+        except TimebutlerRateLimitError as e:
+            response.release()
+            if limiter is not None:
+                limiter.on_rate_limited(e.retry_after)
+            raise
+        except BaseException:
+            response.release()
+            raise
+        if limiter is not None:
+            limiter.on_success()
+        return response
+
     async def get_absences(self, year: int) -> list[Absence]:
         """
         Fetch absences for a given year.
@@ -77,29 +673,46 @@ class TimebutlerClient(BaseModel):
             Despite being named 'get_', this calls a POST endpoint
             (Timebutler API only accepts POST requests).
         """
-        if not 1900 <= year <= 2100:
-            raise ValueError(f"Year must be between 1900 and 2100, got {year}")
+        self._check_year(year)
 
-        # Session is created per-call for simplicity.
-        # For high-throughput scenarios, consider passing a shared session
-        # or refactoring to use a context manager pattern.
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.post(
-                f"{self.base_url}/absences",
-                data={"auth": self._api_key, "year": str(year)},
-            ) as response:
-                await self._check_response(response)
-                csv_text = await response.text()
-                return self._parse_absences_csv(csv_text)
+        params = {"year": str(year)}
+
+        async def _load() -> list[Absence]:
+            return self._parse_response("absences", await self._fetch_csv("absences", params), self._parse_absences_csv)
+
+        with self._call_span("get_absences", "absences", params):
+            return list(await self._coalesced(("absences", year), _load))
+
+    async def iter_absences(self, year: int) -> AsyncIterator[Absence]:
+        """
+        Stream absences for a given year.
+
+        Like get_absences(), but the response is parsed line by line while it is downloaded
+        and each Absence is yielded as soon as its row has arrived.
+
+        Args:
+            year: The year to fetch absences for (e.g., 2026)
+
+        Yields:
+            Absence objects in API response order
+
+        Raises:
+            ValueError: If year is outside valid range (1900-2100)
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
+        """
+        self._check_year(year)
+        async for absence in self._iter_models("absences", {"year": str(year)}, self._absence_from_row):
+            yield absence
 
     async def _check_response(self, response: aiohttp.ClientResponse) -> None:
         """Check response status and raise appropriate exceptions."""
         if response.status in (401, 403):
             raise TimebutlerAuthenticationError("Invalid API key")
         if response.status == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise TimebutlerRateLimitError(int(retry_after) if retry_after else None)
+            raise TimebutlerRateLimitError(_parse_retry_after(response.headers.get("Retry-After")))
         if response.status >= 500:
             text = await response.text()
             raise TimebutlerServerError(response.status, text[:200])
@@ -108,36 +721,35 @@ class TimebutlerClient(BaseModel):
     def _parse_absences_csv(self, csv_text: str) -> list[Absence]:
         """Parse semicolon-delimited CSV into Absence models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_absences_csv(csv_text)
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
-            absences: list[Absence] = []
-
-            for row in reader:
-                absence = Absence(
-                    id=int(row["ID"]),
-                    from_date=row["From"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
-                    to_date=row["To"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
-                    employee_number=row["Employee number"],
-                    user_id=int(row["User ID"]) if row.get("User ID") else 0,
-                    half_day=row.get("Half a day", "").lower() == "true",
-                    morning=row.get("Morning", "").lower() == "true",
-                    absence_type=row.get("Type", ""),
-                    extra_vacation=row.get("Extra vacation day", "").lower() == "true",
-                    state=row.get("State", ""),
-                    substitute_state=row.get("Substitute state", ""),
-                    workdays=Decimal(row["Workdays"]) if row.get("Workdays") else Decimal("0"),
-                    hours=Decimal(row["Hours"]) if row.get("Hours") else Decimal("0"),
-                    medical_certificate=row.get("Medical certificate (sick leave only)", "").strip() or None,
-                    comments=row.get("Comments", "").strip() or None,
-                    substitute_user_id=(
-                        int(row["User ID of the substitute"]) if row.get("User ID of the substitute") else 0
-                    ),
-                )
-                absences.append(absence)
-
-            return absences
+            return [self._absence_from_row(row) for row in reader]
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
 
+    @staticmethod
+    def _absence_from_row(row: dict[str, str]) -> Absence:
+        """Convert one CSV row of the /absences response into an Absence model."""
+        return Absence(
+            id=int(row["ID"]),
+            from_date=row["From"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
+            to_date=row["To"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
+            employee_number=row["Employee number"],
+            user_id=int(row["User ID"]) if row.get("User ID") else 0,
+            half_day=row.get("Half a day", "").lower() == "true",
+            morning=row.get("Morning", "").lower() == "true",
+            absence_type=row.get("Type", ""),
+            extra_vacation=row.get("Extra vacation day", "").lower() == "true",
+            state=row.get("State", ""),
+            substitute_state=row.get("Substitute state", ""),
+            workdays=Decimal(row["Workdays"]) if row.get("Workdays") else Decimal("0"),
+            hours=Decimal(row["Hours"]) if row.get("Hours") else Decimal("0"),
+            medical_certificate=row.get("Medical certificate (sick leave only)", "").strip() or None,
+            comments=row.get("Comments", "").strip() or None,
+            substitute_user_id=int(row["User ID of the substitute"]) if row.get("User ID of the substitute") else 0,
+        )
+
     async def get_projects(self) -> list[Project]:
         """
         Fetch all projects.
@@ -154,38 +766,55 @@ class TimebutlerClient(BaseModel):
         Note:
             Despite being named 'get_', this calls a POST endpoint
             (Timebutler API only accepts POST requests).
+            The result is cached if cache_ttl has an entry for "projects".
+        """
+        with self._call_span("get_projects", "projects"):
+            return list(await self._cached("projects", self._load_projects))
+
+    async def _load_projects(self) -> list[Project]:
+        """Fetch and parse /projects, bypassing the cache."""
+        return self._parse_response("projects", await self._fetch_csv("projects"), self._parse_projects_csv)
+
+    async def iter_projects(self) -> AsyncIterator[Project]:
+        """
+        Stream all projects.
+
+        Like get_projects(), but each Project is yielded as soon as its row has arrived.
+
+        Yields:
+            Project objects in API response order
+
+        Raises:
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
         """
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.post(
-                f"{self.base_url}/projects",
-                data={"auth": self._api_key},
-            ) as response:
-                await self._check_response(response)
-                csv_text = await response.text()
-                return self._parse_projects_csv(csv_text)
+        async for project in self._iter_models("projects", None, self._project_from_row):
+            yield project
 
     def _parse_projects_csv(self, csv_text: str) -> list[Project]:
         """Parse semicolon-delimited CSV into Project models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_projects_csv(csv_text)
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
-            projects: list[Project] = []
-
-            for row in reader:
-                project = Project(
-                    id=int(row["ID of the project"]),
-                    name=row["Name"],
-                    state=row["State"],
-                    budget_hours=int(row["Budget in hours"]) if row.get("Budget in hours") else 0,
-                    comments=row.get("Comments", "").strip() or None,
-                    creation_date=row["Creation date"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
-                )
-                projects.append(project)
-
-            return projects
+            return [self._project_from_row(row) for row in reader]
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
 
+    @staticmethod
+    def _project_from_row(row: dict[str, str]) -> Project:
+        """Convert one CSV row of the /projects response into a Project model."""
+        return Project(
+            id=int(row["ID of the project"]),
+            name=row["Name"],
+            state=row["State"],
+            budget_hours=int(row["Budget in hours"]) if row.get("Budget in hours") else 0,
+            comments=row.get("Comments", "").strip() or None,
+            creation_date=row["Creation date"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
+        )
+
     async def get_services(self) -> list[Service]:
         """
         Fetch all services.
@@ -202,38 +831,55 @@ class TimebutlerClient(BaseModel):
         Note:
             Despite being named 'get_', this calls a POST endpoint
             (Timebutler API only accepts POST requests).
+            The result is cached if cache_ttl has an entry for "services".
         """
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.post(
-                f"{self.base_url}/services",
-                data={"auth": self._api_key},
-            ) as response:
-                await self._check_response(response)
-                csv_text = await response.text()
-                return self._parse_services_csv(csv_text)
+        with self._call_span("get_services", "services"):
+            return list(await self._cached("services", self._load_services))
+
+    async def _load_services(self) -> list[Service]:
+        """Fetch and parse /services, bypassing the cache."""
+        return self._parse_response("services", await self._fetch_csv("services"), self._parse_services_csv)
+
+    async def iter_services(self) -> AsyncIterator[Service]:
+        """
+        Stream all services.
+
+        Like get_services(), but each Service is yielded as soon as its row has arrived.
+
+        Yields:
+            Service objects in API response order
+
+        Raises:
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
+        """
+        async for service in self._iter_models("services", None, self._service_from_row):
+            yield service
 
     def _parse_services_csv(self, csv_text: str) -> list[Service]:
         """Parse semicolon-delimited CSV into Service models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_services_csv(csv_text)
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
-            services: list[Service] = []
-
-            for row in reader:
-                service = Service(
-                    id=int(row["ID of the service"]),
-                    name=row["Name"],
-                    state=row["State"],
-                    billable=row.get("Billable", "").lower() == "true",
-                    comments=row.get("Comments", "").strip() or None,
-                    creation_date=row["Creation date"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
-                )
-                services.append(service)
-
-            return services
+            return [self._service_from_row(row) for row in reader]
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
 
+    @staticmethod
+    def _service_from_row(row: dict[str, str]) -> Service:
+        """Convert one CSV row of the /services response into a Service model."""
+        return Service(
+            id=int(row["ID of the service"]),
+            name=row["Name"],
+            state=row["State"],
+            billable=row.get("Billable", "").lower() == "true",
+            comments=row.get("Comments", "").strip() or None,
+            creation_date=row["Creation date"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
+        )
+
     async def get_worktime(
         self,
         year: int | None = None,
@@ -262,33 +908,182 @@ class TimebutlerClient(BaseModel):
             Despite being named 'get_', this calls a POST endpoint
             (Timebutler API only accepts POST requests).
         """
+        params = self._worktime_params(year, month, user_id)
+
+        async def _load() -> list[WorktimeEntry]:
+            return self._parse_response("worktime", await self._fetch_csv("worktime", params), self._parse_worktime_csv)
+
+        with self._call_span("get_worktime", "worktime", params):
+            return list(await self._coalesced(("worktime", *sorted(params.items())), _load))
+
+    async def iter_worktime(
+        self,
+        year: int | None = None,
+        month: int | None = None,
+        user_id: int | None = None,
+    ) -> AsyncIterator[WorktimeEntry]:
+        """
+        Stream worktime entries.
+
+        Like get_worktime(), but the response is parsed line by line while it is downloaded
+        and each WorktimeEntry is yielded as soon as its row has arrived.
+
+        Args:
+            year: Calendar year (defaults to current year if omitted)
+            month: Month 1-12 (defaults to current month if omitted)
+            user_id: Filter by specific user ID (optional)
+
+        Yields:
+            WorktimeEntry objects in API response order
+
+        Raises:
+            ValueError: If month is outside 1-12 range
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
+        """
+        params = self._worktime_params(year, month, user_id)
+        async for entry in self._iter_models("worktime", params, self._worktime_entry_from_row):
+            yield entry
+
+    @staticmethod
+    def _worktime_params(year: int | None, month: int | None, user_id: int | None) -> dict[str, str]:
+        """Validate the /worktime filters and convert them into form parameters."""
         if month is not None and not 1 <= month <= 12:
             raise ValueError(f"Month must be between 1 and 12, got {month}")
-
-        data: dict[str, str] = {"auth": self._api_key}
+        params: dict[str, str] = {}
         if year is not None:
-            data["year"] = str(year)
+            params["year"] = str(year)
         if month is not None:
-            data["month"] = str(month)
+            params["month"] = str(month)
         if user_id is not None:
-            data["userid"] = str(user_id)
+            params["userid"] = str(user_id)
+        return params
+
+    async def get_worktime_table(
+        self,
+        year: int | None = None,
+        month: int | None = None,
+        user_id: int | None = None,
+    ) -> WorktimeTable:
+        """
+        Fetch worktime entries into a columnar WorktimeTable.
+
+        Same request as get_worktime(), but the response is parsed straight into
+        compact column arrays instead of one WorktimeEntry model per row, which
+        needs a fraction of the memory and makes aggregations over the columns cheap.
+        Individual rows are materialized as WorktimeEntry when indexed.
+
+        Args:
+            year: Calendar year (defaults to current year if omitted)
+            month: Month 1-12 (defaults to current month if omitted)
+            user_id: Filter by specific user ID (optional)
+
+        Returns:
+            WorktimeTable with one row per worktime entry, in API response order
 
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.post(
-                f"{self.base_url}/worktime",
-                data=data,
-            ) as response:
-                await self._check_response(response)
-                csv_text = await response.text()
-                return self._parse_worktime_csv(csv_text)
+        Raises:
+            ValueError: If month is outside 1-12 range
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If response cannot be parsed
+
+        Note:
+            Despite being named 'get_', this calls a POST endpoint
+            (Timebutler API only accepts POST requests).
+        """
+        params = self._worktime_params(year, month, user_id)
+        with self._call_span("get_worktime_table", "worktime", params):
+            csv_text = await self._fetch_csv("worktime", params)
+            return self._observed_parse("worktime", self._parse_worktime_table_csv)(csv_text)
 
-    async def get_workdays(self) -> WorkdaysResult:
+    @staticmethod
+    def _parse_worktime_table_csv(csv_text: str) -> WorktimeTable:
+        """Parse semicolon-delimited CSV into a WorktimeTable."""
+        try:
+            return fast_parsing.parse_worktime_table(csv_text)
+        except (KeyError, ValueError) as e:
+            raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
+
+    async def get_worktime_range(
+        self,
+        start: date,
+        end: date,
+        user_ids: Iterable[int] | None = None,
+        concurrency: int = 4,
+    ) -> list[WorktimeEntry]:
+        """
+        Fetch worktime entries for a date range, spanning several months and users.
+
+        One /worktime request is planned per month touched by the range (and per user,
+        if user_ids are given). The requests run concurrently over one session, at most
+        `concurrency` at a time. Entries are deduplicated by their ID and filtered to
+        the requested range.
+
+        Args:
+            start: First day of the range (inclusive)
+            end: Last day of the range (inclusive)
+            user_ids: Only fetch entries of these users; None fetches all users with one request per month
+            concurrency: Maximum number of requests in flight at the same time
+
+        Returns:
+            List of WorktimeEntry objects, ordered by month, then by user as given, then in API response order
+
+        Raises:
+            ValueError: If end is before start or concurrency is below 1
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If response cannot be parsed
+
+        Note:
+            The client-wide rate limiter and max_concurrency apply on top of `concurrency`.
+        """
+        if end < start:
+            raise ValueError(f"End date must not be before start date, got {start} - {end}")
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+
+        months = _months_between(start, end)
+        users: list[int | None] = list(user_ids) if user_ids is not None else [None]
+        plan = [(year, month, user_id) for year, month in months for user_id in users]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        span_params = {"start": start, "end": end, "requests": len(plan)}
+        with self._call_span("get_worktime_range", "worktime", span_params):
+            async with self._session_scope() as session:
+
+                async def _fetch(year: int, month: int, user_id: int | None) -> list[WorktimeEntry]:
+                    params = {"year": str(year), "month": str(month)}
+                    if user_id is not None:
+                        params["userid"] = str(user_id)
+                    async with semaphore:
+                        csv_text = await self._fetch_csv("worktime", params, session)
+                    return self._parse_response("worktime", csv_text, self._parse_worktime_csv)
+
+                results = await asyncio.gather(*(_fetch(*cell) for cell in plan))
+
+        entries: dict[int, WorktimeEntry] = {}
+        for result in results:
+            for entry in result:
+                if start <= entry.date <= end:
+                    entries.setdefault(entry.id, entry)
+        return list(entries.values())
+
+    async def get_workdays(self, users: Iterable[User] | None = None) -> WorkdaysResult:
         """
         Fetch workday schedules for all users, enriched with employee numbers.
 
         Internally calls both /workdays and /users concurrently to resolve
-        the employee number for each user ID.
+        the employee number for each user ID. The /users request is skipped if
+        `users` are passed in or a cached /users response is fresh (see cache_ttl).
+
+        Args:
+            users: Users fetched before, e.g. via get_users(), to take the employee numbers from.
+                Schedules of users missing from this list (such as users that get_users() left out
+                because of their employee number) are skipped, and invalid_employees is empty.
 
         Returns:
             WorkdaysResult with schedules and invalid_employees.
@@ -306,82 +1101,148 @@ class TimebutlerClient(BaseModel):
             Despite being named 'get_', this calls POST endpoints
             (Timebutler API only accepts POST requests).
         """
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
+        with self._call_span("get_workdays", "workdays"):
+            if users is not None:
+                employee_number_map = {u.user_id: u.employee_number for u in users}
+                workdays_csv = await self._fetch_csv("workdays")
+                parse = partial(
+                    self._parse_workdays_csv, employee_number_map=employee_number_map, skip_unknown_users=True
+                )
+                schedules = self._observed_parse("workdays", parse)(workdays_csv)
+                return WorkdaysResult(schedules=schedules, invalid_employees=[])
 
-            async def _fetch(endpoint: str) -> str:
-                async with session.post(
-                    f"{self.base_url}/{endpoint}",
-                    data={"auth": self._api_key},
-                ) as response:
-                    await self._check_response(response)
-                    return await response.text()
+            async def _fetch_users() -> tuple[list[User], list[InvalidEmployee]]:
+                with self._call_span("get_users", "users"):
+                    return await self._cached("users", self._load_users)
+
+            # the span of each fetch is opened in its own task, so both are children of the get_workdays span
+            workdays_csv, (fetched_users, invalid_employees) = await asyncio.gather(
+                self._fetch_csv("workdays"), _fetch_users()
+            )
+            invalid_user_ids: set[int] = {inv.user_id for inv in invalid_employees if inv.user_id is not None}
+            employee_number_map = {u.user_id: u.employee_number for u in fetched_users}
+            parse = partial(
+                self._parse_workdays_csv, employee_number_map=employee_number_map, skip_user_ids=invalid_user_ids
+            )
+            schedules = self._observed_parse("workdays", parse)(workdays_csv)
+            return WorkdaysResult(schedules=schedules, invalid_employees=list(invalid_employees))
+
+    async def iter_workdays(self, users: Iterable[User] | None = None) -> AsyncIterator[WorkdaySchedule]:
+        """
+        Stream workday schedules for all users, enriched with employee numbers.
+
+        The /users response is fetched first to resolve employee numbers (unless `users`
+        are passed in or cached, like in get_workdays()); the /workdays response is then
+        parsed line by line and each WorkdaySchedule is yielded as soon as its row has
+        arrived. Schedules of users with unparsable employee numbers are skipped and logged,
+        like in get_users().
+
+        Args:
+            users: Users fetched before to take the employee numbers from; schedules of
+                users missing from this list are skipped
+
+        Yields:
+            WorkdaySchedule objects in API response order
+
+        Raises:
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
+        """
+        skip_unknown_users = users is not None
+        invalid_user_ids: set[int] = set()
+        if users is None:
+            fetched_users, invalid_employees = await self._cached("users", self._load_users)
+            self._log_invalid_employees(invalid_employees)
+            invalid_user_ids = {inv.user_id for inv in invalid_employees if inv.user_id is not None}
+            users = fetched_users
+        employee_number_map = {u.user_id: u.employee_number for u in users}
 
-            workdays_csv, users_csv = await asyncio.gather(_fetch("workdays"), _fetch("users"))
+        def _convert(row: dict[str, str]) -> WorkdaySchedule | None:
+            return self._workday_schedule_from_row(
+                row, employee_number_map, invalid_user_ids, skip_unknown_users=skip_unknown_users
+            )
 
-        users, invalid_employees = self._parse_users_csv(users_csv)
-        invalid_user_ids: set[int] = {inv.user_id for inv in invalid_employees if inv.user_id is not None}
-        employee_number_map: dict[int, str] = {u.user_id: u.employee_number for u in users}
-        schedules = self._parse_workdays_csv(workdays_csv, employee_number_map, skip_user_ids=invalid_user_ids)
-        return WorkdaysResult(schedules=schedules, invalid_employees=invalid_employees)
+        async for schedule in self._iter_models("workdays", None, _convert):
+            if schedule is not None:
+                yield schedule
 
     def _parse_workdays_csv(
         self,
         csv_text: str,
         employee_number_map: dict[int, str],
         skip_user_ids: set[int] | None = None,
+        *,
+        skip_unknown_users: bool = False,
     ) -> list[WorkdaySchedule]:
         """Parse semicolon-delimited CSV into WorkdaySchedule models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_workdays_csv(
+                    csv_text, employee_number_map, skip_user_ids, skip_unknown_users=skip_unknown_users
+                )
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
             schedules: list[WorkdaySchedule] = []
-
             for row in reader:
-                user_id = int(row["User ID"])
-                if skip_user_ids and user_id in skip_user_ids:
-                    continue
-                employee_number = employee_number_map.get(user_id)
-                if employee_number is None:
-                    raise TimebutlerParseError(f"No user found for user ID {user_id} in users response")
-                schedule = WorkdaySchedule(
-                    user_id=user_id,
-                    valid_from=row["Valid from (dd/mm/yyyy)"],  # type: ignore[arg-type]
-                    employee_number=employee_number,
-                    monday_minutes=(
-                        int(row["Monday working time in minutes"]) if row.get("Monday working time in minutes") else 0
-                    ),
-                    tuesday_minutes=(
-                        int(row["Tuesday working time in minutes"]) if row.get("Tuesday working time in minutes") else 0
-                    ),
-                    wednesday_minutes=(
-                        int(row["Wednesday working time in minutes"])
-                        if row.get("Wednesday working time in minutes")
-                        else 0
-                    ),
-                    thursday_minutes=(
-                        int(row["Thursday working time in minutes"])
-                        if row.get("Thursday working time in minutes")
-                        else 0
-                    ),
-                    friday_minutes=(
-                        int(row["Friday working time in minutes"]) if row.get("Friday working time in minutes") else 0
-                    ),
-                    saturday_minutes=(
-                        int(row["Saturday working time in minutes"])
-                        if row.get("Saturday working time in minutes")
-                        else 0
-                    ),
-                    sunday_minutes=(
-                        int(row["Sunday working time in minutes"]) if row.get("Sunday working time in minutes") else 0
-                    ),
-                    holiday_set_id=int(row["ID of the holiday set"]) if row.get("ID of the holiday set") else 0,
+                schedule = self._workday_schedule_from_row(
+                    row, employee_number_map, skip_user_ids, skip_unknown_users=skip_unknown_users
                 )
-                schedules.append(schedule)
-
+                if schedule is not None:
+                    schedules.append(schedule)
             return schedules
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
 
+    @staticmethod
+    def _workday_schedule_from_row(
+        row: dict[str, str],
+        employee_number_map: dict[int, str],
+        skip_user_ids: set[int] | None = None,
+        *,
+        skip_unknown_users: bool = False,
+    ) -> WorkdaySchedule | None:
+        """
+        Convert one CSV row of the /workdays response into a WorkdaySchedule, None if the user is skipped.
+
+        Users missing from employee_number_map are an error unless skip_unknown_users is set.
+        """
+        user_id = int(row["User ID"])
+        if skip_user_ids and user_id in skip_user_ids:
+            return None
+        employee_number = employee_number_map.get(user_id)
+        if employee_number is None:
+            if skip_unknown_users:
+                return None
+            raise TimebutlerParseError(f"No user found for user ID {user_id} in users response")
+        return WorkdaySchedule(
+            user_id=user_id,
+            valid_from=row["Valid from (dd/mm/yyyy)"],  # type: ignore[arg-type]
+            employee_number=employee_number,
+            monday_minutes=(
+                int(row["Monday working time in minutes"]) if row.get("Monday working time in minutes") else 0
+            ),
+            tuesday_minutes=(
+                int(row["Tuesday working time in minutes"]) if row.get("Tuesday working time in minutes") else 0
+            ),
+            wednesday_minutes=(
+                int(row["Wednesday working time in minutes"]) if row.get("Wednesday working time in minutes") else 0
+            ),
+            thursday_minutes=(
+                int(row["Thursday working time in minutes"]) if row.get("Thursday working time in minutes") else 0
+            ),
+            friday_minutes=(
+                int(row["Friday working time in minutes"]) if row.get("Friday working time in minutes") else 0
+            ),
+            saturday_minutes=(
+                int(row["Saturday working time in minutes"]) if row.get("Saturday working time in minutes") else 0
+            ),
+            sunday_minutes=(
+                int(row["Sunday working time in minutes"]) if row.get("Sunday working time in minutes") else 0
+            ),
+            holiday_set_id=int(row["ID of the holiday set"]) if row.get("ID of the holiday set") else 0,
+        )
+
     async def get_users(self) -> list[User]:
         """
         Fetch all users.
@@ -398,99 +1259,136 @@ class TimebutlerClient(BaseModel):
         Note:
             Despite being named 'get_', this calls a POST endpoint
             (Timebutler API only accepts POST requests).
+            The result is cached if cache_ttl has an entry for "users".
         """
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.post(
-                f"{self.base_url}/users",
-                data={"auth": self._api_key},
-            ) as response:
-                await self._check_response(response)
-                csv_text = await response.text()
-                users, invalid_employees = self._parse_users_csv(csv_text)
-                if invalid_employees:
-                    logger.warning(
-                        "Skipped %d user(s) with missing or non-numeric employee numbers: %s",
-                        len(invalid_employees),
-                        [
-                            f"{e.display_name} (user_id={e.user_id}, raw={e.raw_employee_number!r})"
-                            for e in invalid_employees
-                        ],
-                    )
-                return users
+        with self._call_span("get_users", "users"):
+            users, invalid_employees = await self._cached("users", self._load_users)
+        self._log_invalid_employees(invalid_employees)
+        return list(users)
+
+    async def _load_users(self) -> tuple[list[User], list[InvalidEmployee]]:
+        """Fetch and parse /users, bypassing the cache."""
+        return self._parse_response("users", await self._fetch_csv("users"), self._parse_users_csv)
+
+    async def iter_users(self) -> AsyncIterator[User]:
+        """
+        Stream all users.
+
+        Like get_users(), but each User is yielded as soon as its row has arrived.
+        Users with missing or non-numeric employee numbers are skipped and logged
+        once the response has been read completely.
+
+        Yields:
+            User objects in API response order
+
+        Raises:
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If a row cannot be parsed (rows before it have already been yielded)
+        """
+        invalid_employees: list[InvalidEmployee] = []
+        async for user in self._iter_models("users", None, self._user_from_row):
+            if isinstance(user, InvalidEmployee):
+                invalid_employees.append(user)
+            else:
+                yield user
+        self._log_invalid_employees(invalid_employees)
+
+    @staticmethod
+    def _check_year(year: int) -> None:
+        """Raise ValueError for a year outside the range the API accepts (1900-2100)."""
+        if not 1900 <= year <= 2100:
+            raise ValueError(f"Year must be between 1900 and 2100, got {year}")
+
+    @staticmethod
+    def _log_invalid_employees(invalid_employees: list[InvalidEmployee]) -> None:
+        """Warn about users that were skipped because of their employee number."""
+        if invalid_employees:
+            logger.warning(
+                "Skipped %d user(s) with missing or non-numeric employee numbers: %s",
+                len(invalid_employees),
+                [f"{e.display_name} (user_id={e.user_id}, raw={e.raw_employee_number!r})" for e in invalid_employees],
+            )
 
     def _parse_users_csv(self, csv_text: str) -> tuple[list[User], list[InvalidEmployee]]:
         """Parse semicolon-delimited CSV into User models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_users_csv(csv_text)
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
             users: list[User] = []
             invalid_employees: list[InvalidEmployee] = []
-
             for row in reader:
-                raw_employee_number = row.get("Employee number", "").strip()
-                raw_user_id = row.get("User ID", "").strip()
-                if not _EMPLOYEE_NUMBER_PATTERN.match(raw_employee_number):
-                    invalid_employees.append(
-                        InvalidEmployee(
-                            user_id=int(raw_user_id) if raw_user_id.isdigit() else None,
-                            first_name=row.get("First name", "").strip(),
-                            last_name=row.get("Last name", "").strip(),
-                            raw_employee_number=raw_employee_number,
-                        )
-                    )
-                    continue
-                user = User(
-                    user_id=int(row["User ID"]),
-                    last_name=row["Last name"],
-                    first_name=row["First name"],
-                    employee_number=raw_employee_number,
-                    email=row.get("E-mail address", "").strip(),
-                    phone=row.get("Phone", "").strip(),
-                    mobile_phone=row.get("Mobile phone", "").strip(),
-                    cost_center=row.get("Cost center", "").strip(),
-                    branch_office=row.get("Branch office", "").strip(),
-                    department=row.get("Department", "").strip(),
-                    user_type=row.get("User type", "").strip() or None,  # type: ignore[arg-type]
-                    language=row.get("Language", "").strip(),
-                    manager_user_ids=row.get("User ID list of the user's manager", ""),  # type: ignore[arg-type]
-                    account_locked=row.get("User account locked", "").lower() == "true",
-                    additional_information=row.get("Additional Information", "").strip(),
-                    date_of_entry=row.get("Date of entry (dd/mm/yyyy)", ""),  # type: ignore[arg-type]
-                    date_of_separation=row.get(  # type: ignore[arg-type]
-                        "Date of separation from company (dd/mm/yyyy)", ""
-                    ),
-                    date_of_birth=row.get("Day of birth (dd/mm/yyyy)", ""),  # type: ignore[arg-type]
-                )
-                users.append(user)
-
+                user = self._user_from_row(row)
+                if isinstance(user, InvalidEmployee):
+                    invalid_employees.append(user)
+                else:
+                    users.append(user)
             return users, invalid_employees
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
 
+    @staticmethod
+    def _user_from_row(row: dict[str, str]) -> User | InvalidEmployee:
+        """Convert one CSV row of the /users response into a User, or an InvalidEmployee if unusable."""
+        raw_employee_number = row.get("Employee number", "").strip()
+        raw_user_id = row.get("User ID", "").strip()
+        if not _EMPLOYEE_NUMBER_PATTERN.match(raw_employee_number):
+            return InvalidEmployee(
+                user_id=int(raw_user_id) if raw_user_id.isdigit() else None,
+                first_name=row.get("First name", "").strip(),
+                last_name=row.get("Last name", "").strip(),
+                raw_employee_number=raw_employee_number,
+            )
+        return User(
+            user_id=int(row["User ID"]),
+            last_name=row["Last name"],
+            first_name=row["First name"],
+            employee_number=raw_employee_number,
+            email=row.get("E-mail address", "").strip(),
+            phone=row.get("Phone", "").strip(),
+            mobile_phone=row.get("Mobile phone", "").strip(),
+            cost_center=row.get("Cost center", "").strip(),
+            branch_office=row.get("Branch office", "").strip(),
+            department=row.get("Department", "").strip(),
+            user_type=row.get("User type", "").strip() or None,  # type: ignore[arg-type]
+            language=row.get("Language", "").strip(),
+            manager_user_ids=row.get("User ID list of the user's manager", ""),  # type: ignore[arg-type]
+            account_locked=row.get("User account locked", "").lower() == "true",
+            additional_information=row.get("Additional Information", "").strip(),
+            date_of_entry=row.get("Date of entry (dd/mm/yyyy)", ""),  # type: ignore[arg-type]
+            date_of_separation=row.get(  # type: ignore[arg-type]
+                "Date of separation from company (dd/mm/yyyy)", ""
+            ),
+            date_of_birth=row.get("Day of birth (dd/mm/yyyy)", ""),  # type: ignore[arg-type]
+        )
+
     def _parse_worktime_csv(self, csv_text: str) -> list[WorktimeEntry]:
         """Parse semicolon-delimited CSV into WorktimeEntry models."""
         try:
+            if self.parse_mode == "fast":
+                return fast_parsing.parse_worktime_csv(csv_text)
             reader = csv.DictReader(StringIO(csv_text), delimiter=";")
-            entries: list[WorktimeEntry] = []
-
-            for row in reader:
-                entry = WorktimeEntry(
-                    id=int(row["ID of the work time entry"]),
-                    user_id=int(row["User ID"]),
-                    employee_number=row["Employee number"],
-                    date=row["Date (dd/mm/yyyy)"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
-                    start_time=row["Start time (hh:mm)"],  # type: ignore[arg-type]  # BeforeValidator handles str->time
-                    end_time=row["End time (hh:mm)"],  # type: ignore[arg-type]  # BeforeValidator handles str->time
-                    working_time_seconds=int(row["Working time in seconds"]),
-                    pause_seconds=int(row["Pause in seconds"]) if row.get("Pause in seconds") else 0,
-                    state=row["State"],
-                    project_id=int(row["ID of the project"]) if row.get("ID of the project") else 0,
-                    service_id=int(row["ID of the service"]) if row.get("ID of the service") else 0,
-                    comments=row.get("Comments", "").strip() or None,
-                    auto_stopped=row.get("Auto stopped", "").lower() == "true",
-                )
-                entries.append(entry)
-
-            return entries
+            return [self._worktime_entry_from_row(row) for row in reader]
         except (KeyError, ValueError) as e:
             raise TimebutlerParseError(f"Failed to parse API response: {e}") from e
+
+    @staticmethod
+    def _worktime_entry_from_row(row: dict[str, str]) -> WorktimeEntry:
+        """Convert one CSV row of the /worktime response into a WorktimeEntry model."""
+        return WorktimeEntry(
+            id=int(row["ID of the work time entry"]),
+            user_id=int(row["User ID"]),
+            employee_number=row["Employee number"],
+            date=row["Date (dd/mm/yyyy)"],  # type: ignore[arg-type]  # BeforeValidator handles str->date
+            start_time=row["Start time (hh:mm)"],  # type: ignore[arg-type]  # BeforeValidator handles str->time
+            end_time=row["End time (hh:mm)"],  # type: ignore[arg-type]  # BeforeValidator handles str->time
+            working_time_seconds=int(row["Working time in seconds"]),
+            pause_seconds=int(row["Pause in seconds"]) if row.get("Pause in seconds") else 0,
+            state=row["State"],
+            project_id=int(row["ID of the project"]) if row.get("ID of the project") else 0,
+            service_id=int(row["ID of the service"]) if row.get("ID of the service") else 0,
+            comments=row.get("Comments", "").strip() or None,
+            auto_stopped=row.get("Auto stopped", "").lower() == "true",
+        )
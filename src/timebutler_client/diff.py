@@ -0,0 +1,124 @@
+"""Diffing of two snapshots of Timebutler records (absences, users, worktime entries, ...)."""
+
+from collections.abc import Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+from timebutler_client.models import Absence, Project, Service, User, WorktimeEntry
+
+__all__ = ["NATURAL_KEYS", "FieldChange", "RecordUpdate", "SnapshotDiff", "diff_snapshots"]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+#: Attribute identifying a record across snapshots, per model type.
+NATURAL_KEYS: dict[type[BaseModel], str] = {
+    Absence: "id",
+    Project: "id",
+    Service: "id",
+    User: "user_id",
+    WorktimeEntry: "id",
+}
+
+
+class FieldChange(BaseModel):
+    """A field whose value differs between the old and the new version of a record."""
+
+    model_config = ConfigDict(frozen=True)
+
+    field: str
+    old: Any
+    new: Any
+
+
+class RecordUpdate(BaseModel, Generic[_M]):
+    """A record that exists in both snapshots with different content."""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: Any
+    old: _M
+    new: _M
+    changes: list[FieldChange]
+
+
+class SnapshotDiff(BaseModel, Generic[_M]):
+    """Difference between two snapshots, as returned by diff_snapshots()."""
+
+    model_config = ConfigDict(frozen=True)
+
+    inserted: list[_M]
+    updated: list[RecordUpdate[_M]]
+    deleted: list[_M]
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any record was inserted, updated or deleted."""
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+def _index(records: Iterable[_M], key: str | None) -> tuple[str | None, dict[Hashable, _M]]:
+    index: dict[Hashable, _M] = {}
+    for record in records:
+        if key is None:
+            try:
+                key = NATURAL_KEYS[type(record)]
+            except KeyError:
+                raise ValueError(f"No natural key known for {type(record).__name__}, pass key=...") from None
+        record_key = getattr(record, key)
+        if record_key in index:
+            raise ValueError(f"Duplicate key {key}={record_key!r} in snapshot")
+        index[record_key] = record
+    return key, index
+
+
+def _same_content(old: BaseModel, new: BaseModel) -> bool:
+    # comparing the field dicts directly skips the generic (and much slower) BaseModel.__eq__
+    return type(old) is type(new) and old.__dict__ == new.__dict__
+
+
+def _field_changes(old: BaseModel, new: BaseModel) -> list[FieldChange]:
+    return [
+        FieldChange(field=name, old=old_value, new=new_value)
+        for name in type(new).model_fields
+        if (old_value := getattr(old, name)) != (new_value := getattr(new, name))
+    ]
+
+
+def diff_snapshots(old: Iterable[_M], new: Iterable[_M], key: str | None = None) -> SnapshotDiff[_M]:
+    """
+    Compare two snapshots of records and return what was inserted, updated and deleted.
+
+    Both snapshots are indexed by their natural key in a dict, so the diff takes linear time.
+    Records with an unchanged key are compared by their field values and only the changed
+    ones are compared field by field.
+
+    Args:
+        old: The earlier snapshot, e.g. the result of a previous get_absences() call
+        new: The current snapshot
+        key: Attribute identifying a record; defaults to the natural key of the model
+            (`id` for Absence, WorktimeEntry, Project and Service, `user_id` for User)
+
+    Returns:
+        SnapshotDiff with the inserted and updated records in the order of `new`, and the
+        deleted records in the order of `old`
+
+    Raises:
+        ValueError: If a snapshot contains a key twice, or no key is known for the model
+    """
+    key, old_index = _index(old, key)
+    _, new_index = _index(new, key)
+    inserted: list[_M] = []
+    updated: list[RecordUpdate[_M]] = []
+    for record_key, new_record in new_index.items():
+        old_record = old_index.get(record_key)
+        if old_record is None:
+            inserted.append(new_record)
+        elif not _same_content(old_record, new_record):
+            updated.append(
+                RecordUpdate(
+                    key=record_key, old=old_record, new=new_record, changes=_field_changes(old_record, new_record)
+                )
+            )
+    deleted = [old_record for record_key, old_record in old_index.items() if record_key not in new_index]
+    return SnapshotDiff(inserted=inserted, updated=updated, deleted=deleted)
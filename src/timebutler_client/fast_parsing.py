@@ -0,0 +1,457 @@
+"""
+Fast parsers for trusted Timebutler CSV responses.
+
+These parsers produce the same models as the strict parsers of TimebutlerClient, but
+resolve the column positions once from the header, read rows as plain tuples, convert
+fields by hand and build the models like model_construct() does, i.e. without running the
+Pydantic validators. Malformed numbers, dates or missing columns still raise
+KeyError/ValueError, which the client turns into TimebutlerParseError; values
+that would merely fail a validator (e.g. an employee number with letters) are taken as-is.
+
+parse_worktime_table() reads the /worktime response straight into a columnar WorktimeTable
+without building any model.
+"""
+
+import csv
+import re
+from collections.abc import Callable, Iterator
+from datetime import date, time
+from decimal import Decimal
+from io import StringIO
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from timebutler_client.exceptions import TimebutlerParseError
+from timebutler_client.models import (
+    Absence,
+    InvalidEmployee,
+    Project,
+    Service,
+    User,
+    WorkdaySchedule,
+    WorktimeEntry,
+    WorktimeTable,
+)
+from timebutler_client.models.absence import _parse_european_date
+from timebutler_client.models.workdays import UNLIMITED_DATE
+from timebutler_client.models.worktime import _parse_hhmm_time
+
+__all__ = [
+    "parse_absences_csv",
+    "parse_projects_csv",
+    "parse_services_csv",
+    "parse_users_csv",
+    "parse_workdays_csv",
+    "parse_worktime_csv",
+    "parse_worktime_table",
+]
+
+_EMPLOYEE_NUMBER_PATTERN = re.compile(r"^\d+$")
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_object_setattr = object.__setattr__
+#: The instance attributes of pydantic models that _constructor() sets.
+_PYDANTIC_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+
+
+def _constructor(model: type[_ModelT]) -> Callable[..., _ModelT]:
+    """
+    Return a function that builds `model` instances from keyword arguments without validation.
+
+    This sets the same instance attributes as model_construct(), minus its per-call handling of
+    defaults, aliases and extra fields: callers must pass every field, already converted to its
+    final type. model_construct() itself is returned if the model has private attributes or
+    extra fields, or if the installed pydantic lays out instances differently.
+    """
+    if (
+        BaseModel.__slots__ != _PYDANTIC_SLOTS
+        or model.__private_attributes__
+        or model.model_config.get("extra") == "allow"
+    ):
+        return model.model_construct
+    field_names = frozenset(model.model_fields)
+    new = model.__new__
+
+    def _construct(**values: Any) -> _ModelT:
+        instance = new(model)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", set(field_names))
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
+    return _construct
+
+
+class _Columns:
+    """Column positions resolved from the header line of a CSV response."""
+
+    def __init__(self, header: list[str]) -> None:
+        self._positions = {name: i for i, name in enumerate(header)}
+        self.width = len(header) + 1  # rows are padded by one empty cell that missing optional columns point to
+
+    def required(self, name: str) -> int:
+        """Position of a column that must be present (raises KeyError otherwise)."""
+        return self._positions[name]
+
+    def optional(self, name: str) -> int:
+        """Position of a column that may be missing; missing columns read as empty strings."""
+        return self._positions.get(name, self.width - 1)
+
+
+def _rows(csv_text: str) -> tuple[_Columns, Iterator[list[str]]] | None:
+    """Split a CSV response into its resolved header and an iterator over the non-empty data rows, cut to its width."""
+    reader = csv.reader(StringIO(csv_text), delimiter=";")
+    header = next(reader, None)
+    if header is None:
+        return None
+    columns = _Columns(header)
+    width = columns.width
+
+    def _padded() -> Iterator[list[str]]:
+        for row in reader:
+            if row:
+                if len(row) >= width:
+                    del row[width - 1 :]  # cells beyond the header are ignored, as by csv.DictReader
+                row.extend([""] * (width - len(row)))
+                yield row
+
+    return columns, _padded()
+
+
+class _DateCache(dict[str, date]):
+    """Maps dd/mm/yyyy strings to dates; a plain dict lookup is cheaper than calling the cached parser."""
+
+    def __missing__(self, value: str) -> date:
+        result = self[value] = _parse_european_date(value)
+        return result
+
+
+class _TimeCache(dict[str, time]):
+    """Maps HH:MM strings to times; a plain dict lookup is cheaper than calling the cached parser."""
+
+    def __missing__(self, value: str) -> time:
+        result = self[value] = _parse_hhmm_time(value)
+        return result
+
+
+def parse_worktime_csv(csv_text: str) -> list[WorktimeEntry]:
+    """Parse the /worktime response into WorktimeEntry models without validation."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return []
+    columns, rows = parsed
+    i_id = columns.required("ID of the work time entry")
+    i_user = columns.required("User ID")
+    i_employee = columns.required("Employee number")
+    i_date = columns.required("Date (dd/mm/yyyy)")
+    i_start = columns.required("Start time (hh:mm)")
+    i_end = columns.required("End time (hh:mm)")
+    i_working = columns.required("Working time in seconds")
+    i_pause = columns.optional("Pause in seconds")
+    i_state = columns.required("State")
+    i_project = columns.optional("ID of the project")
+    i_service = columns.optional("ID of the service")
+    i_comments = columns.optional("Comments")
+    i_auto_stopped = columns.optional("Auto stopped")
+    dates = _DateCache()
+    times = _TimeCache()
+    construct = _constructor(WorktimeEntry)
+    return [
+        construct(
+            id=int(row[i_id]),
+            user_id=int(row[i_user]),
+            employee_number=row[i_employee],
+            date=dates[row[i_date]],
+            start_time=times[row[i_start]],
+            end_time=times[row[i_end]],
+            working_time_seconds=int(row[i_working]),
+            pause_seconds=int(row[i_pause]) if row[i_pause] else 0,
+            state=row[i_state],
+            project_id=int(row[i_project]) if row[i_project] else 0,
+            service_id=int(row[i_service]) if row[i_service] else 0,
+            comments=row[i_comments].strip() or None,
+            auto_stopped=row[i_auto_stopped].lower() == "true",
+        )
+        for row in rows
+    ]
+
+
+def parse_worktime_table(csv_text: str) -> WorktimeTable:
+    """
+    Parse the /worktime response into a WorktimeTable.
+
+    Unlike the other parsers in this module, employee numbers are validated, once per distinct value.
+    """
+    table = WorktimeTable()
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return table
+    columns, rows = parsed
+    i_id = columns.required("ID of the work time entry")
+    i_user = columns.required("User ID")
+    i_employee = columns.required("Employee number")
+    i_date = columns.required("Date (dd/mm/yyyy)")
+    i_start = columns.required("Start time (hh:mm)")
+    i_end = columns.required("End time (hh:mm)")
+    i_working = columns.required("Working time in seconds")
+    i_pause = columns.optional("Pause in seconds")
+    i_state = columns.required("State")
+    i_project = columns.optional("ID of the project")
+    i_service = columns.optional("ID of the service")
+    i_comments = columns.optional("Comments")
+    i_auto_stopped = columns.optional("Auto stopped")
+    ordinals: dict[str, int] = {}
+    minutes: dict[str, int] = {}
+    valid_employee_numbers: set[str] = set()
+    append_row = table.append_row
+    for row in rows:
+        employee_number = row[i_employee]
+        if employee_number not in valid_employee_numbers:
+            if not _EMPLOYEE_NUMBER_PATTERN.match(employee_number):
+                raise ValueError(f"Employee number must consist of digits only, got: {employee_number!r}")
+            valid_employee_numbers.add(employee_number)
+        day, start, end = row[i_date], row[i_start], row[i_end]
+        if day not in ordinals:
+            ordinals[day] = _parse_european_date(day).toordinal()
+        for value in (start, end):
+            if value not in minutes:
+                parsed_time = _parse_hhmm_time(value)
+                minutes[value] = parsed_time.hour * 60 + parsed_time.minute
+        append_row(
+            entry_id=int(row[i_id]),
+            user_id=int(row[i_user]),
+            employee_number=employee_number,
+            date_ordinal=ordinals[day],
+            start_minute=minutes[start],
+            end_minute=minutes[end],
+            working_time_seconds=int(row[i_working]),
+            pause_seconds=int(row[i_pause]) if row[i_pause] else 0,
+            state=row[i_state],
+            project_id=int(row[i_project]) if row[i_project] else 0,
+            service_id=int(row[i_service]) if row[i_service] else 0,
+            comments=row[i_comments].strip() or None,
+            auto_stopped=row[i_auto_stopped].lower() == "true",
+        )
+    return table
+
+
+def parse_absences_csv(csv_text: str) -> list[Absence]:
+    """Parse the /absences response into Absence models without validation."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return []
+    columns, rows = parsed
+    i_id = columns.required("ID")
+    i_from = columns.required("From")
+    i_to = columns.required("To")
+    i_employee = columns.required("Employee number")
+    i_user = columns.optional("User ID")
+    i_half_day = columns.optional("Half a day")
+    i_morning = columns.optional("Morning")
+    i_type = columns.optional("Type")
+    i_extra = columns.optional("Extra vacation day")
+    i_state = columns.optional("State")
+    i_substitute_state = columns.optional("Substitute state")
+    i_workdays = columns.optional("Workdays")
+    i_hours = columns.optional("Hours")
+    i_certificate = columns.optional("Medical certificate (sick leave only)")
+    i_comments = columns.optional("Comments")
+    i_substitute = columns.optional("User ID of the substitute")
+    dates = _DateCache()
+    construct = _constructor(Absence)
+    return [
+        construct(
+            id=int(row[i_id]),
+            from_date=dates[row[i_from]],
+            to_date=dates[row[i_to]],
+            employee_number=row[i_employee],
+            user_id=int(row[i_user]) if row[i_user] else 0,
+            half_day=row[i_half_day].lower() == "true",
+            morning=row[i_morning].lower() == "true",
+            absence_type=row[i_type],
+            extra_vacation=row[i_extra].lower() == "true",
+            state=row[i_state],
+            substitute_state=row[i_substitute_state],
+            workdays=Decimal(row[i_workdays]) if row[i_workdays] else Decimal("0"),
+            hours=Decimal(row[i_hours]) if row[i_hours] else Decimal("0"),
+            medical_certificate=row[i_certificate].strip() or None,
+            comments=row[i_comments].strip() or None,
+            substitute_user_id=int(row[i_substitute]) if row[i_substitute] else 0,
+        )
+        for row in rows
+    ]
+
+
+def parse_projects_csv(csv_text: str) -> list[Project]:
+    """Parse the /projects response into Project models without validation."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return []
+    columns, rows = parsed
+    i_id = columns.required("ID of the project")
+    i_name = columns.required("Name")
+    i_state = columns.required("State")
+    i_budget = columns.optional("Budget in hours")
+    i_comments = columns.optional("Comments")
+    i_created = columns.required("Creation date")
+    dates = _DateCache()
+    construct = _constructor(Project)
+    return [
+        construct(
+            id=int(row[i_id]),
+            name=row[i_name],
+            state=row[i_state],
+            budget_hours=int(row[i_budget]) if row[i_budget] else 0,
+            comments=row[i_comments].strip() or None,
+            creation_date=dates[row[i_created]],
+        )
+        for row in rows
+    ]
+
+
+def parse_services_csv(csv_text: str) -> list[Service]:
+    """Parse the /services response into Service models without validation."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return []
+    columns, rows = parsed
+    i_id = columns.required("ID of the service")
+    i_name = columns.required("Name")
+    i_state = columns.required("State")
+    i_billable = columns.optional("Billable")
+    i_comments = columns.optional("Comments")
+    i_created = columns.required("Creation date")
+    dates = _DateCache()
+    construct = _constructor(Service)
+    return [
+        construct(
+            id=int(row[i_id]),
+            name=row[i_name],
+            state=row[i_state],
+            billable=row[i_billable].lower() == "true",
+            comments=row[i_comments].strip() or None,
+            creation_date=dates[row[i_created]],
+        )
+        for row in rows
+    ]
+
+
+def parse_users_csv(csv_text: str) -> tuple[list[User], list[InvalidEmployee]]:
+    """Parse the /users response into User models without validation; see TimebutlerClient._parse_users_csv."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return [], []
+    columns, rows = parsed
+    i_user = columns.required("User ID")
+    i_last = columns.required("Last name")
+    i_first = columns.required("First name")
+    i_employee = columns.optional("Employee number")
+    i_email = columns.optional("E-mail address")
+    i_phone = columns.optional("Phone")
+    i_mobile = columns.optional("Mobile phone")
+    i_cost_center = columns.optional("Cost center")
+    i_branch = columns.optional("Branch office")
+    i_department = columns.optional("Department")
+    i_type = columns.optional("User type")
+    i_language = columns.optional("Language")
+    i_managers = columns.optional("User ID list of the user's manager")
+    i_locked = columns.optional("User account locked")
+    i_info = columns.optional("Additional Information")
+    i_entry = columns.optional("Date of entry (dd/mm/yyyy)")
+    i_separation = columns.optional("Date of separation from company (dd/mm/yyyy)")
+    i_birth = columns.optional("Day of birth (dd/mm/yyyy)")
+    dates = _DateCache()
+    construct = _constructor(User)
+    users: list[User] = []
+    invalid_employees: list[InvalidEmployee] = []
+    for row in rows:
+        employee_number = row[i_employee].strip()
+        if not _EMPLOYEE_NUMBER_PATTERN.match(employee_number):
+            raw_user_id = row[i_user].strip()
+            invalid_employees.append(
+                InvalidEmployee(
+                    user_id=int(raw_user_id) if raw_user_id.isdigit() else None,
+                    first_name=row[i_first].strip(),
+                    last_name=row[i_last].strip(),
+                    raw_employee_number=employee_number,
+                )
+            )
+            continue
+        entry, separation, birth = row[i_entry].strip(), row[i_separation].strip(), row[i_birth].strip()
+        managers = row[i_managers]
+        users.append(
+            construct(
+                user_id=int(row[i_user]),
+                last_name=row[i_last],
+                first_name=row[i_first],
+                employee_number=employee_number,
+                email=row[i_email].strip(),
+                phone=row[i_phone].strip(),
+                mobile_phone=row[i_mobile].strip(),
+                cost_center=row[i_cost_center].strip(),
+                branch_office=row[i_branch].strip(),
+                department=row[i_department].strip(),
+                user_type=row[i_type].strip() or None,
+                language=row[i_language].strip(),
+                manager_user_ids=tuple(int(uid) for uid in managers.split(",") if uid.strip()) if managers else (),
+                account_locked=row[i_locked].lower() == "true",
+                additional_information=row[i_info].strip(),
+                date_of_entry=dates[entry] if entry else None,
+                date_of_separation=dates[separation] if separation else None,
+                date_of_birth=dates[birth] if birth else None,
+            )
+        )
+    return users, invalid_employees
+
+
+def parse_workdays_csv(
+    csv_text: str,
+    employee_number_map: dict[int, str],
+    skip_user_ids: set[int] | None = None,
+    *,
+    skip_unknown_users: bool = False,
+) -> list[WorkdaySchedule]:
+    """Parse the /workdays response into WorkdaySchedule models without validation."""
+    parsed = _rows(csv_text)
+    if parsed is None:
+        return []
+    columns, rows = parsed
+    i_user = columns.required("User ID")
+    i_valid_from = columns.required("Valid from (dd/mm/yyyy)")
+    i_weekdays = [
+        columns.optional(f"{weekday} working time in minutes")
+        for weekday in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+    ]
+    i_holiday_set = columns.optional("ID of the holiday set")
+    dates = _DateCache()
+    dates["unlimited"] = UNLIMITED_DATE
+    construct = _constructor(WorkdaySchedule)
+    skip = skip_user_ids or set()
+    schedules: list[WorkdaySchedule] = []
+    for row in rows:
+        user_id = int(row[i_user])
+        if user_id in skip:
+            continue
+        employee_number = employee_number_map.get(user_id)
+        if employee_number is None:
+            if skip_unknown_users:
+                continue
+            raise TimebutlerParseError(f"No user found for user ID {user_id} in users response")
+        minutes = [int(row[i]) if row[i] else 0 for i in i_weekdays]
+        schedules.append(
+            construct(
+                user_id=user_id,
+                valid_from=dates[row[i_valid_from].strip().lower()],
+                employee_number=employee_number,
+                monday_minutes=minutes[0],
+                tuesday_minutes=minutes[1],
+                wednesday_minutes=minutes[2],
+                thursday_minutes=minutes[3],
+                friday_minutes=minutes[4],
+                saturday_minutes=minutes[5],
+                sunday_minutes=minutes[6],
+                holiday_set_id=int(row[i_holiday_set]) if row[i_holiday_set] else 0,
+            )
+        )
+    return schedules
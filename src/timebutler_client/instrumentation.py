@@ -0,0 +1,323 @@
+"""Per-request timings of TimebutlerClient calls, and histograms to aggregate them."""
+
+import bisect
+import math
+import time
+from collections.abc import Iterable, Sequence, Sized
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Literal
+
+import aiohttp
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "BYTES_BUCKETS",
+    "ROWS_BUCKETS",
+    "SECONDS_BUCKETS",
+    "Histogram",
+    "HistogramInstrumentation",
+    "Instrumentation",
+    "ParseTimings",
+    "RequestTimings",
+    "create_trace_config",
+]
+
+#: Default histogram bounds for durations, in seconds.
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+#: Default histogram bounds for response sizes, in bytes (1 KiB to 256 MiB).
+BYTES_BUCKETS = tuple(float(1024 * 4**power) for power in range(10))
+#: Default histogram bounds for row counts.
+ROWS_BUCKETS = (10.0, 100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+
+#: Key of the RequestTrace in the trace_request_ctx that the client passes to aiohttp.
+_TRACE_KEY = "timebutler"
+
+RequestMetric = Literal["dns_seconds", "connect_seconds", "ttfb_seconds", "download_seconds", "body_bytes"]
+ParseMetric = Literal["rows", "parse_seconds"]
+
+
+class RequestTimings(BaseModel):
+    """
+    Timings of one HTTP attempt to an endpoint; a retried call reports one per attempt.
+
+    The phases follow each other: DNS lookup and connect (only for new connections, and only
+    if the session carries the trace config, see create_trace_config()), then the wait for
+    the response headers (ttfb_seconds, which includes DNS and connect), then the body download.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    endpoint: str = Field(description='Endpoint name, e.g. "worktime"')
+    attempt: int = Field(description="1 for the first attempt, 2 for the first retry, ...")
+    status: int | None = Field(description="HTTP status, None if no response was received")
+    error: str | None = Field(default=None, description="Class name of the exception the attempt failed with")
+    retry_after: int | None = Field(default=None, description="Retry-After of a 429 response, in seconds")
+    dns_seconds: float | None = Field(default=None, description="DNS lookup, None if no lookup was traced")
+    connect_seconds: float | None = Field(
+        default=None, description="Opening the connection (including TLS), None if none was opened or traced"
+    )
+    connection_reused: bool | None = Field(
+        default=None, description="Whether a pooled connection was reused, None if not traced"
+    )
+    ttfb_seconds: float | None = Field(default=None, description="From sending the request to the response headers")
+    download_seconds: float | None = Field(default=None, description="Reading the response body")
+    body_bytes: int = Field(default=0, description="Size of the downloaded body, 0 for error responses")
+
+
+class ParseTimings(BaseModel):
+    """
+    Timings of parsing one response body into models.
+
+    The rows are counted on the parser's result, so measuring adds no work to the parse itself.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    endpoint: str = Field(description='Endpoint name, e.g. "worktime"')
+    rows: int = Field(description="Models the body was parsed into (without rows the parser skipped), 0 on errors")
+    parse_seconds: float = Field(description="Reading the CSV and constructing the models")
+    error: str | None = Field(default=None, description="Class name of the exception parsing failed with")
+
+
+class Instrumentation:
+    """
+    Receives the timings of the requests and parses of a TimebutlerClient.
+
+    Subclass it and override the hooks you need; both are called synchronously on the event loop,
+    so they should be quick. Coalesced calls report their shared request and parse once; responses
+    served from a response cache report no request, and cached parse results report no parse.
+    Streaming iter_* methods report nothing.
+
+    Example:
+        class SlowRequestLogger(Instrumentation):
+            def on_request(self, timings: RequestTimings) -> None:
+                if timings.ttfb_seconds and timings.ttfb_seconds > 5:
+                    logger.warning("/%s took %.1fs", timings.endpoint, timings.ttfb_seconds)
+
+        client = TimebutlerClient(api_key="your-api-key", instrumentation=SlowRequestLogger())
+    """
+
+    def on_request(self, timings: RequestTimings) -> None:
+        """Called after every HTTP attempt, successful or not."""
+
+    def on_parse(self, timings: ParseTimings) -> None:
+        """Called after a response body was parsed, or failed to parse."""
+
+
+@dataclass(slots=True)
+class RequestTrace:
+    """Mutable per-attempt record that the aiohttp trace callbacks and the client fill in."""
+
+    dns_started: float | None = None
+    dns_seconds: float | None = None
+    connect_started: float | None = None
+    connect_seconds: float | None = None
+    connection_reused: bool | None = None
+    status: int | None = None
+    ttfb_seconds: float | None = None
+
+    @property
+    def trace_request_ctx(self) -> dict[str, Any]:
+        """The value to pass as trace_request_ctx to aiohttp, so the trace config finds this record."""
+        return {_TRACE_KEY: self}
+
+
+def _row_count(result: object) -> int | None:
+    """The number of models a parser returned; parsers of /users return (users, invalid_employees)."""
+    if isinstance(result, tuple):
+        return sum(len(part) for part in result if isinstance(part, Sized))
+    return len(result) if isinstance(result, Sized) else None
+
+
+def _request_trace(context: SimpleNamespace) -> RequestTrace | None:
+    trace_request_ctx = context.trace_request_ctx
+    return trace_request_ctx.get(_TRACE_KEY) if trace_request_ctx else None
+
+
+async def _on_dns_start(_session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any) -> None:
+    if (trace := _request_trace(context)) is not None:
+        trace.dns_started = time.perf_counter()
+
+
+async def _on_dns_end(_session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any) -> None:
+    if (trace := _request_trace(context)) is not None and trace.dns_started is not None:
+        trace.dns_seconds = time.perf_counter() - trace.dns_started
+
+
+async def _on_connect_start(_session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any) -> None:
+    if (trace := _request_trace(context)) is not None:
+        trace.connect_started = time.perf_counter()
+
+
+async def _on_connect_end(_session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any) -> None:
+    if (trace := _request_trace(context)) is not None and trace.connect_started is not None:
+        trace.connect_seconds = time.perf_counter() - trace.connect_started
+        trace.connection_reused = False
+
+
+async def _on_connection_reused(_session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any) -> None:
+    if (trace := _request_trace(context)) is not None:
+        trace.connection_reused = True
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Create the aiohttp TraceConfig that reports DNS and connect times to the client's instrumentation.
+
+    Sessions the client creates itself carry it automatically if instrumentation is set. Add it
+    to a session you pass in to get these timings for it, too:
+
+        session = aiohttp.ClientSession(trace_configs=[create_trace_config()])
+
+    Requests that are not sent by an instrumented TimebutlerClient are ignored.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+    trace_config.on_connection_create_start.append(_on_connect_start)
+    trace_config.on_connection_create_end.append(_on_connect_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reused)
+    return trace_config
+
+
+class Histogram:
+    """
+    Counts of observed values in buckets with fixed upper bounds, plus their sum and count.
+
+    The buckets are cumulative as in Prometheus: bucket i counts the values <= bounds[i], and
+    a final +Inf bucket counts all values.
+    """
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        """
+        Create an empty histogram.
+
+        Args:
+            bounds: Upper bounds of the buckets, ascending; a +Inf bucket is added
+
+        Raises:
+            ValueError: If the bounds are empty or not strictly ascending
+        """
+        self.bounds = tuple(bounds)
+        if not self.bounds or any(low >= high for low, high in zip(self.bounds, self.bounds[1:], strict=False)):
+            raise ValueError(f"Histogram bounds must be strictly ascending, got {self.bounds}")
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @property
+    def buckets(self) -> list[tuple[float, int]]:
+        """(upper bound, cumulative count) of every bucket, ending with (inf, count)."""
+        result: list[tuple[float, int]] = []
+        cumulative = 0
+        for bound, count in zip((*self.bounds, math.inf), self._counts, strict=True):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile (0 to 1) by linear interpolation within its bucket, like Prometheus' histogram_quantile.
+
+        Returns NaN for an empty histogram, and the highest finite bound for values in the +Inf bucket.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        lower_bound, lower_count = 0.0, 0
+        for bound, cumulative in self.buckets:
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    return self.bounds[-1]
+                in_bucket = cumulative - lower_count
+                return lower_bound + (bound - lower_bound) * ((rank - lower_count) / in_bucket if in_bucket else 1)
+            lower_bound, lower_count = bound, cumulative
+        return self.bounds[-1]  # pragma: no cover  # the +Inf bucket always reaches the count
+
+    def to_dict(self) -> dict[str, Any]:
+        """The buckets (keyed by upper bound as string, "+Inf" last), sum and count, ready for JSON."""
+        return {
+            "buckets": {("+Inf" if math.isinf(bound) else repr(bound)): count for bound, count in self.buckets},
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class HistogramInstrumentation(Instrumentation):
+    """
+    Aggregates the timings of all calls into one histogram per endpoint and metric.
+
+    Durations are observed in seconds, body sizes in bytes, row counts as they are. DNS and
+    connect times are only observed for attempts that looked up a host or opened a connection.
+
+    Example:
+        instrumentation = HistogramInstrumentation()
+        client = TimebutlerClient(api_key="your-api-key", instrumentation=instrumentation)
+        ...
+        print(instrumentation.histogram("worktime", "ttfb_seconds").quantile(0.95))
+        json.dump(instrumentation.to_dict(), file)
+    """
+
+    def __init__(
+        self,
+        *,
+        seconds_buckets: Sequence[float] = SECONDS_BUCKETS,
+        bytes_buckets: Sequence[float] = BYTES_BUCKETS,
+        rows_buckets: Sequence[float] = ROWS_BUCKETS,
+    ) -> None:
+        """
+        Create an instrumentation without any observations.
+
+        Args:
+            seconds_buckets: Bucket bounds of the duration histograms
+            bytes_buckets: Bucket bounds of the body size histograms
+            rows_buckets: Bucket bounds of the row count histograms
+        """
+        self._bounds: dict[str, Sequence[float]] = {
+            "seconds": seconds_buckets,
+            "bytes": bytes_buckets,
+            "rows": rows_buckets,
+        }
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+
+    def histogram(self, endpoint: str, metric: RequestMetric | ParseMetric) -> Histogram:
+        """The histogram of a metric of an endpoint, empty if nothing was observed yet."""
+        key = (endpoint, metric)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self._bounds[metric.rsplit("_", 1)[-1]])
+        return histogram
+
+    def on_request(self, timings: RequestTimings) -> None:
+        """Observe the phases of an HTTP attempt."""
+        endpoint = timings.endpoint
+        if timings.dns_seconds is not None:
+            self.histogram(endpoint, "dns_seconds").observe(timings.dns_seconds)
+        if timings.connect_seconds is not None:
+            self.histogram(endpoint, "connect_seconds").observe(timings.connect_seconds)
+        if timings.ttfb_seconds is not None:
+            self.histogram(endpoint, "ttfb_seconds").observe(timings.ttfb_seconds)
+        if timings.download_seconds is not None:
+            self.histogram(endpoint, "download_seconds").observe(timings.download_seconds)
+            self.histogram(endpoint, "body_bytes").observe(timings.body_bytes)
+
+    def on_parse(self, timings: ParseTimings) -> None:
+        """Observe the row count and the parse time of a response."""
+        if timings.error is not None:
+            return
+        self.histogram(timings.endpoint, "rows").observe(timings.rows)
+        self.histogram(timings.endpoint, "parse_seconds").observe(timings.parse_seconds)
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """All histograms as {endpoint: {metric: histogram}}, see Histogram.to_dict()."""
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (endpoint, metric), histogram in sorted(self.histograms.items()):
+            result.setdefault(endpoint, {})[metric] = histogram.to_dict()
+        return result
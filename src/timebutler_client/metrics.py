@@ -0,0 +1,192 @@
+"""Client-side metrics of TimebutlerClient in the Prometheus text exposition format."""
+
+import math
+import os
+import tempfile
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from timebutler_client.instrumentation import SECONDS_BUCKETS, Histogram, Instrumentation, ParseTimings, RequestTimings
+
+__all__ = ["RETRY_AFTER_BUCKETS", "PrometheusMetrics"]
+
+#: Default histogram bounds for Retry-After values of 429 responses, in seconds.
+RETRY_AFTER_BUCKETS = (1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _status_class(timings: RequestTimings) -> str:
+    """The status class ("2xx" to "5xx") of a response, or "error" for an attempt that got no response."""
+    return f"{timings.status // 100}xx" if timings.status is not None else "error"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class PrometheusMetrics(Instrumentation):
+    """
+    Counts requests, retries, rate limiting, bytes, rows and parse errors per endpoint, and renders them for Prometheus.
+
+    Pass it as the client's instrumentation and expose render() however the service already does,
+    e.g. from an existing HTTP handler or via write_textfile() for the node_exporter textfile
+    collector; no metrics server and no prometheus_client dependency is needed:
+
+        metrics = PrometheusMetrics()
+        client = TimebutlerClient(api_key="your-api-key", instrumentation=metrics)
+        ...
+        metrics.write_textfile("/var/lib/node_exporter/timebutler.prom")
+
+    Every metric carries an `endpoint` label ("absences", "worktime", ...). The counters count
+    HTTP attempts, so a call that was retried twice counts as three requests and two retries.
+
+    Metrics (with the default namespace "timebutler_client"):
+        timebutler_client_requests_total{endpoint,status_class}: HTTP attempts by status class
+            ("2xx", "4xx", "5xx", or "error" for connection errors and timeouts)
+        timebutler_client_retries_total{endpoint}: attempts after the first one of a call
+        timebutler_client_rate_limited_total{endpoint}: 429 responses
+        timebutler_client_retry_after_seconds{endpoint}: histogram of the Retry-After of 429 responses
+        timebutler_client_received_bytes_total{endpoint}: body bytes of successful responses
+        timebutler_client_parsed_rows_total{endpoint}: data rows of the parsed responses
+        timebutler_client_parse_errors_total{endpoint}: responses that failed with TimebutlerParseError
+        timebutler_client_request_duration_seconds{endpoint}: histogram of the time from sending an
+            attempt to having read its body
+        timebutler_client_parse_duration_seconds{endpoint}: histogram of the time to parse a response
+    """
+
+    def __init__(
+        self,
+        namespace: str = "timebutler_client",
+        *,
+        duration_buckets: Sequence[float] = SECONDS_BUCKETS,
+        retry_after_buckets: Sequence[float] = RETRY_AFTER_BUCKETS,
+    ) -> None:
+        """
+        Create metrics without any observations.
+
+        Args:
+            namespace: Prefix of all metric names
+            duration_buckets: Bucket bounds of the request and parse duration histograms, in seconds
+            retry_after_buckets: Bucket bounds of the Retry-After histogram, in seconds
+        """
+        self.namespace = namespace
+        self._duration_buckets = tuple(duration_buckets)
+        self._retry_after_buckets = tuple(retry_after_buckets)
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.retries: Counter[str] = Counter()
+        self.rate_limited: Counter[str] = Counter()
+        self.received_bytes: Counter[str] = Counter()
+        self.parsed_rows: Counter[str] = Counter()
+        self.parse_errors: Counter[str] = Counter()
+        self.retry_after: dict[str, Histogram] = {}
+        self.request_duration: dict[str, Histogram] = {}
+        self.parse_duration: dict[str, Histogram] = {}
+
+    def on_request(self, timings: RequestTimings) -> None:
+        """Count an HTTP attempt."""
+        endpoint = timings.endpoint
+        self.requests[endpoint, _status_class(timings)] += 1
+        if timings.attempt > 1:
+            self.retries[endpoint] += 1
+        if timings.status == 429:
+            self.rate_limited[endpoint] += 1
+            if timings.retry_after is not None:
+                self._histogram(self.retry_after, endpoint, self._retry_after_buckets).observe(timings.retry_after)
+        self.received_bytes[endpoint] += timings.body_bytes
+        if timings.ttfb_seconds is not None:
+            duration = timings.ttfb_seconds + (timings.download_seconds or 0.0)
+            self._histogram(self.request_duration, endpoint, self._duration_buckets).observe(duration)
+
+    def on_parse(self, timings: ParseTimings) -> None:
+        """Count a parsed response."""
+        endpoint = timings.endpoint
+        if timings.error is not None:
+            self.parse_errors[endpoint] += 1
+            return
+        self.parsed_rows[endpoint] += timings.rows
+        self._histogram(self.parse_duration, endpoint, self._duration_buckets).observe(timings.parse_seconds)
+
+    @staticmethod
+    def _histogram(histograms: dict[str, Histogram], endpoint: str, bounds: Sequence[float]) -> Histogram:
+        histogram = histograms.get(endpoint)
+        if histogram is None:
+            histogram = histograms[endpoint] = Histogram(bounds)
+        return histogram
+
+    def _counter(self, name: str, help_text: str, samples: Iterable[tuple[str, float]]) -> list[str]:
+        """Lines of a counter; `samples` are (rendered labels, value)."""
+        metric = f"{self.namespace}_{name}"
+        lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        lines.extend(f"{metric}{labels} {_number(value)}" for labels, value in samples)
+        return lines
+
+    def _histograms(self, name: str, help_text: str, histograms: dict[str, Histogram]) -> list[str]:
+        """Lines of a histogram with one series per endpoint."""
+        metric = f"{self.namespace}_{name}"
+        lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for endpoint, histogram in sorted(histograms.items()):
+            for bound, count in histogram.buckets:
+                lines.append(f"{metric}_bucket{_labels(endpoint=endpoint, le=_number(bound))} {count}")
+            lines.append(f"{metric}_sum{_labels(endpoint=endpoint)} {_number(histogram.sum)}")
+            lines.append(f"{metric}_count{_labels(endpoint=endpoint)} {histogram.count}")
+        return lines
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4), ending with a newline."""
+
+        def _by_endpoint(counter: Counter[str]) -> list[tuple[str, float]]:
+            return [(_labels(endpoint=endpoint), value) for endpoint, value in sorted(counter.items())]
+
+        requests = [
+            (_labels(endpoint=endpoint, status_class=status_class), value)
+            for (endpoint, status_class), value in sorted(self.requests.items())
+        ]
+        lines = [
+            *self._counter("requests_total", "HTTP attempts to the Timebutler API by status class.", requests),
+            *self._counter("retries_total", "Retried HTTP attempts.", _by_endpoint(self.retries)),
+            *self._counter("rate_limited_total", "HTTP 429 responses.", _by_endpoint(self.rate_limited)),
+            *self._histograms("retry_after_seconds", "Retry-After of HTTP 429 responses in seconds.", self.retry_after),
+            *self._counter(
+                "received_bytes_total", "Body bytes of successful responses.", _by_endpoint(self.received_bytes)
+            ),
+            *self._counter("parsed_rows_total", "Data rows of parsed responses.", _by_endpoint(self.parsed_rows)),
+            *self._counter(
+                "parse_errors_total", "Responses that could not be parsed.", _by_endpoint(self.parse_errors)
+            ),
+            *self._histograms(
+                "request_duration_seconds",
+                "Time from sending an HTTP attempt to having read its body in seconds.",
+                self.request_duration,
+            ),
+            *self._histograms("parse_duration_seconds", "Time to parse a response in seconds.", self.parse_duration),
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write render() to a file atomically, e.g. for the node_exporter textfile collector.
+
+        The metrics are written to a temporary file in the same directory, which then replaces
+        `path`, so a scrape never sees a half-written file.
+        """
+        target = Path(path)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=target.parent, prefix=f".{target.name}.", delete=False
+        ) as file:
+            try:
+                file.write(self.render())
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        os.replace(file.name, target)
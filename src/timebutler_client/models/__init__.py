@@ -7,6 +7,7 @@ from timebutler_client.models.service import Service
 from timebutler_client.models.user import User
 from timebutler_client.models.workdays import WorkdaySchedule, WorkdaysResult
 from timebutler_client.models.worktime import WorktimeEntry
+from timebutler_client.models.worktime_table import WorktimeTable
 
 __all__ = [
     "Absence",
@@ -17,4 +18,5 @@ __all__ = [
     "WorkdaySchedule",
     "WorkdaysResult",
     "WorktimeEntry",
+    "WorktimeTable",
 ]
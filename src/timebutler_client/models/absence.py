@@ -2,6 +2,7 @@
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
@@ -14,12 +15,27 @@ _EMPLOYEE_NUMBER_PATTERN = r"^\d+$"
 EmployeeNumber = Annotated[str, Field(pattern=_EMPLOYEE_NUMBER_PATTERN)]
 
 
+@lru_cache(maxsize=8192)
+def _parse_european_date_string(value: str) -> date:
+    """
+    Parse a dd/mm/yyyy string.
+
+    Results are cached: a year of data only contains a few hundred distinct dates.
+    Zero-padded values are sliced directly; anything else goes through strptime.
+    """
+    if len(value) == 10 and value[2] == "/" and value[5] == "/" and value.isascii():
+        day, month, year = value[:2], value[3:5], value[6:]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return date(int(year), int(month), int(day))
+    return datetime.strptime(value, "%d/%m/%Y").date()
+
+
 def _parse_european_date(value: str | date) -> date:
     """Parse dd/mm/yyyy format strictly."""
     if isinstance(value, date):
         return value
     try:
-        return datetime.strptime(value, "%d/%m/%Y").date()
+        return _parse_european_date_string(value)
     except ValueError as e:
         raise ValueError(f"Date must be in dd/mm/yyyy format, got: {value!r}") from e
 
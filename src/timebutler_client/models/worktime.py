@@ -1,6 +1,7 @@
 """Worktime entry model for Timebutler API."""
 
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
@@ -10,12 +11,27 @@ from timebutler_client.models.absence import EmployeeNumber, EuropeanDate
 __all__ = ["HHMMTime", "WorktimeEntry"]
 
 
+@lru_cache(maxsize=2048)
+def _parse_hhmm_string(value: str) -> time:
+    """
+    Parse an HH:MM string.
+
+    Results are cached: there are only 1440 distinct minutes in a day.
+    Zero-padded values are sliced directly; anything else goes through strptime.
+    """
+    if len(value) == 5 and value[2] == ":" and value.isascii():
+        hours, minutes = value[:2], value[3:]
+        if hours.isdigit() and minutes.isdigit():
+            return time(int(hours), int(minutes))
+    return datetime.strptime(value, "%H:%M").time()
+
+
 def _parse_hhmm_time(value: str | time) -> time:
     """Parse HH:MM format strictly."""
     if isinstance(value, time):
         return value
     try:
-        return datetime.strptime(value, "%H:%M").time()
+        return _parse_hhmm_string(value)
     except ValueError as e:
         raise ValueError(f"Time must be in HH:MM format, got: {value!r}") from e
 
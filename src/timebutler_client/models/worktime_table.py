@@ -0,0 +1,212 @@
+"""Columnar (struct-of-arrays) container for worktime entries."""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, time
+from typing import overload
+
+from timebutler_client.models.worktime import WorktimeEntry
+
+__all__ = ["WorktimeTable"]
+
+
+class _StringColumn:
+    """Dictionary-encoded string column: each distinct value is stored once, rows hold its code."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.codes = array("i")
+        self._lookup: dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+
+class WorktimeTable(Sequence[WorktimeEntry]):
+    """
+    Worktime entries stored column by column in compact arrays.
+
+    Numeric fields live in array buffers, dates as proleptic Gregorian ordinals
+    (date.toordinal()) and times as minutes after midnight. Repeated strings
+    (employee numbers, states) are stored once per distinct value and comments
+    only for the rows that have one. Indexing materializes a WorktimeEntry on demand,
+    so the table can be used wherever a sequence of entries is expected, while
+    aggregations can work on the columns directly:
+
+        table = await client.get_worktime_table(year=2026, month=1)
+        total_hours = sum(table.working_time_seconds) / 3600
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.user_ids = array("q")
+        self.date_ordinals = array("i")
+        self.start_minutes = array("h")
+        self.end_minutes = array("h")
+        self.working_time_seconds = array("q")
+        self.pause_seconds = array("q")
+        self.project_ids = array("q")
+        self.service_ids = array("q")
+        self.auto_stopped = array("b")
+        self._employee_numbers = _StringColumn()
+        self._states = _StringColumn()
+        self._comments: dict[int, str] = {}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[WorktimeEntry]) -> "WorktimeTable":
+        """Build a table from WorktimeEntry models."""
+        table = cls()
+        for entry in entries:
+            table.append(entry)
+        return table
+
+    def append(self, entry: WorktimeEntry) -> None:
+        """Add a WorktimeEntry as the last row."""
+        self.append_row(
+            entry_id=entry.id,
+            user_id=entry.user_id,
+            employee_number=entry.employee_number,
+            date_ordinal=entry.date.toordinal(),
+            start_minute=entry.start_time.hour * 60 + entry.start_time.minute,
+            end_minute=entry.end_time.hour * 60 + entry.end_time.minute,
+            working_time_seconds=entry.working_time_seconds,
+            pause_seconds=entry.pause_seconds,
+            state=entry.state,
+            project_id=entry.project_id,
+            service_id=entry.service_id,
+            comments=entry.comments,
+            auto_stopped=entry.auto_stopped,
+        )
+
+    def append_row(
+        self,
+        *,
+        entry_id: int,
+        user_id: int,
+        employee_number: str,
+        date_ordinal: int,
+        start_minute: int,
+        end_minute: int,
+        working_time_seconds: int,
+        pause_seconds: int,
+        state: str,
+        project_id: int,
+        service_id: int,
+        comments: str | None,
+        auto_stopped: bool,
+    ) -> None:
+        """Add a row from already converted column values (used by parsers to skip building models)."""
+        if comments is not None:
+            self._comments[len(self.ids)] = comments
+        self.ids.append(entry_id)
+        self.user_ids.append(user_id)
+        self._employee_numbers.append(employee_number)
+        self.date_ordinals.append(date_ordinal)
+        self.start_minutes.append(start_minute)
+        self.end_minutes.append(end_minute)
+        self.working_time_seconds.append(working_time_seconds)
+        self.pause_seconds.append(pause_seconds)
+        self._states.append(state)
+        self.project_ids.append(project_id)
+        self.service_ids.append(service_id)
+        self.auto_stopped.append(auto_stopped)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> WorktimeEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "WorktimeTable": ...
+
+    def __getitem__(self, index: int | slice) -> "WorktimeEntry | WorktimeTable":
+        if isinstance(index, slice):
+            table = WorktimeTable()
+            for i in range(*index.indices(len(self))):
+                table.append_row(
+                    entry_id=self.ids[i],
+                    user_id=self.user_ids[i],
+                    employee_number=self._employee_numbers[i],
+                    date_ordinal=self.date_ordinals[i],
+                    start_minute=self.start_minutes[i],
+                    end_minute=self.end_minutes[i],
+                    working_time_seconds=self.working_time_seconds[i],
+                    pause_seconds=self.pause_seconds[i],
+                    state=self._states[i],
+                    project_id=self.project_ids[i],
+                    service_id=self.service_ids[i],
+                    comments=self._comments.get(i),
+                    auto_stopped=bool(self.auto_stopped[i]),
+                )
+            return table
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WorktimeTable index out of range")
+        start, end = self.start_minutes[index], self.end_minutes[index]
+        return WorktimeEntry.model_construct(
+            id=self.ids[index],
+            user_id=self.user_ids[index],
+            employee_number=self._employee_numbers[index],
+            date=date.fromordinal(self.date_ordinals[index]),
+            start_time=time(start // 60, start % 60),
+            end_time=time(end // 60, end % 60),
+            working_time_seconds=self.working_time_seconds[index],
+            pause_seconds=self.pause_seconds[index],
+            state=self._states[index],
+            project_id=self.project_ids[index],
+            service_id=self.service_ids[index],
+            comments=self._comments.get(index),
+            auto_stopped=bool(self.auto_stopped[index]),
+        )
+
+    def __iter__(self) -> Iterator[WorktimeEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"WorktimeTable(rows={len(self)})"
+
+    def employee_number(self, index: int) -> str:
+        """Employee number of the given row, without materializing the entry."""
+        return self._employee_numbers[index]
+
+    def employee_number_codes(self) -> tuple[memoryview, list[str]]:
+        """
+        The employee number column in its dictionary-encoded form, for vectorized aggregations.
+
+        Returns:
+            A read-only buffer of one int32 code per row (e.g. for numpy.frombuffer(codes, dtype=numpy.int32))
+            and the distinct employee numbers the codes index
+        """
+        return memoryview(self._employee_numbers.codes).toreadonly(), list(self._employee_numbers.values)
+
+    def state_codes(self) -> tuple[memoryview, list[str]]:
+        """
+        The state column in its dictionary-encoded form, for vectorized filters.
+
+        Returns:
+            A read-only buffer of one int32 code per row (e.g. for numpy.frombuffer(codes, dtype=numpy.int32))
+            and the distinct states the codes index
+        """
+        return memoryview(self._states.codes).toreadonly(), list(self._states.values)
+
+    def state(self, index: int) -> str:
+        """State of the given row, without materializing the entry."""
+        return self._states[index]
+
+    def comments(self, index: int) -> str | None:
+        """Comments of the given row, without materializing the entry."""
+        return self._comments.get(index)
+
+    def to_entries(self) -> list[WorktimeEntry]:
+        """Materialize all rows as WorktimeEntry models."""
+        return list(self)
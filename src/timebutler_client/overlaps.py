@@ -0,0 +1,134 @@
+"""Detection of overlapping worktime entries and of worktime recorded during absences."""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import timedelta
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from timebutler_client.models import Absence, WorktimeEntry
+
+__all__ = ["AbsenceConflict", "WorktimeOverlap", "find_overlapping_worktime", "find_worktime_during_absences"]
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+class WorktimeOverlap(BaseModel):
+    """Two worktime entries of the same user whose time spans overlap."""
+
+    model_config = ConfigDict(frozen=True)
+
+    first: WorktimeEntry = Field(description="The entry that starts first")
+    second: WorktimeEntry = Field(description="The entry that starts during the first one")
+    overlap: timedelta = Field(description="Length of the time both entries cover")
+
+
+class AbsenceConflict(BaseModel):
+    """A worktime entry on a day its employee was absent."""
+
+    model_config = ConfigDict(frozen=True)
+
+    entry: WorktimeEntry
+    absence: Absence
+
+
+def _span(entry: WorktimeEntry) -> tuple[int, int]:
+    """Start and end of an entry in minutes since 0001-01-01; entries ending before their start end the next day."""
+    start = entry.date.toordinal() * _MINUTES_PER_DAY + entry.start_time.hour * 60 + entry.start_time.minute
+    end = entry.date.toordinal() * _MINUTES_PER_DAY + entry.end_time.hour * 60 + entry.end_time.minute
+    if entry.end_time < entry.start_time:
+        end += _MINUTES_PER_DAY
+    return start, end
+
+
+def find_overlapping_worktime(entries: Iterable[WorktimeEntry]) -> list[WorktimeOverlap]:
+    """
+    Find pairs of worktime entries of the same user whose times overlap.
+
+    The entries of each user are sorted by start and swept once, keeping the entries that
+    are still running in a heap ordered by their end, so the search takes O(n log n) plus the
+    number of reported pairs. Entries that end before their start are taken to run past
+    midnight; entries that merely touch (one ends when the next starts) do not overlap.
+    Filter out entries you don't want to check (e.g. state "Rejected") before calling this.
+
+    Args:
+        entries: Worktime entries of any number of users
+
+    Returns:
+        The overlapping pairs, ordered by user ID and start of the second entry
+    """
+    by_user: defaultdict[int, list[tuple[int, int, WorktimeEntry]]] = defaultdict(list)
+    for entry in entries:
+        start, end = _span(entry)
+        if end > start:
+            by_user[entry.user_id].append((start, end, entry))
+
+    overlaps: list[WorktimeOverlap] = []
+    for user_id in sorted(by_user):
+        spans = sorted(by_user[user_id], key=lambda span: (span[0], span[1], span[2].id))
+        running: list[tuple[int, int, int]] = []  # (end, start, position in spans)
+        for position, (start, end, entry) in enumerate(spans):
+            while running and running[0][0] <= start:
+                heapq.heappop(running)
+            for other_end, other_start, other_position in sorted(running, key=lambda item: (item[1], item[2])):
+                overlaps.append(
+                    WorktimeOverlap.model_construct(  # the entries are validated models already
+                        first=spans[other_position][2],
+                        second=entry,
+                        overlap=timedelta(minutes=min(end, other_end) - max(start, other_start)),
+                    )
+                )
+            heapq.heappush(running, (end, start, position))
+    return overlaps
+
+
+def find_worktime_during_absences(
+    entries: Iterable[WorktimeEntry],
+    absences: Iterable[Absence],
+    *,
+    include_half_days: bool = False,
+) -> list[AbsenceConflict]:
+    """
+    Find worktime entries on days their employee was absent.
+
+    Entries and absences are matched by employee number, sorted by date and swept together,
+    keeping the absences that cover the current day in a heap ordered by their end date, so
+    the search takes O(n log n) plus the number of reported conflicts. Filter the absences
+    by state (e.g. only "Approved") before calling this.
+
+    Args:
+        entries: Worktime entries of any number of users
+        absences: Absences of any number of users
+        include_half_days: Also report entries on half-day absences; by default these are
+            skipped, as working the other half of the day is expected
+
+    Returns:
+        One conflict per entry and absence covering its date, ordered by employee number and date
+    """
+    absences_by_employee: defaultdict[str, list[Absence]] = defaultdict(list)
+    for absence in absences:
+        if include_half_days or not absence.half_day:
+            absences_by_employee[absence.employee_number].append(absence)
+    entries_by_employee: defaultdict[str, list[WorktimeEntry]] = defaultdict(list)
+    for entry in entries:
+        if entry.employee_number in absences_by_employee:
+            entries_by_employee[entry.employee_number].append(entry)
+
+    conflicts: list[AbsenceConflict] = []
+    for employee_number in sorted(entries_by_employee):
+        pending = sorted(absences_by_employee[employee_number], key=lambda absence: (absence.from_date, absence.id))
+        next_absence = 0
+        covering: list[tuple[int, int, Absence]] = []  # (to_date ordinal, position in pending, absence)
+        for entry in sorted(entries_by_employee[employee_number], key=lambda entry: (entry.date, entry.id)):
+            while next_absence < len(pending) and pending[next_absence].from_date <= entry.date:
+                absence = pending[next_absence]
+                heapq.heappush(covering, (absence.to_date.toordinal(), next_absence, absence))
+                next_absence += 1
+            while covering and covering[0][0] < entry.date.toordinal():
+                heapq.heappop(covering)
+            conflicts.extend(
+                AbsenceConflict.model_construct(entry=entry, absence=absence)
+                for _, _, absence in sorted(covering, key=lambda item: item[1])
+            )
+    return conflicts
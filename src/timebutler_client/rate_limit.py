@@ -0,0 +1,105 @@
+"""Client-side rate limiting for the Timebutler API."""
+
+import asyncio
+import time
+
+__all__ = ["RateLimiter"]
+
+
+class RateLimiter:
+    """
+    Async token bucket shared by all requests of a TimebutlerClient.
+
+    The bucket holds up to `burst` tokens and is refilled at `rate` tokens per second;
+    every request consumes one token and waits if none is available.
+
+    If `adaptive` is set, the rate is multiplied by `decrease_factor` (down to `min_rate`)
+    whenever the API answers with 429, and grows back by `recovery_step` per successful
+    request until the configured rate is reached again. Regardless of `adaptive`, a
+    Retry-After value reported by the client pauses the whole bucket for that long.
+
+    Example:
+        limiter = RateLimiter(rate=5, burst=10, adaptive=True)
+        client = TimebutlerClient(api_key="your-api-key", rate_limiter=limiter, max_concurrency=8)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        decrease_factor: float = 0.5,
+        recovery_step: float | None = None,
+    ) -> None:
+        """
+        Create a new rate limiter.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Maximum number of requests that may be sent back-to-back
+            adaptive: Shrink the rate on 429 responses and recover it on successful requests
+            min_rate: Lower bound for the adaptive rate (defaults to a tenth of `rate`)
+            decrease_factor: Factor applied to the current rate on every 429 response
+            recovery_step: Requests per second added back per successful request (defaults to `rate` / 20)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"Decrease factor must be between 0 and 1, got {decrease_factor}")
+        self.max_rate = rate
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step if recovery_step is not None else rate / 20
+        self._rate = rate
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self._rate:g}/{self.max_rate:g}, burst={self.burst}, adaptive={self.adaptive})"
+
+    @property
+    def rate(self) -> float:
+        """The current rate in requests per second (lower than configured after 429s in adaptive mode)."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and consume one token."""
+        async with self._lock:  # waiters are served in FIFO order
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Record a 429 response: pause for `retry_after` seconds and, if adaptive, shrink the rate."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        if self.adaptive:
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+
+    def on_success(self) -> None:
+        """Record a successful request; lets an adaptive rate recover towards the configured rate."""
+        if self.adaptive and self._rate < self.max_rate:
+            self._refill(time.monotonic())
+            self._rate = min(self.max_rate, self._rate + self.recovery_step)
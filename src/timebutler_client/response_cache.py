@@ -0,0 +1,201 @@
+"""Persistent on-disk cache for raw Timebutler responses."""
+
+import calendar
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from os import PathLike
+from typing import Any, TypeVar, cast
+from urllib.parse import urlencode
+
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ["CachedResponse", "SQLiteResponseCache"]
+
+_T = TypeVar("_T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    immutable INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class CachedResponse(BaseModel):
+    """A raw CSV response body as stored in a SQLiteResponseCache."""
+
+    model_config = ConfigDict(frozen=True)
+
+    endpoint: str
+    body: str
+    sha256: str
+    fetched_at: datetime
+    immutable: bool = False
+
+
+class SQLiteResponseCache:
+    """
+    Stores raw CSV responses in a local SQLite file, keyed by endpoint and form parameters.
+
+    Responses younger than `ttl` seconds (or the per-endpoint value in `endpoint_ttl`) are
+    served from the file without contacting Timebutler, which makes warm starts instant
+    and avoids a burst of requests when many workers restart at once. Every stored body
+    carries a SHA-256 hash; parse() reuses the parsed result for a body that was seen
+    before, so a refetch that returns unchanged data is not parsed again.
+
+    With `immutable_after`, /worktime responses for a month that ended longer ago than that
+    are stored as immutable and never fetched again (call invalidate() to force it).
+
+    Example:
+        cache = SQLiteResponseCache("timebutler-cache.sqlite3", ttl=600, immutable_after=timedelta(days=45))
+        client = TimebutlerClient(api_key="your-api-key", response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        ttl: float = 300.0,
+        endpoint_ttl: dict[str, float] | None = None,
+        immutable_after: timedelta | None = None,
+        parsed_cache_size: int = 32,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a throwaway cache)
+            ttl: Seconds a stored response is served without refetching
+            endpoint_ttl: Overrides of `ttl` per endpoint, e.g. {"users": 3600, "worktime": 60}
+            immutable_after: Store /worktime months as immutable once they ended longer ago than this;
+                None to always refetch them after the TTL
+            parsed_cache_size: Number of parsed results kept in memory by parse()
+            clock: Source of the current Unix time (time.time by default)
+        """
+        if ttl < 0:
+            raise ValueError(f"TTL must not be negative, got {ttl}")
+        self.ttl = ttl
+        self.endpoint_ttl = dict(endpoint_ttl or {})
+        self.immutable_after = immutable_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")  # lets several worker processes share the file
+            self._connection.execute(_SCHEMA)
+        self._parsed: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._parsed_cache_size = parsed_cache_size
+
+    def __repr__(self) -> str:
+        return f"SQLiteResponseCache(ttl={self.ttl:g}, immutable_after={self.immutable_after})"
+
+    @staticmethod
+    def _key(endpoint: str, params: dict[str, str] | None) -> str:
+        return f"{endpoint}?{urlencode(sorted((params or {}).items()))}"
+
+    def get(self, endpoint: str, params: dict[str, str] | None = None) -> CachedResponse | None:
+        """Return the stored response for the request, fresh or not, or None if there is none."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, sha256, fetched_at, immutable FROM responses WHERE key = ?",
+                (self._key(endpoint, params),),
+            ).fetchone()
+        if row is None:
+            return None
+        body, digest, fetched_at, immutable = row
+        return CachedResponse(
+            endpoint=endpoint,
+            body=body,
+            sha256=digest,
+            fetched_at=datetime.fromtimestamp(fetched_at, tz=UTC),
+            immutable=bool(immutable),
+        )
+
+    def get_fresh(self, endpoint: str, params: dict[str, str] | None = None) -> str | None:
+        """Return the stored body if it is immutable or younger than the endpoint's TTL, else None."""
+        response = self.get(endpoint, params)
+        if response is None:
+            return None
+        if response.immutable:
+            return response.body
+        age = self._clock() - response.fetched_at.timestamp()
+        return response.body if age < self.endpoint_ttl.get(endpoint, self.ttl) else None
+
+    def put(self, endpoint: str, params: dict[str, str] | None, body: str) -> CachedResponse:
+        """
+        Store a freshly fetched response body.
+
+        Returns:
+            The stored response, with its content hash and whether it is immutable
+        """
+        now = self._clock()
+        response = CachedResponse(
+            endpoint=endpoint,
+            body=body,
+            sha256=hashlib.sha256(body.encode()).hexdigest(),
+            fetched_at=datetime.fromtimestamp(now, tz=UTC),
+            immutable=self._is_immutable(endpoint, params, now),
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, sha256, fetched_at, immutable)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(endpoint, params), endpoint, body, response.sha256, now, int(response.immutable)),
+            )
+        return response
+
+    def _is_immutable(self, endpoint: str, params: dict[str, str] | None, now: float) -> bool:
+        """Whether the request is for a /worktime month that ended longer ago than immutable_after."""
+        if self.immutable_after is None or endpoint != "worktime" or not params:
+            return False
+        if "year" not in params or "month" not in params:
+            return False
+        year, month = int(params["year"]), int(params["month"])
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+        return date.fromtimestamp(now) - month_end > self.immutable_after
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Delete the stored responses of an endpoint, or of all endpoints if none is given."""
+        with self._lock, self._connection:
+            if endpoint is None:
+                self._connection.execute("DELETE FROM responses")
+            else:
+                self._connection.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+        self._parsed.clear()
+
+    def parse(self, kind: str, body: str, parse: Callable[[str], _T]) -> _T:
+        """
+        Parse a response body, reusing the result if a body with the same hash was parsed before.
+
+        Args:
+            kind: Distinguishes parsers that produce different results from the same body
+            body: The CSV response body
+            parse: Parser to call for a body that has not been seen before
+
+        Returns:
+            The parsed result; callers must not modify it, as it may be shared
+        """
+        key = (kind, hashlib.sha256(body.encode()).hexdigest())
+        if key in self._parsed:
+            self._parsed.move_to_end(key)
+            return cast(_T, self._parsed[key])
+        result = parse(body)
+        self._parsed[key] = result
+        if len(self._parsed) > self._parsed_cache_size:
+            self._parsed.popitem(last=False)
+        return result
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,51 @@
+"""Retry policy for transient Timebutler API errors."""
+
+import random
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = ["RetryPolicy"]
+
+
+class RetryPolicy(BaseModel):
+    """
+    Configures how TimebutlerClient retries rate-limited (429) and failed (5xx) requests.
+
+    The n-th retry waits initial_backoff * backoff_multiplier ** (n - 1) seconds, capped at
+    max_backoff and reduced by a random jitter. If the server sent a Retry-After header, the
+    client waits at least that long. No retry is started if it would exceed the deadline.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(default=3, ge=1, description="Total number of attempts, including the first one")
+    initial_backoff: float = Field(default=0.5, ge=0, description="Delay before the first retry in seconds")
+    backoff_multiplier: float = Field(default=2.0, ge=1, description="Factor by which the delay grows per retry")
+    max_backoff: float = Field(default=30.0, ge=0, description="Upper bound for the computed backoff in seconds")
+    jitter: float = Field(
+        default=0.5, ge=0, le=1, description="Fraction of the backoff that is randomized (0 = no jitter)"
+    )
+    deadline: float | None = Field(
+        default=60.0, gt=0, description="Total time budget in seconds for all attempts, None for no budget"
+    )
+    respect_retry_after: bool = Field(default=True, description="Wait at least as long as the Retry-After header")
+    retry_on_connection_errors: bool = Field(
+        default=True, description="Also retry on connection errors and timeouts, not just on 429/5xx"
+    )
+
+    def backoff(self, retry_number: int, retry_after: int | None = None) -> float:
+        """
+        Compute the delay in seconds before the given retry (1 = first retry).
+
+        Args:
+            retry_number: Number of the upcoming retry, starting at 1
+            retry_after: Value of the Retry-After header, if the server sent one
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.initial_backoff * self.backoff_multiplier ** (retry_number - 1))
+        delay -= delay * self.jitter * random.random()
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, float(retry_after))
+        return delay
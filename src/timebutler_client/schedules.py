@@ -0,0 +1,146 @@
+"""Lookup of the workday schedule in effect for a user on a given date."""
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import date
+from itertools import groupby
+from operator import attrgetter
+
+from timebutler_client.models import WorkdaySchedule, WorkdaysResult
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+__all__ = ["ScheduleIndex"]
+
+#: Ordinal used for UNLIMITED_DATE, below any real date, so "unlimited" schedules also cover dates before 1900.
+_UNLIMITED_ORDINAL = 0
+
+
+def _weekday_minutes(schedule: WorkdaySchedule) -> tuple[int, int, int, int, int, int, int]:
+    return (
+        schedule.monday_minutes,
+        schedule.tuesday_minutes,
+        schedule.wednesday_minutes,
+        schedule.thursday_minutes,
+        schedule.friday_minutes,
+        schedule.saturday_minutes,
+        schedule.sunday_minutes,
+    )
+
+
+class _UserSchedules:
+    """The schedules of one user, sorted by valid_from, with the start dates as ordinals for bisect."""
+
+    __slots__ = ("minutes", "schedules", "starts")
+
+    def __init__(self, schedules: list[WorkdaySchedule]) -> None:
+        self.schedules = schedules
+        self.starts = [
+            _UNLIMITED_ORDINAL if schedule.valid_from == UNLIMITED_DATE else schedule.valid_from.toordinal()
+            for schedule in schedules
+        ]
+        self.minutes = [_weekday_minutes(schedule) for schedule in schedules]
+
+    def position(self, ordinal: int) -> int:
+        """Index of the schedule in effect on the day, or -1 if the day is before the first schedule."""
+        return bisect_right(self.starts, ordinal) - 1
+
+
+class ScheduleIndex:
+    """
+    Resolves which WorkdaySchedule applies to a user on a date.
+
+    Each schedule entry is valid from its valid_from until the next entry of the same user
+    (see WorkdaySchedule). The index sorts the entries per user once and finds the entry for
+    a date by binary search, so a lookup takes O(log k) for a user with k entries. Entries
+    starting "unlimited" (UNLIMITED_DATE) apply to every date before the next entry. If a user
+    has several entries with the same valid_from, the last one wins.
+
+    Example:
+        index = ScheduleIndex.from_result(await client.get_workdays())
+        minutes = index.minutes_at(user_id=928812, day=date(2026, 1, 5))
+    """
+
+    def __init__(self, schedules: Iterable[WorkdaySchedule]) -> None:
+        """
+        Build the index.
+
+        Args:
+            schedules: Workday schedules of any number of users, in any order
+        """
+        by_user = sorted(schedules, key=attrgetter("user_id"))  # stable, keeps the input order per user
+        self._users: dict[int, _UserSchedules] = {}
+        for user_id, user_schedules in groupby(by_user, key=attrgetter("user_id")):
+            latest: dict[date, WorkdaySchedule] = {}
+            for schedule in user_schedules:
+                latest[schedule.valid_from] = schedule
+            self._users[user_id] = _UserSchedules([latest[valid_from] for valid_from in sorted(latest)])
+
+    @classmethod
+    def from_result(cls, result: WorkdaysResult) -> "ScheduleIndex":
+        """Build the index from the result of TimebutlerClient.get_workdays()."""
+        return cls(result.schedules)
+
+    def __repr__(self) -> str:
+        return f"ScheduleIndex(users={len(self._users)})"
+
+    def __len__(self) -> int:
+        """Number of users with at least one schedule."""
+        return len(self._users)
+
+    def __contains__(self, user_id: object) -> bool:
+        """Whether the user has at least one schedule."""
+        return user_id in self._users
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the IDs of the users with schedules."""
+        return iter(self._users)
+
+    def history(self, user_id: int) -> list[WorkdaySchedule]:
+        """All schedules of a user, sorted by valid_from (empty if the user has none)."""
+        user = self._users.get(user_id)
+        return list(user.schedules) if user is not None else []
+
+    def schedule_at(self, user_id: int, day: date) -> WorkdaySchedule | None:
+        """
+        Return the schedule in effect for a user on a day.
+
+        Returns:
+            The schedule, or None if the user has no schedule starting on or before the day
+        """
+        user = self._users.get(user_id)
+        if user is None:
+            return None
+        position = user.position(day.toordinal())
+        return user.schedules[position] if position >= 0 else None
+
+    def schedules_at(self, user_id: int, days: Iterable[date]) -> list[WorkdaySchedule | None]:
+        """Return the schedule in effect for a user on each of the days (see schedule_at())."""
+        user = self._users.get(user_id)
+        if user is None:
+            return [None for _ in days]
+        positions = (user.position(day.toordinal()) for day in days)
+        return [user.schedules[position] if position >= 0 else None for position in positions]
+
+    def minutes_at(self, user_id: int, day: date) -> int:
+        """
+        Return the target working time of a user on a day, according to the schedule in effect.
+
+        Returns:
+            Minutes for the day's weekday, or 0 if no schedule applies
+        """
+        user = self._users.get(user_id)
+        if user is None:
+            return 0
+        position = user.position(day.toordinal())
+        return user.minutes[position][day.weekday()] if position >= 0 else 0
+
+    def minutes_on(self, user_id: int, days: Iterable[date]) -> list[int]:
+        """Return the target working time of a user on each of the days (see minutes_at())."""
+        user = self._users.get(user_id)
+        if user is None:
+            return [0 for _ in days]
+        result: list[int] = []
+        for day in days:
+            position = user.position(day.toordinal())
+            result.append(user.minutes[position][day.weekday()] if position >= 0 else 0)
+        return result
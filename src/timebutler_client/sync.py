@@ -0,0 +1,223 @@
+"""Incremental synchronization of worktime entries."""
+
+import asyncio
+import hashlib
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from os import PathLike
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from timebutler_client.client import TimebutlerClient, _months_between
+from timebutler_client.models import WorktimeEntry
+
+__all__ = ["PENDING_STATES", "MonthSyncState", "WorktimeSync", "WorktimeSyncResult", "WorktimeSyncState"]
+
+#: Worktime entry states that may still change, so months containing them are always refreshed.
+PENDING_STATES: tuple[str, ...] = ("Requested", "In process")
+
+
+class MonthSyncState(BaseModel):
+    """What was seen the last time a month (optionally of a single user) was synchronized."""
+
+    model_config = ConfigDict(frozen=True)
+
+    content_hash: str = Field(description="Hash over all entries of the month")
+    synced_at: datetime = Field(description="When the month was last fetched (UTC)")
+    entry_hashes: dict[int, str] = Field(description="Hash of each entry, keyed by entry ID")
+    pending: bool = Field(description="Whether any entry was in a non-final state")
+
+
+class WorktimeSyncState(BaseModel):
+    """
+    Local state of a WorktimeSync, keyed by "YYYY-MM" (or "YYYY-MM/<user ID>" for per-user syncs).
+
+    The state is plain JSON and can be kept between runs with save() and load().
+    """
+
+    months: dict[str, MonthSyncState] = Field(default_factory=dict)
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the state to a JSON file."""
+        Path(path).write_text(self.model_dump_json(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "WorktimeSyncState":
+        """Read the state from a JSON file; a missing file gives an empty state."""
+        file = Path(path)
+        if not file.exists():
+            return cls()
+        return cls.model_validate_json(file.read_text(encoding="utf-8"))
+
+
+class WorktimeSyncResult(BaseModel):
+    """Outcome of one WorktimeSync.sync() run."""
+
+    model_config = ConfigDict(frozen=True)
+
+    added: list[int] = Field(description="IDs of entries that were not there before")
+    changed: list[int] = Field(description="IDs of entries whose content changed (including moves between months)")
+    removed: list[int] = Field(description="IDs of entries that are gone")
+    refreshed_months: list[str] = Field(description="State keys of the months that were fetched")
+    skipped_months: list[str] = Field(description="State keys of the months that were considered final")
+    entries: list[WorktimeEntry] = Field(description="Current entries of the refreshed months")
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any entry was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+def _entry_hash(entry: WorktimeEntry) -> str:
+    return hashlib.blake2b(entry.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+def _content_hash(entry_hashes: dict[int, str]) -> str:
+    content = ";".join(f"{entry_id}:{entry_hashes[entry_id]}" for entry_id in sorted(entry_hashes))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class WorktimeSync:
+    """
+    Keeps a local copy of worktime entries up to date with as few /worktime requests as possible.
+
+    A month is fetched again only if it was never synchronized, is one of the `recent_months`
+    months before the current one (or the current month itself), or contained entries in a
+    pending state (see PENDING_STATES) last time. All other months are considered final and
+    skipped. For every fetched month, the entries are compared with the hashes stored in the
+    state, and the IDs of added, changed and removed entries are reported.
+
+    Example:
+        state = WorktimeSyncState.load("worktime-sync.json")
+        sync = WorktimeSync(client, state, recent_months=1)
+        result = await sync.sync(start=date(2026, 1, 1))
+        state.save("worktime-sync.json")
+    """
+
+    def __init__(
+        self,
+        client: TimebutlerClient,
+        state: WorktimeSyncState | None = None,
+        *,
+        recent_months: int = 1,
+        pending_states: Iterable[str] = PENDING_STATES,
+        concurrency: int = 4,
+    ) -> None:
+        """
+        Create a sync helper.
+
+        Args:
+            client: Client used for the /worktime requests
+            state: State of earlier runs, updated in place; None to start from scratch
+            recent_months: Number of months before the current one that are always refreshed
+            pending_states: Entry states that make a month be refreshed on the next run
+            concurrency: Maximum number of /worktime requests in flight at the same time
+        """
+        if recent_months < 0:
+            raise ValueError(f"recent_months must not be negative, got {recent_months}")
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        self.client = client
+        self.state = state if state is not None else WorktimeSyncState()
+        self.recent_months = recent_months
+        self.pending_states = frozenset(pending_states)
+        self.concurrency = concurrency
+
+    def _needs_refresh(self, key: str, year: int, month: int, today: date) -> bool:
+        previous = self.state.months.get(key)
+        if previous is None or previous.pending:
+            return True
+        return (today.year - year) * 12 + today.month - month <= self.recent_months
+
+    async def sync(
+        self,
+        start: date,
+        end: date | None = None,
+        user_ids: Iterable[int] | None = None,
+        *,
+        today: date | None = None,
+    ) -> WorktimeSyncResult:
+        """
+        Refresh the months of a date range that may have changed and report what did.
+
+        The state is only updated once all requests have succeeded.
+
+        Args:
+            start: Any day of the first month to synchronize
+            end: Any day of the last month to synchronize; defaults to today
+            user_ids: Synchronize these users with one request each per month; None for all users at once
+            today: Reference date for the recent months (defaults to the current date)
+
+        Returns:
+            WorktimeSyncResult with the changed entry IDs and the current entries of the refreshed months
+
+        Raises:
+            ValueError: If end is before start
+            TimebutlerAuthenticationError: If API key is invalid
+            TimebutlerRateLimitError: If rate limit is exceeded
+            TimebutlerServerError: If server returns 5xx error
+            TimebutlerParseError: If response cannot be parsed
+        """
+        today = today or date.today()
+        end = end or today
+        if end < start:
+            raise ValueError(f"End date must not be before start date, got {start} - {end}")
+        users: list[int | None] = list(user_ids) if user_ids is not None else [None]
+        refresh: list[tuple[str, int, int, int | None]] = []
+        skipped: list[str] = []
+        for year, month in _months_between(start, min(end, today)):
+            for user_id in users:
+                key = f"{year:04d}-{month:02d}" if user_id is None else f"{year:04d}-{month:02d}/{user_id}"
+                if self._needs_refresh(key, year, month, today):
+                    refresh.append((key, year, month, user_id))
+                else:
+                    skipped.append(key)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _fetch(year: int, month: int, user_id: int | None) -> list[WorktimeEntry]:
+            async with semaphore:
+                return await self.client.get_worktime(year, month, user_id)
+
+        fetched = await asyncio.gather(*(_fetch(year, month, user_id) for _, year, month, user_id in refresh))
+
+        synced_at = datetime.now(UTC)
+        added: dict[int, None] = {}
+        changed: dict[int, None] = {}
+        removed: dict[int, None] = {}
+        entries: list[WorktimeEntry] = []
+        for (key, *_), month_entries in zip(refresh, fetched, strict=True):
+            entries.extend(month_entries)
+            entry_hashes = {entry.id: _entry_hash(entry) for entry in month_entries}
+            content_hash = _content_hash(entry_hashes)
+            previous = self.state.months.get(key)
+            if previous is None or previous.content_hash != content_hash:
+                old_hashes = previous.entry_hashes if previous is not None else {}
+                for entry_id, entry_hash in entry_hashes.items():
+                    if entry_id not in old_hashes:
+                        added[entry_id] = None
+                    elif old_hashes[entry_id] != entry_hash:
+                        changed[entry_id] = None
+                for entry_id in old_hashes.keys() - entry_hashes.keys():
+                    removed[entry_id] = None
+            self.state.months[key] = MonthSyncState(
+                content_hash=content_hash,
+                synced_at=synced_at,
+                entry_hashes=entry_hashes,
+                pending=any(entry.state in self.pending_states for entry in month_entries),
+            )
+
+        moved = added.keys() & removed.keys()  # an entry whose date moved to another refreshed month
+        for entry_id in moved:
+            del added[entry_id]
+            del removed[entry_id]
+            changed[entry_id] = None
+        return WorktimeSyncResult(
+            added=list(added),
+            changed=list(changed),
+            removed=list(removed),
+            refreshed_months=[key for key, *_ in refresh],
+            skipped_months=skipped,
+            entries=entries,
+        )
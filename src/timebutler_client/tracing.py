@@ -0,0 +1,106 @@
+"""
+OpenTelemetry spans of TimebutlerClient calls (requires the `opentelemetry` extra).
+
+The client imports this module only if it is given a tracer, so without one neither
+opentelemetry is needed nor is any span opened. Each get_* call becomes a span that
+contains one span per HTTP attempt and one per parsed response:
+
+    TimebutlerClient.get_workdays     timebutler.endpoint=workdays
+    ├── POST /workdays                 http.response.status_code=200, http.response.body.size=...
+    ├── TimebutlerClient.get_users     (runs concurrently with POST /workdays)
+    │   ├── POST /users
+    │   └── parse users                timebutler.rows=..., timebutler.body.size=...
+    └── parse workdays
+
+Attributes are only computed for spans that are recorded, i.e. if the tracer provider
+is backed by an SDK with an exporter.
+"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+try:
+    from opentelemetry.trace import Span, SpanKind, Tracer
+    from opentelemetry.util.types import AttributeValue
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "timebutler_client.tracing requires opentelemetry-api; "
+        "install it with: pip install 'timebutler-client[opentelemetry]'"
+    ) from e
+
+from timebutler_client.instrumentation import RequestTimings, _row_count
+
+__all__ = ["ClientTracing"]
+
+#: Form parameters that never become span attributes.
+_SECRET_PARAMS = frozenset({"auth"})
+
+
+def _params_attributes(params: Mapping[str, object] | None) -> dict[str, AttributeValue]:
+    """The request parameters as `timebutler.params.<name>` attributes, without the API key."""
+    return {
+        f"timebutler.params.{name}": str(value)
+        for name, value in (params or {}).items()
+        if name not in _SECRET_PARAMS and value is not None
+    }
+
+
+class ClientTracing:
+    """Opens the spans of a TimebutlerClient's calls with an OpenTelemetry tracer."""
+
+    def __init__(self, tracer: Tracer) -> None:
+        self.tracer = tracer
+
+    @contextmanager
+    def call(self, method: str, endpoint: str, params: Mapping[str, object] | None = None) -> Iterator[Span]:
+        """The span of one get_* call, e.g. method="get_worktime" with params {"year": 2026, "month": 1}."""
+        with self.tracer.start_as_current_span(f"TimebutlerClient.{method}") as span:
+            if span.is_recording():
+                span.set_attributes({"timebutler.endpoint": endpoint, **_params_attributes(params)})
+            yield span
+
+    @contextmanager
+    def request(self, url: str, endpoint: str, params: Mapping[str, str] | None, attempt: int) -> Iterator[Span]:
+        """The span of one HTTP attempt; annotate it with record_request() once it has finished."""
+        with self.tracer.start_as_current_span(f"POST /{endpoint}", kind=SpanKind.CLIENT) as span:
+            if span.is_recording():
+                attributes: dict[str, AttributeValue] = {
+                    "http.request.method": "POST",
+                    "url.full": url,
+                    "timebutler.endpoint": endpoint,
+                    **_params_attributes(params),
+                }
+                if attempt > 1:
+                    attributes["http.request.resend_count"] = attempt - 1
+                span.set_attributes(attributes)
+            yield span
+
+    @staticmethod
+    def record_request(span: Span, timings: RequestTimings) -> None:
+        """Annotate the span of an HTTP attempt with its outcome."""
+        attributes: dict[str, AttributeValue] = {"http.response.body.size": timings.body_bytes}
+        if timings.status is not None:
+            attributes["http.response.status_code"] = timings.status
+        if timings.error is not None:
+            attributes["error.type"] = timings.error
+        if timings.retry_after is not None:
+            attributes["timebutler.retry_after"] = timings.retry_after
+        if timings.connection_reused is not None:
+            attributes["timebutler.connection_reused"] = timings.connection_reused
+        span.set_attributes(attributes)
+
+    @contextmanager
+    def parse(self, endpoint: str, csv_text: str) -> Iterator[Span]:
+        """The span of parsing one response body; annotate it with record_parse() once it has finished."""
+        with self.tracer.start_as_current_span(f"parse {endpoint}") as span:
+            if span.is_recording():
+                span.set_attributes(
+                    {"timebutler.endpoint": endpoint, "timebutler.body.size": len(csv_text.encode("utf-8"))}
+                )
+            yield span
+
+    @staticmethod
+    def record_parse(span: Span, result: object) -> None:
+        """Annotate the span of a parse with the number of models it produced."""
+        if span.is_recording() and (rows := _row_count(result)) is not None:
+            span.set_attribute("timebutler.rows", rows)
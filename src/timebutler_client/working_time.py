@@ -0,0 +1,300 @@
+"""
+Expected vs. actual working time per user and day, week or month (requires the `numpy` extra).
+
+The calculation combines the three result sets of the API: the target minutes of each day
+come from the WorkdaySchedule in effect, absences reduce them, and worktime entries add up
+the minutes actually worked. Everything is computed on (users x days) NumPy arrays instead
+of looping over days in Python:
+
+    from timebutler_client.working_time import calculate_working_time
+
+    balance = calculate_working_time(
+        await client.get_workdays(),
+        await client.get_absences(year=2026),
+        await client.get_worktime_range(date(2026, 1, 1), date(2026, 12, 31)),
+        start=date(2026, 1, 1), end=date(2026, 12, 31), period="month",
+    )
+    overtime_hours = balance.balance_minutes.sum(axis=1) / 60
+"""
+
+from collections.abc import Iterable
+from datetime import date
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "timebutler_client.working_time requires numpy; install it with: pip install 'timebutler-client[numpy]'"
+    ) from e
+
+from timebutler_client.aggregation import Period
+from timebutler_client.models import Absence, WorkdaySchedule, WorkdaysResult, WorktimeEntry, WorktimeTable
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+__all__ = ["DEFAULT_ABSENCE_STATES", "Period", "WorkingTimeBalance", "calculate_working_time"]
+
+#: Absence states that reduce the target working time by default.
+DEFAULT_ABSENCE_STATES: tuple[str, ...] = ("Approved",)
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_ROW_SHIFT = 1 << 32  # (user row, date ordinal) pairs are combined into one int64 key for a single searchsorted
+
+_Matrix = npt.NDArray[np.float64]
+
+
+class WorkingTimeBalance:
+    """
+    Expected, absent and worked minutes of a set of users, one row per user and one column per period.
+
+    Attributes:
+        user_ids: Sorted user IDs, one per row
+        periods: Start of each column as numpy.datetime64 (days for "day" and "week", months for "month")
+        expected_minutes: Target working time according to the workday schedules
+        absent_minutes: Part of the target working time covered by absences
+        worked_minutes: Working time recorded in worktime entries
+    """
+
+    def __init__(
+        self,
+        user_ids: npt.NDArray[np.int64],
+        periods: npt.NDArray[np.datetime64],
+        expected_minutes: _Matrix,
+        absent_minutes: _Matrix,
+        worked_minutes: _Matrix,
+    ) -> None:
+        self.user_ids = user_ids
+        self.periods = periods
+        self.expected_minutes = expected_minutes
+        self.absent_minutes = absent_minutes
+        self.worked_minutes = worked_minutes
+
+    def __repr__(self) -> str:
+        return f"WorkingTimeBalance(users={len(self.user_ids)}, periods={len(self.periods)})"
+
+    @property
+    def target_minutes(self) -> _Matrix:
+        """Minutes the users were supposed to work: expected minus absent."""
+        return self.expected_minutes - self.absent_minutes
+
+    @property
+    def balance_minutes(self) -> _Matrix:
+        """Overtime (positive) or undertime (negative): worked minus target."""
+        return self.worked_minutes - self.target_minutes
+
+    def user_index(self, user_id: int) -> int:
+        """
+        Return the row of a user.
+
+        Raises:
+            KeyError: If the user is not part of the calculation
+        """
+        row = int(np.searchsorted(self.user_ids, user_id))
+        if row == len(self.user_ids) or self.user_ids[row] != user_id:
+            raise KeyError(user_id)
+        return row
+
+
+def _expected_minutes(
+    schedules: list[WorkdaySchedule], user_ids: npt.NDArray[np.int64], days: npt.NDArray[np.int64]
+) -> _Matrix:
+    """Weekday minutes of the schedule in effect, found by one searchsorted over all users' schedules."""
+    if not schedules:
+        return np.zeros((len(user_ids), len(days)))
+    rows = np.searchsorted(user_ids, np.fromiter((s.user_id for s in schedules), np.int64, len(schedules)))
+    starts = np.fromiter(
+        (0 if s.valid_from == UNLIMITED_DATE else s.valid_from.toordinal() for s in schedules), np.int64, len(schedules)
+    )
+    keys = rows * _ROW_SHIFT + starts
+    order = np.argsort(keys, kind="stable")  # stable, so the last of several entries with the same start wins
+    keys, rows = keys[order], rows[order]
+    minutes = np.array(
+        [
+            (
+                s.monday_minutes,
+                s.tuesday_minutes,
+                s.wednesday_minutes,
+                s.thursday_minutes,
+                s.friday_minutes,
+                s.saturday_minutes,
+                s.sunday_minutes,
+            )
+            for s in schedules
+        ],
+        dtype=np.float64,
+    )[order]
+    user_rows = np.arange(len(user_ids), dtype=np.int64)[:, None]
+    positions = np.searchsorted(keys, user_rows * _ROW_SHIFT + days[None, :], side="right") - 1
+    clipped = positions.clip(0)
+    in_effect = (positions >= 0) & (rows[clipped] == user_rows)
+    weekdays = (days - 1) % 7  # ordinal 1 (0001-01-01) was a Monday
+    result: _Matrix = np.where(in_effect, minutes[clipped, weekdays[None, :]], 0.0)
+    return result
+
+
+def _absent_minutes(
+    absences: list[Absence],
+    absence_user_ids: npt.NDArray[np.int64],
+    user_ids: npt.NDArray[np.int64],
+    first_ordinal: int,
+    expected: _Matrix,
+) -> _Matrix:
+    """
+    Target minutes covered by absences.
+
+    Full-day absences cover the whole target of every day in their range, half-day absences
+    half of it. Absences booked in hours cover their hours, spread evenly over their working
+    days (days with a target): as many as the API counted for the absence (Absence.workdays),
+    or, if it did not, as many as the schedule has in the calculated part of the range.
+    Overlapping absences never cover more than the target of a day.
+    """
+    user_count, day_count = expected.shape
+    share = np.zeros((user_count, day_count + 1))  # difference arrays: +x at the first day, -x after the last
+    rate = np.zeros((user_count, day_count + 1))
+    working = expected > 0
+    if absences and user_count:
+        rows = np.searchsorted(user_ids, absence_user_ids).clip(max=user_count - 1)
+        known = user_ids[rows] == absence_user_ids
+        from_ordinals = np.fromiter((a.from_date.toordinal() for a in absences), np.int64, len(absences))
+        to_ordinals = np.fromiter((a.to_date.toordinal() for a in absences), np.int64, len(absences))
+        hours = np.fromiter((float(a.hours) for a in absences), np.float64, len(absences))
+        workdays = np.fromiter((float(a.workdays) for a in absences), np.float64, len(absences))
+        half_day = np.fromiter((a.half_day for a in absences), np.bool_, len(absences))
+        first = np.maximum(from_ordinals - first_ordinal, 0)
+        last = np.minimum(to_ordinals - first_ordinal, day_count - 1)
+        relevant = known & (first <= last)
+        rows, first, last = rows[relevant], first[relevant], last[relevant]
+        hours, workdays, half_day = hours[relevant], workdays[relevant], half_day[relevant]
+        working_days_so_far = np.concatenate([np.zeros((user_count, 1)), np.cumsum(working, axis=1)], axis=1)
+        scheduled_days = working_days_so_far[rows, last + 1] - working_days_so_far[rows, first]
+        day_divisor = np.where(workdays > 0, workdays, scheduled_days)
+        by_share = np.where(hours > 0, 0.0, np.where(half_day, 0.5, 1.0))
+        per_working_day = np.divide(hours * 60, day_divisor, out=np.zeros_like(hours), where=day_divisor > 0)
+        np.add.at(share, (rows, first), by_share)
+        np.add.at(share, (rows, last + 1), -by_share)
+        np.add.at(rate, (rows, first), per_working_day)
+        np.add.at(rate, (rows, last + 1), -per_working_day)
+    covered = np.minimum(np.cumsum(share, axis=1)[:, :day_count], 1.0) * expected
+    booked = np.where(working, np.cumsum(rate, axis=1)[:, :day_count], 0.0)
+    result: _Matrix = np.clip(covered + booked, 0.0, expected)
+    return result
+
+
+def _worktime_columns(
+    worktime: Iterable[WorktimeEntry] | WorktimeTable, states: frozenset[str] | None
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    """User IDs, date ordinals and working seconds of the counted entries."""
+    if isinstance(worktime, WorktimeTable):  # read the column buffers without materializing entries
+        user_ids = np.frombuffer(worktime.user_ids, dtype=np.int64)
+        ordinals = np.frombuffer(worktime.date_ordinals, dtype=np.int32).astype(np.int64)
+        seconds = np.frombuffer(worktime.working_time_seconds, dtype=np.int64).astype(np.float64)
+        if states is not None:
+            state_codes, values = worktime.state_codes()
+            codes = np.frombuffer(state_codes, dtype=np.int32)
+            counted = np.isin(codes, [code for code, state in enumerate(values) if state in states])
+            user_ids, ordinals, seconds = user_ids[counted], ordinals[counted], seconds[counted]
+        return user_ids, ordinals, seconds
+    entries = [entry for entry in worktime if states is None or entry.state in states]
+    return (
+        np.fromiter((entry.user_id for entry in entries), np.int64, len(entries)),
+        np.fromiter((entry.date.toordinal() for entry in entries), np.int64, len(entries)),
+        np.fromiter((entry.working_time_seconds for entry in entries), np.float64, len(entries)),
+    )
+
+
+def _worked_minutes(
+    user_ids: npt.NDArray[np.int64],
+    work_user_ids: npt.NDArray[np.int64],
+    ordinals: npt.NDArray[np.int64],
+    seconds: npt.NDArray[np.float64],
+    first_ordinal: int,
+    day_count: int,
+) -> _Matrix:
+    columns = ordinals - first_ordinal
+    in_range = (columns >= 0) & (columns < day_count)
+    cells = np.searchsorted(user_ids, work_user_ids[in_range]) * day_count + columns[in_range]
+    counts = np.bincount(cells, weights=seconds[in_range] / 60, minlength=len(user_ids) * day_count)
+    result: _Matrix = np.asarray(counts, dtype=np.float64).reshape(len(user_ids), day_count)
+    return result
+
+
+def calculate_working_time(  # pylint: disable=too-many-arguments,too-many-locals
+    schedules: WorkdaysResult | Iterable[WorkdaySchedule],
+    absences: Iterable[Absence],
+    worktime: Iterable[WorktimeEntry] | WorktimeTable,
+    start: date,
+    end: date,
+    *,
+    period: Period = "day",
+    absence_states: Iterable[str] | None = DEFAULT_ABSENCE_STATES,
+    worktime_states: Iterable[str] | None = None,
+) -> WorkingTimeBalance:
+    """
+    Calculate expected, absent and worked minutes per user and period.
+
+    Users are taken from all three inputs, so users with worktime but without a schedule
+    show up with an expected time of 0. Absences without a user_id are matched to a user
+    via the employee numbers of the schedules. Public holidays are not known to the API
+    and therefore not taken into account.
+
+    Args:
+        schedules: Result of TimebutlerClient.get_workdays(), or its schedules
+        absences: Absences, e.g. from get_absences()
+        worktime: Worktime entries from get_worktime() or get_worktime_table(); tables are read column-wise
+        start: First day of the calculation (inclusive)
+        end: Last day of the calculation (inclusive)
+        period: Sum up the days per "day", "week" (starting on Monday) or "month"
+        absence_states: States of the absences to take into account; None for all
+        worktime_states: States of the worktime entries to take into account; None for all
+
+    Returns:
+        WorkingTimeBalance with one row per user and one column per period
+
+    Raises:
+        ValueError: If end is before start
+    """
+    if end < start:
+        raise ValueError(f"End date must not be before start date, got {start} - {end}")
+    schedule_list = list(schedules.schedules if isinstance(schedules, WorkdaysResult) else schedules)
+    absence_filter = frozenset(absence_states) if absence_states is not None else None
+    counted_absences = [a for a in absences if absence_filter is None or a.state in absence_filter]
+    user_by_employee_number = {s.employee_number: s.user_id for s in schedule_list}
+    absence_user_ids = np.fromiter(
+        (a.user_id or user_by_employee_number.get(a.employee_number, 0) for a in counted_absences),
+        np.int64,
+        len(counted_absences),
+    )
+    work_user_ids, work_ordinals, work_seconds = _worktime_columns(
+        worktime, frozenset(worktime_states) if worktime_states is not None else None
+    )
+    user_ids = np.unique(
+        np.concatenate(
+            [
+                np.fromiter((s.user_id for s in schedule_list), np.int64, len(schedule_list)),
+                absence_user_ids[absence_user_ids != 0],
+                work_user_ids,
+            ]
+        )
+    )
+
+    first_ordinal = start.toordinal()
+    days = np.arange(first_ordinal, end.toordinal() + 1, dtype=np.int64)
+    expected = _expected_minutes(schedule_list, user_ids, days)
+    absent = _absent_minutes(counted_absences, absence_user_ids, user_ids, first_ordinal, expected)
+    worked = _worked_minutes(user_ids, work_user_ids, work_ordinals, work_seconds, first_ordinal, len(days))
+
+    day_dates = (days - _EPOCH_ORDINAL).astype("datetime64[D]")
+    if period == "day":
+        return WorkingTimeBalance(user_ids, day_dates, expected, absent, worked)
+    if period == "week":
+        labels = day_dates - ((days - 1) % 7).astype("timedelta64[D]")  # Monday of the week
+    else:
+        labels = day_dates.astype("datetime64[M]")
+    boundaries = np.flatnonzero(np.concatenate([[True], labels[1:] != labels[:-1]]))
+    return WorkingTimeBalance(
+        user_ids,
+        labels[boundaries],
+        np.add.reduceat(expected, boundaries, axis=1),
+        np.add.reduceat(absent, boundaries, axis=1),
+        np.add.reduceat(worked, boundaries, axis=1),
+    )
@@ -0,0 +1,105 @@
+"""Tests for AbsenceIndex"""
+
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from timebutler_client import Absence, AbsenceIndex
+
+from .test_absences import EXPECTED_ABSENCES
+
+
+def _absence(absence_id: int, user_id: int, from_date: date, to_date: date, **kwargs: Any) -> Absence:
+    return Absence(
+        **{
+            "id": absence_id,
+            "from_date": from_date,
+            "to_date": to_date,
+            "employee_number": "00001",
+            "user_id": user_id,
+            "state": "Approved",
+            **kwargs,
+        }
+    )
+
+
+ABSENCES = [
+    _absence(1, 1, date(2026, 8, 3), date(2026, 8, 7)),
+    _absence(2, 2, date(2026, 8, 5), date(2026, 8, 5), half_day=True, morning=True),
+    _absence(3, 3, date(2026, 8, 5), date(2026, 8, 5), half_day=True, morning=False),
+    _absence(4, 3, date(2026, 8, 10), date(2026, 8, 11), state="Requested"),
+    _absence(5, 1, date(2026, 8, 6), date(2026, 8, 10)),  # overlaps absence 1
+]
+
+
+class TestAbsenceIndex:
+    """Tests for AbsenceIndex"""
+
+    def test_absent_users_on_a_day(self) -> None:
+        """Verify full-day and both kinds of half-day absences are found."""
+        index = AbsenceIndex(ABSENCES)
+
+        assert index.absent_users(date(2026, 8, 5)) == [1, 2, 3]
+        assert index.absent_users(date(2026, 8, 5), part="morning") == [1, 2]
+        assert index.absent_users(date(2026, 8, 5), part="afternoon") == [1, 3]
+        assert index.absent_users(date(2026, 8, 4)) == [1]
+        assert index.absent_users(date(2026, 8, 2)) == []
+        assert index.absent_users(date(2027, 1, 1)) == []
+
+    def test_absent_users_in_a_range_and_team(self) -> None:
+        """Verify range queries and restricting them to a team."""
+        index = AbsenceIndex(ABSENCES)
+
+        assert index.absent_users(date(2026, 8, 8), date(2026, 8, 12)) == [1, 3]
+        assert index.absent_users(date(2026, 7, 1), date(2026, 9, 1), user_ids=[3, 9, 2]) == [3, 2]
+        assert index.absent_users(date(2026, 8, 5), part="morning", user_ids=[3, 2]) == [2]
+
+    def test_is_absent(self) -> None:
+        """Verify single-user checks, including half days."""
+        index = AbsenceIndex(ABSENCES)
+
+        assert index.is_absent(1, date(2026, 8, 10))
+        assert not index.is_absent(1, date(2026, 8, 11))
+        assert index.is_absent(2, date(2026, 8, 1), date(2026, 8, 31))
+        assert index.is_absent(2, date(2026, 8, 5), part="morning")
+        assert not index.is_absent(2, date(2026, 8, 5), part="afternoon")
+        assert not index.is_absent(42, date(2026, 8, 5))
+
+    def test_absent_days_counts_half_days_and_overlaps_once(self) -> None:
+        """Verify absent_days() counts each half day once, however many absences cover it."""
+        index = AbsenceIndex(ABSENCES)
+
+        assert index.absent_days(1, date(2026, 8, 1), date(2026, 8, 31)) == 8
+        assert index.absent_days(1, date(2026, 8, 7), date(2026, 8, 8)) == 2
+        assert index.absent_days(2, date(2026, 8, 5)) == 0.5
+        assert index.absent_days(3, date(2026, 8, 1), date(2026, 8, 31)) == 2.5
+
+    def test_state_filter(self) -> None:
+        """Verify states= leaves out absences in other states."""
+        index = AbsenceIndex(ABSENCES, states=["Approved"])
+
+        assert index.absent_users(date(2026, 8, 10), date(2026, 8, 11)) == [1]
+        assert 3 in index
+        assert 4 not in index
+
+    def test_matches_a_linear_scan(self) -> None:
+        """Verify the index agrees with checking every absence for every day of the sample data."""
+        index = AbsenceIndex(EXPECTED_ABSENCES)
+        first = min(a.from_date for a in EXPECTED_ABSENCES) - timedelta(days=2)
+        last = max(a.to_date for a in EXPECTED_ABSENCES) + timedelta(days=2)
+
+        day = first
+        while day <= last:
+            expected = sorted({a.user_id for a in EXPECTED_ABSENCES if a.from_date <= day <= a.to_date})
+            assert index.absent_users(day) == expected
+            day += timedelta(days=1)
+
+    def test_empty_index_and_invalid_range(self) -> None:
+        """Verify queries on an empty index return nothing and end < start raises ValueError."""
+        index = AbsenceIndex([])
+
+        assert index.absent_users(date(2026, 1, 1), date(2026, 12, 31)) == []
+        assert index.absent_days(1, date(2026, 1, 1)) == 0
+        with pytest.raises(ValueError):
+            index.is_absent(1, date(2026, 1, 2), date(2026, 1, 1))
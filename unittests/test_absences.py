@@ -14,6 +14,7 @@ from timebutler_client import (
     TimebutlerRateLimitError,
     TimebutlerServerError,
 )
+from timebutler_client.models.absence import _parse_european_date, _parse_european_date_string
 
 # pylint: disable=line-too-long
 # data have been anonymized - don't worry
@@ -418,3 +419,106 @@ class TestGetAbsences:
             result = await client.get_absences(year=2026)
 
         assert result == []
+
+    async def test_get_absences_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/absences",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            result = await client.get_absences(year=2026)
+
+        assert result == EXPECTED_ABSENCES
+        assert [r.model_dump() for r in result] == [e.model_dump() for e in EXPECTED_ABSENCES]
+
+
+class TestIterAbsences:
+    """Tests for TimebutlerClient.iter_absences()"""
+
+    async def test_iter_absences_yields_same_models_as_get_absences(self) -> None:
+        """Verify streaming yields the same Absence models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/absences",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            actual = [absence async for absence in client.iter_absences(year=2026)]
+
+        assert actual == EXPECTED_ABSENCES
+
+    async def test_iter_absences_handles_quoted_field_spanning_lines(self) -> None:
+        """Verify a quoted comment containing a line break and a semicolon is parsed as one field."""
+        client = TimebutlerClient(api_key="test-api-key")
+        csv_text = (
+            "ID;From;To;Half a day;Morning;User ID;Employee number;Type;Extra vacation day;State;Substitute state;Workdays;Hours;Medical certificate (sick leave only);Comments;User ID of the substitute\n"
+            '1;01/02/2026;01/02/2026;false;false;7;00007;Vacation;false;Approved;;1;8;;"first line;\nsecond line";0\n'
+            "2;02/02/2026;02/02/2026;false;false;7;00007;Vacation;false;Approved;;1;8;;;0\n"
+        )
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/absences",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=csv_text,
+            )
+
+            actual = [absence async for absence in client.iter_absences(year=2026)]
+
+        assert [absence.id for absence in actual] == [1, 2]
+        assert actual[0].comments == "first line;\nsecond line"
+
+    async def test_iter_absences_raises_on_malformed_csv(self) -> None:
+        """Verify TimebutlerParseError is raised on malformed CSV."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/absences",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body="not;valid;csv\nmissing;required;fields",
+            )
+
+            with pytest.raises(TimebutlerParseError):
+                async for _ in client.iter_absences(year=2026):
+                    pass
+
+
+class TestEuropeanDateParsing:
+    """Tests for the dd/mm/yyyy parser behind EuropeanDate."""
+
+    def test_parses_zero_padded_date(self) -> None:
+        """Verify the usual zero-padded layout is parsed."""
+        assert _parse_european_date("05/01/2026") == date(2026, 1, 5)
+
+    def test_parses_date_without_zero_padding(self) -> None:
+        """Verify dates without zero padding are still accepted, as strptime does."""
+        assert _parse_european_date("5/1/2026") == date(2026, 1, 5)
+
+    @pytest.mark.parametrize("value", ["2026-01-05", "31/02/2026", "05/13/2026", "aa/bb/cccc", ""])
+    def test_rejects_invalid_dates(self, value: str) -> None:
+        """Verify invalid dates raise ValueError with a helpful message."""
+        with pytest.raises(ValueError, match="Date must be in dd/mm/yyyy format"):
+            _parse_european_date(value)
+
+    def test_repeated_dates_are_served_from_cache(self) -> None:
+        """Verify each distinct date string is only converted once."""
+        _parse_european_date_string.cache_clear()
+
+        for _ in range(3):
+            _parse_european_date("17/10/2026")
+
+        info = _parse_european_date_string.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
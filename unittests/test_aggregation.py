@@ -0,0 +1,121 @@
+"""Tests for aggregate_worktime()"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Literal
+
+import pytest
+
+from timebutler_client import WorktimeAggregate, WorktimeEntry, WorktimeTable, aggregate_worktime
+from timebutler_client import aggregation as aggregation_module
+
+from .test_projects import EXPECTED_PROJECTS
+from .test_users import EXPECTED_USERS
+from .test_worktime import EXPECTED_ENTRIES
+
+ENTRIES = [
+    *EXPECTED_ENTRIES,
+    EXPECTED_ENTRIES[0].model_copy(update={"id": 1, "user_id": 322219, "employee_number": "00160"}),
+    EXPECTED_ENTRIES[1].model_copy(update={"id": 2, "date": date(2026, 2, 2), "service_id": 7}),
+]
+
+
+@pytest.fixture(params=["entries", "table", "table_without_numpy"])
+def worktime(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Sequence[WorktimeEntry]:
+    """The test entries as list and as WorktimeTable, with and without the NumPy path."""
+    if request.param == "entries":
+        return list(ENTRIES)
+    if request.param == "table_without_numpy":
+        monkeypatch.setattr(aggregation_module, "_NUMPY_AVAILABLE", False)
+    elif not aggregation_module._NUMPY_AVAILABLE:  # pylint: disable=protected-access
+        pytest.skip("numpy is not installed")
+    return WorktimeTable.from_entries(ENTRIES)
+
+
+def _totals(aggregates: list[WorktimeAggregate]) -> list[tuple[object, ...]]:
+    return [
+        (
+            a.project_id,
+            a.service_id,
+            a.user_id,
+            a.employee_number,
+            a.period_start,
+            a.working_time_seconds,
+            a.entry_count,
+        )
+        for a in aggregates
+    ]
+
+
+class TestAggregateWorktime:
+    """Tests for aggregate_worktime()"""
+
+    def test_sum_by_project(self, worktime: Sequence[WorktimeEntry]) -> None:
+        """Verify the default groups by project, sorted by project ID."""
+        aggregates = aggregate_worktime(worktime)
+
+        assert _totals(aggregates) == [
+            (20267, None, None, None, None, 3600, 2),
+            (23456, None, None, None, None, 19800 + 27000 + 28800 + 10800 + 21600 + 19800 + 27000, 7),
+        ]
+        assert aggregates[0].working_time == timedelta(hours=1)
+        assert aggregates[1].pause == timedelta(seconds=1800 + 1800 + 2700 + 1800)
+
+    def test_group_by_several_fields_and_month(self, worktime: Sequence[WorktimeEntry]) -> None:
+        """Verify combinations of fields and periods form separate groups."""
+        aggregates = aggregate_worktime(worktime, ("employee_number", "service_id"), period="month")
+
+        assert [(a.employee_number, a.service_id, a.period_start, a.entry_count) for a in aggregates] == [
+            ("00123", 0, date(2026, 1, 1), 7),
+            ("00123", 7, date(2026, 2, 1), 1),
+            ("00160", 0, date(2026, 1, 1), 1),
+        ]
+
+    @pytest.mark.parametrize(
+        ("period", "expected_starts"),
+        [
+            pytest.param("day", [date(2026, 1, 2), date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7)], id="day"),
+            pytest.param("week", [date(2025, 12, 29), date(2026, 1, 5)], id="week"),
+        ],
+    )
+    def test_group_by_period_only(
+        self, worktime: Sequence[WorktimeEntry], period: Literal["day", "week"], expected_starts: list[date]
+    ) -> None:
+        """Verify grouping by day or Monday-based week alone (entries of February left out)."""
+        aggregates = aggregate_worktime(worktime, (), period=period)
+
+        starts = [a.period_start for a in aggregates if a.period_start and a.period_start.month != 2]
+        assert starts == expected_starts
+        assert sum(a.entry_count for a in aggregates) == len(ENTRIES)
+
+    def test_names_are_joined(self, worktime: Sequence[WorktimeEntry]) -> None:
+        """Verify project and user names are looked up from the passed reference data."""
+        aggregates = aggregate_worktime(
+            worktime, ("project_id", "user_id"), projects=EXPECTED_PROJECTS, users=EXPECTED_USERS
+        )
+
+        project_names = {p.id: p.name_stripped for p in EXPECTED_PROJECTS}
+        user_names = {u.user_id: u.full_name for u in EXPECTED_USERS}
+        for aggregate in aggregates:
+            assert aggregate.project_name == project_names.get(aggregate.project_id)  # type: ignore[arg-type]
+            assert aggregate.user_name == user_names.get(aggregate.user_id)  # type: ignore[arg-type]
+            assert aggregate.service_name is None
+
+    def test_single_total_without_grouping(self, worktime: Sequence[WorktimeEntry]) -> None:
+        """Verify by=() without period gives one total."""
+        (total,) = aggregate_worktime(worktime, ())
+
+        assert total.entry_count == len(ENTRIES)
+        assert total.working_time_seconds == sum(entry.working_time_seconds for entry in ENTRIES)
+
+    def test_empty_input(self) -> None:
+        """Verify no entries give no groups."""
+        assert not aggregate_worktime([])
+        assert not aggregate_worktime(WorktimeTable(), ("user_id",), period="month")
+
+    def test_invalid_group_fields_are_rejected(self) -> None:
+        """Verify unknown and duplicate fields raise ValueError."""
+        with pytest.raises(ValueError):
+            aggregate_worktime(ENTRIES, ("state",))  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            aggregate_worktime(ENTRIES, ("user_id", "user_id"))
@@ -0,0 +1,224 @@
+"""Tests for the optional Arrow / Parquet export in timebutler_client.arrow"""
+
+from datetime import date, time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+from pydantic import BaseModel
+
+from timebutler_client import TimebutlerClient, TimebutlerParseError
+from timebutler_client.fast_parsing import (
+    parse_absences_csv,
+    parse_projects_csv,
+    parse_services_csv,
+    parse_users_csv,
+    parse_worktime_csv,
+)
+
+from . import test_absences, test_projects, test_services, test_users, test_workdays, test_worktime
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+arrow = pytest.importorskip("timebutler_client.arrow")
+
+# pylint: disable=line-too-long
+USERS_WITH_INVALID_CSV = """\
+User ID;Last name;First name;Employee number;E-mail address;Phone;Mobile phone;Cost center;Branch office;Department;User type;Language;User ID list of the user's manager;User account locked;Additional Information;Date of entry (dd/mm/yyyy);Date of separation from company (dd/mm/yyyy);Day of birth (dd/mm/yyyy)
+928812;Müller;Anna;00123;anna.mueller@example.com;;;;;;Employee;de_DE;;false;;;
+322219;Schmidt;Bob;00160;bob.schmidt@example.com;;;;;;Employee;de_DE;;false;;;
+300224;Fischer;Clara;DC-1;clara.fischer@example.com;;;;;;Manager;de_DE;;false;;;"""
+# pylint: enable=line-too-long
+
+
+def _as_rows(models: list[Any]) -> list[dict[str, Any]]:
+    """Dump models like a table row: fields only, tuples as lists."""
+    rows = []
+    for model in models:
+        assert isinstance(model, BaseModel)
+        dumped = model.model_dump(exclude=set(type(model).model_computed_fields))
+        rows.append({key: list(value) if isinstance(value, tuple) else value for key, value in dumped.items()})
+    return rows
+
+
+class TestFromCsv:
+    """Tests for the *_from_csv parsers."""
+
+    def test_worktime_matches_models(self) -> None:
+        """Verify the worktime table has the same rows and column semantics as the models."""
+        table = arrow.worktime_from_csv(test_worktime.SAMPLE_CSV)
+
+        assert table.schema == arrow.WORKTIME_SCHEMA
+        assert table.to_pylist() == _as_rows(parse_worktime_csv(test_worktime.SAMPLE_CSV))
+        assert table["employee_number"][0].as_py() == "00123"
+        assert table["date"].type == pa.date32()
+        assert isinstance(table["start_time"][0].as_py(), time)
+
+    def test_absences_match_models(self) -> None:
+        """Verify the absences table has the same rows as the models, with decimals and null comments."""
+        table = arrow.absences_from_csv(test_absences.SAMPLE_CSV)
+
+        assert table.schema == arrow.ABSENCES_SCHEMA
+        assert table.to_pylist() == _as_rows(parse_absences_csv(test_absences.SAMPLE_CSV))
+        assert table["workdays"][0].as_py() == Decimal("1.0")
+        assert table["comments"][0].as_py() is None
+
+    def test_projects_and_services_match_models(self) -> None:
+        """Verify projects and services tables have the same rows as the models."""
+        projects = arrow.projects_from_csv(test_projects.SAMPLE_CSV)
+        services = arrow.services_from_csv(test_services.SAMPLE_CSV_WITH_DATA)
+
+        assert projects.to_pylist() == _as_rows(parse_projects_csv(test_projects.SAMPLE_CSV))
+        assert services.to_pylist() == _as_rows(parse_services_csv(test_services.SAMPLE_CSV_WITH_DATA))
+
+    def test_users_match_models_despite_ragged_rows(self) -> None:
+        """Verify rows with omitted trailing cells are padded, like the strict parser does."""
+        table, invalid_employees = arrow.users_from_csv(test_users.SAMPLE_CSV)
+        users, _ = parse_users_csv(test_users.SAMPLE_CSV)
+
+        assert table.schema == arrow.USERS_SCHEMA
+        assert table.to_pylist() == _as_rows(users)
+        assert table["manager_user_ids"][0].as_py() == [100001]
+        assert table["date_of_birth"][0].as_py() == date(1988, 4, 15)
+        assert not invalid_employees
+
+    def test_users_with_invalid_employee_numbers_are_left_out(self) -> None:
+        """Verify users with non-numeric employee numbers are returned as InvalidEmployee."""
+        table, invalid_employees = arrow.users_from_csv(USERS_WITH_INVALID_CSV)
+
+        assert table["user_id"].to_pylist() == [928812, 322219]
+        assert [(e.user_id, e.raw_employee_number) for e in invalid_employees] == [(300224, "DC-1")]
+
+    def test_invalid_users_fields_are_not_converted(self) -> None:
+        """Verify a non-numeric User ID or unknown user type of an invalid user is not an error, like in get_users()."""
+        csv_text = USERS_WITH_INVALID_CSV + "\nEXT-7;Weber;Dora;;;;;;;;Freelancer;de_DE;x;false;;;"
+
+        table, invalid_employees = arrow.users_from_csv(csv_text)
+        client = TimebutlerClient(api_key="test-api-key")
+        _, strict_invalid_employees = client._parse_users_csv(csv_text)  # pylint: disable=protected-access
+
+        assert table["user_id"].to_pylist() == [928812, 322219]
+        assert invalid_employees == strict_invalid_employees
+        assert (invalid_employees[-1].user_id, invalid_employees[-1].last_name) == (None, "Weber")
+
+    def test_workdays_join_employee_numbers(self) -> None:
+        """Verify schedules get employee numbers from the users table and skip invalid users."""
+        users, invalid_employees = arrow.users_from_csv(USERS_WITH_INVALID_CSV)
+
+        table = arrow.workdays_from_csv(test_workdays.SAMPLE_WORKDAYS_CSV, users, invalid_employees)
+
+        assert table.schema == arrow.WORKDAYS_SCHEMA
+        assert table["user_id"].to_pylist() == [928812, 928812, 322219]
+        assert table["employee_number"].to_pylist() == ["00123", "00123", "00160"]
+        assert table["friday_minutes"].to_pylist() == [480, 240, 480]
+
+    def test_workdays_unlimited_valid_from(self) -> None:
+        """Verify 'unlimited' maps to the UNLIMITED_DATE sentinel, like in WorkdaySchedule."""
+        csv_text = test_workdays.SAMPLE_WORKDAYS_CSV.replace("01/01/2020", "unlimited")
+        users, _ = arrow.users_from_csv(test_workdays.SAMPLE_USERS_CSV)
+
+        table = arrow.workdays_from_csv(csv_text, users)
+
+        assert table["valid_from"][0].as_py() == date(1900, 1, 1)
+
+    def test_workdays_unknown_user_raises(self) -> None:
+        """Verify a schedule of a user missing from the users table raises TimebutlerParseError."""
+        users, _ = arrow.users_from_csv(USERS_WITH_INVALID_CSV)
+
+        with pytest.raises(TimebutlerParseError, match="300224"):
+            arrow.workdays_from_csv(test_workdays.SAMPLE_WORKDAYS_CSV, users)
+
+    def test_empty_response_returns_empty_table(self) -> None:
+        """Verify an empty body or a header without rows gives an empty table with the schema."""
+        assert arrow.worktime_from_csv("").schema == arrow.WORKTIME_SCHEMA
+        assert arrow.worktime_from_csv(test_worktime.WORKTIME_HEADER).num_rows == 0
+        assert arrow.services_from_csv(test_services.SAMPLE_CSV_EMPTY).schema == arrow.SERVICES_SCHEMA
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param("not;valid;csv\nmissing;required;fields", id="missing columns"),
+            pytest.param(
+                test_worktime.WORKTIME_HEADER + "\n1;2;ABC;05/01/2026;07:00;08:00;3600;0;Done;0;0;;false",
+                id="employee",
+            ),
+            pytest.param(
+                test_worktime.WORKTIME_HEADER + "\n1;2;00003;2026-01-05;07:00;08:00;3600;0;Done;0;0;;false",
+                id="date",
+            ),
+            pytest.param(
+                test_worktime.WORKTIME_HEADER + "\n1;2;00003;05/01/2026;07:00;25:00;3600;0;Done;0;0;;false",
+                id="time",
+            ),
+            pytest.param(
+                test_worktime.WORKTIME_HEADER + "\nx;2;00003;05/01/2026;07:00;08:00;3600;0;Done;0;0;;false",
+                id="id",
+            ),
+        ],
+    )
+    def test_malformed_worktime_raises(self, body: str) -> None:
+        """Verify TimebutlerParseError is raised on malformed data."""
+        with pytest.raises(TimebutlerParseError):
+            arrow.worktime_from_csv(body)
+
+
+class TestFetch:
+    """Tests for the get_* functions and write_parquet()."""
+
+    async def test_get_worktime_sends_params_and_writes_parquet(self, tmp_path: Path) -> None:
+        """Verify the worktime request and a lossless Parquet round trip."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=test_worktime.RESPONSE_HEADERS,
+                body=test_worktime.SAMPLE_CSV,
+            )
+
+            table = await arrow.get_worktime(client, year=2026, month=1)
+
+            calls = next(iter(mocked.requests.values()))
+            request_data = calls[0].kwargs.get("data", {})
+            assert request_data["year"] == "2026"
+            assert request_data["month"] == "1"
+
+        path = tmp_path / "worktime.parquet"
+        arrow.write_parquet(table, path)
+
+        assert pq.read_table(path).equals(table)
+
+    async def test_get_absences_raises_on_invalid_year(self) -> None:
+        """Verify an invalid year raises ValueError like TimebutlerClient.get_absences(), without a request."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            with pytest.raises(ValueError, match="Year must be between 1900 and 2100"):
+                await arrow.get_absences(client, year=1800)
+
+            assert not mocked.requests
+
+    async def test_get_workdays_fetches_users(self) -> None:
+        """Verify get_workdays() calls /workdays and /users and joins them."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/workdays",
+                status=200,
+                headers=test_workdays.RESPONSE_HEADERS,
+                body=test_workdays.SAMPLE_WORKDAYS_CSV,
+            )
+            mocked.post(
+                "https://app.timebutler.com/api/v1/users",
+                status=200,
+                headers=test_workdays.RESPONSE_HEADERS,
+                body=test_workdays.SAMPLE_USERS_CSV,
+            )
+
+            table = await arrow.get_workdays(client)
+
+        assert table["employee_number"].to_pylist() == ["00123", "00123", "00160", "00042"]
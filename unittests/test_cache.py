@@ -0,0 +1,310 @@
+"""Tests for TTLCache/SingleFlight and the caching and request coalescing of TimebutlerClient."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+from aioresponses import aioresponses
+from pydantic import ValidationError
+
+from timebutler_client import TimebutlerClient, TimebutlerServerError
+from timebutler_client.cache import SingleFlight, TTLCache
+
+from .test_projects import EXPECTED_PROJECTS, SAMPLE_CSV
+from .test_users import SAMPLE_CSV as USERS_CSV
+from .test_worktime import EXPECTED_ENTRIES
+from .test_worktime import SAMPLE_CSV as WORKTIME_CSV
+
+PROJECTS_URL = "https://app.timebutler.com/api/v1/projects"
+WORKTIME_URL = "https://app.timebutler.com/api/v1/worktime"
+
+
+class _FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSingleFlight:
+    """Tests for request coalescing itself."""
+
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """Verify concurrent calls with the same key run once; different keys run separately."""
+        flights = SingleFlight()
+        calls: list[str] = []
+
+        def _call(key: str) -> Callable[[], Awaitable[str]]:
+            async def _run() -> str:
+                calls.append(key)
+                await asyncio.sleep(0.01)
+                return key
+
+            return _run
+
+        results = await asyncio.gather(*(flights.do(key, _call(key)) for key in ["a", "a", "b", "a"]))
+
+        assert results == ["a", "a", "b", "a"]
+        assert sorted(calls) == ["a", "b"]
+        assert "a" not in flights
+
+    async def test_finished_calls_are_not_kept(self) -> None:
+        """Verify sequential calls each run, unlike with a cache."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def _run() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flights.do("key", _run) == 1
+        assert await flights.do("key", _run) == 2
+
+    async def test_errors_are_shared(self) -> None:
+        """Verify all callers of a failing call get its error."""
+        flights = SingleFlight()
+
+        async def _fail() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(flights.do("key", _fail) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestTTLCache:
+    """Tests for the cache itself."""
+
+    async def test_value_is_cached_until_it_expires(self) -> None:
+        """Verify the loader is only called again once the TTL has passed."""
+        clock = _FakeClock()
+        cache = TTLCache(clock=clock)
+        calls = 0
+
+        async def _load() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get_or_load("key", 10, _load) == 1
+        clock.now = 9.9
+        assert await cache.get_or_load("key", 10, _load) == 1
+        assert "key" in cache
+        clock.now = 10.0
+        assert "key" not in cache
+        assert await cache.get_or_load("key", 10, _load) == 2
+
+    async def test_concurrent_callers_share_one_load(self) -> None:
+        """Verify single-flight: concurrent callers wait for the load in progress."""
+        cache = TTLCache()
+        calls = 0
+
+        async def _load() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("key", 60, _load) for _ in range(10)))
+
+        assert results == ["value"] * 10
+        assert calls == 1
+
+    async def test_errors_are_shared_but_not_cached(self) -> None:
+        """Verify a failing load raises for all waiting callers and is retried by the next call."""
+        cache = TTLCache()
+        calls = 0
+
+        async def _load() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise RuntimeError("boom")
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("key", 60, _load) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await cache.get_or_load("key", 60, _load) == "value"
+        assert calls == 2
+
+    async def test_cancelled_caller_does_not_cancel_the_load(self) -> None:
+        """Verify other callers still get the value if the caller that started the load is cancelled."""
+        cache = TTLCache()
+
+        async def _load() -> str:
+            await asyncio.sleep(0.02)
+            return "value"
+
+        first = asyncio.ensure_future(cache.get_or_load("key", 60, _load))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_load("key", 60, _load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        assert "key" in cache
+
+    async def test_invalidate_during_load_discards_result(self) -> None:
+        """Verify a load in flight while its key is invalidated completes but is not cached."""
+        cache = TTLCache()
+
+        async def _load() -> str:
+            await asyncio.sleep(0.01)
+            return "stale"
+
+        pending = asyncio.ensure_future(cache.get_or_load("key", 60, _load))
+        await asyncio.sleep(0)
+        cache.invalidate("key")
+
+        assert await pending == "stale"
+        assert "key" not in cache
+
+    async def test_invalidate_all(self) -> None:
+        """Verify invalidate() without a key drops every entry."""
+        cache = TTLCache()
+
+        async def _load() -> int:
+            return 1
+
+        await cache.get_or_load("a", 60, _load)
+        await cache.get_or_load("b", 60, _load)
+        cache.invalidate()
+
+        assert "a" not in cache
+        assert "b" not in cache
+
+
+class TestClientCache:
+    """Tests for cache_ttl on TimebutlerClient."""
+
+    async def test_cached_endpoint_is_fetched_once(self) -> None:
+        """Verify repeated get_projects() calls within the TTL send a single request."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"projects": 3600})
+
+        with aioresponses() as mocked:
+            mocked.post(PROJECTS_URL, status=200, body=SAMPLE_CSV, repeat=True)
+
+            first = await client.get_projects()
+            second = await client.get_projects()
+
+            assert len(next(iter(mocked.requests.values()))) == 1
+
+        assert first == second == EXPECTED_PROJECTS
+        assert first is not second  # callers get their own list
+
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        """Verify concurrent get_users() calls are coalesced into one request."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"users": 600})
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/users", status=200, body=USERS_CSV, repeat=True)
+
+            results = await asyncio.gather(*(client.get_users() for _ in range(5)))
+
+            assert len(next(iter(mocked.requests.values()))) == 1
+
+        assert all(result == results[0] for result in results)
+
+    async def test_uncached_endpoint_is_fetched_every_time(self) -> None:
+        """Verify endpoints without a TTL are not cached (the default)."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"users": 600})
+
+        with aioresponses() as mocked:
+            mocked.post(PROJECTS_URL, status=200, body=SAMPLE_CSV, repeat=True)
+
+            await client.get_projects()
+            await client.get_projects()
+
+            assert len(next(iter(mocked.requests.values()))) == 2
+
+    async def test_invalidate_cache_forces_refetch(self) -> None:
+        """Verify invalidate_cache() makes the next call fetch again."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"projects": 3600})
+
+        with aioresponses() as mocked:
+            mocked.post(PROJECTS_URL, status=200, body=SAMPLE_CSV, repeat=True)
+
+            await client.get_projects()
+            client.invalidate_cache("projects")
+            await client.get_projects()
+
+            assert len(next(iter(mocked.requests.values()))) == 2
+
+    async def test_failed_fetch_is_not_cached(self) -> None:
+        """Verify an error response is raised and the next call tries again."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"projects": 3600})
+
+        with aioresponses() as mocked:
+            mocked.post(PROJECTS_URL, status=503, body="unavailable")
+            mocked.post(PROJECTS_URL, status=200, body=SAMPLE_CSV)
+
+            with pytest.raises(TimebutlerServerError):
+                await client.get_projects()
+            assert await client.get_projects() == EXPECTED_PROJECTS
+
+    def test_unknown_endpoint_is_rejected(self) -> None:
+        """Verify only the reference data endpoints can be cached."""
+        with pytest.raises(ValidationError):
+            TimebutlerClient(api_key="test-api-key", cache_ttl={"worktime": 60})  # type: ignore[dict-item]
+
+
+class TestClientCoalescing:
+    """Tests for coalesce_requests on TimebutlerClient."""
+
+    async def test_identical_concurrent_calls_share_one_request(self) -> None:
+        """Verify concurrent get_worktime() calls with the same parameters send one request."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=WORKTIME_CSV, repeat=True)
+
+            results = await asyncio.gather(*(client.get_worktime(year=2026, month=1) for _ in range(5)))
+
+            assert len(next(iter(mocked.requests.values()))) == 1
+
+        assert all(result == EXPECTED_ENTRIES for result in results)
+        assert len({id(result) for result in results}) == 5  # callers get their own list
+
+    async def test_different_parameters_are_not_coalesced(self) -> None:
+        """Verify calls for different months are sent separately."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=WORKTIME_CSV, repeat=True)
+
+            await asyncio.gather(client.get_worktime(year=2026, month=1), client.get_worktime(year=2026, month=2))
+
+            assert len(next(iter(mocked.requests.values()))) == 2
+
+    async def test_table_and_list_share_the_http_request(self) -> None:
+        """Verify get_worktime() and get_worktime_table() for the same month share the round trip."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=WORKTIME_CSV, repeat=True)
+
+            entries, table = await asyncio.gather(
+                client.get_worktime(year=2026, month=1), client.get_worktime_table(year=2026, month=1)
+            )
+
+            assert len(next(iter(mocked.requests.values()))) == 1
+
+        assert table.to_entries() == entries
+
+    async def test_coalescing_can_be_disabled(self) -> None:
+        """Verify coalesce_requests=False sends every call."""
+        client = TimebutlerClient(api_key="test-api-key", coalesce_requests=False)
+
+        with aioresponses() as mocked:
+            mocked.post(PROJECTS_URL, status=200, body=SAMPLE_CSV, repeat=True)
+
+            await asyncio.gather(*(client.get_projects() for _ in range(3)))
+
+            assert len(next(iter(mocked.requests.values()))) == 3
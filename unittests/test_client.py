@@ -0,0 +1,240 @@
+"""Tests for TimebutlerClient session handling."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import Any
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from timebutler_client import (
+    RetryPolicy,
+    TimebutlerAuthenticationError,
+    TimebutlerClient,
+    TimebutlerRateLimitError,
+    TimebutlerServerError,
+)
+
+PROJECTS_CSV = """\
+ID of the project;Name;State;Budget in hours;Comments;Creation date
+12345;Internal;Active;0;;01/01/2025"""
+
+WORKDAYS_CSV = """\
+User ID;Valid from (dd/mm/yyyy);Monday working time in minutes;Tuesday working time in minutes;Wednesday working time in minutes;Thursday working time in minutes;Friday working time in minutes;Saturday working time in minutes;Sunday working time in minutes;ID of the holiday set
+928812;01/01/2020;480;480;480;480;480;0;0;42"""
+
+USERS_CSV = """\
+User ID;Last name;First name;Employee number;E-mail address;Phone;Mobile phone;Cost center;Branch office;Department;User type;Language;User ID list of the user's manager;User account locked;Additional Information;Date of entry (dd/mm/yyyy);Date of separation from company (dd/mm/yyyy);Day of birth (dd/mm/yyyy)
+928812;Müller;Anna;00123;anna.mueller@example.com;;;;;;Employee;de_DE;;false;;;"""
+
+
+class TestSessionLifecycle:
+    """Tests for the pooled session used inside `async with TimebutlerClient(...)`."""
+
+    async def test_context_manager_opens_and_closes_session(self) -> None:
+        """Verify the pooled session exists inside the block and is closed afterwards."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        async with client as entered:
+            assert entered is client
+            session = client._session  # pylint: disable=protected-access
+            assert session is not None
+            assert not session.closed
+
+        assert session.closed
+        assert client._session is None  # pylint: disable=protected-access
+
+    async def test_context_manager_configures_connector(self) -> None:
+        """Verify the connection pool is configured from the client settings."""
+        client = TimebutlerClient(api_key="test-api-key", connection_limit=7, connection_limit_per_host=3)
+
+        async with client:
+            session = client._session  # pylint: disable=protected-access
+            assert session is not None
+            connector = session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 7
+            assert connector.limit_per_host == 3
+
+    async def test_calls_inside_context_manager_share_one_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify all endpoint calls inside the block use the same session."""
+        client = TimebutlerClient(api_key="test-api-key")
+        seen_sessions: list[aiohttp.ClientSession] = []
+        original_post = aiohttp.ClientSession.post
+
+        def _spy_post(session: aiohttp.ClientSession, *args: Any, **kwargs: Any) -> Any:
+            seen_sessions.append(session)
+            return original_post(session, *args, **kwargs)
+
+        monkeypatch.setattr(aiohttp.ClientSession, "post", _spy_post)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV, repeat=True)
+            async with client:
+                await client.get_projects()
+                await client.get_projects()
+
+        assert len(seen_sessions) == 2
+        assert seen_sessions[0] is seen_sessions[1]
+
+    async def test_injected_session_is_used_and_not_closed(self) -> None:
+        """Verify an injected session is used for requests and left open by the client."""
+        async with aiohttp.ClientSession() as session:
+            client = TimebutlerClient(api_key="test-api-key", session=session)
+
+            with aioresponses() as mocked:
+                mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+                async with client:
+                    projects = await client.get_projects()
+
+            assert [p.id for p in projects] == [12345]
+            assert client._session is session  # pylint: disable=protected-access
+            assert not session.closed
+
+    async def test_calls_without_context_manager_still_work(self) -> None:
+        """Verify the client still works without entering the context manager."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            projects = await client.get_projects()
+
+        assert [p.id for p in projects] == [12345]
+        assert client._session is None  # pylint: disable=protected-access
+
+
+class TestRetryPolicy:
+    """Tests for retrying 429/5xx responses according to a RetryPolicy."""
+
+    @staticmethod
+    def _client(**policy_kwargs: Any) -> TimebutlerClient:
+        policy = RetryPolicy(initial_backoff=0, jitter=0, **policy_kwargs)
+        return TimebutlerClient(api_key="test-api-key", retry_policy=policy)
+
+    async def test_retries_server_error_until_success(self) -> None:
+        """Verify a 5xx response is retried and the later successful response is returned."""
+        client = self._client(max_attempts=3)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=503, body="Service Unavailable")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=502, body="Bad Gateway")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            projects = await client.get_projects()
+
+        assert [p.id for p in projects] == [12345]
+
+    async def test_raises_last_error_when_attempts_exhausted(self) -> None:
+        """Verify the last error is raised once max_attempts is reached."""
+        client = self._client(max_attempts=2)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=500, body="first")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=503, body="second")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+
+            with pytest.raises(TimebutlerServerError) as exc_info:
+                await client.get_projects()
+
+        assert exc_info.value.status_code == 503
+
+    async def test_does_not_retry_authentication_error(self) -> None:
+        """Verify authentication errors are raised immediately."""
+        client = self._client(max_attempts=3)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=401)
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+
+            with pytest.raises(TimebutlerAuthenticationError):
+                await client.get_projects()
+
+    async def test_waits_for_retry_after(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify the Retry-After header of a 429 response determines the delay."""
+        client = self._client(max_attempts=2)
+        sleeps: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "7"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        assert sleeps == [7.0]
+
+    async def test_waits_for_retry_after_http_date(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify a Retry-After header in HTTP-date form is converted into the seconds until then."""
+        client = self._client(max_attempts=2)
+        sleeps: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+        retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": retry_at})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        assert len(sleeps) == 1 and 28 <= sleeps[0] <= 31
+
+    async def test_ignores_invalid_retry_after(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify an unparsable Retry-After header falls back to the normal backoff."""
+        client = self._client(max_attempts=2)
+        sleeps: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "soon"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        assert sleeps == [0.0]  # initial_backoff=0, no Retry-After to respect
+
+    async def test_gives_up_when_retry_would_exceed_deadline(self) -> None:
+        """Verify no retry is started if its delay would exceed the deadline budget."""
+        client = self._client(max_attempts=5, deadline=1.0)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "60"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+
+            with pytest.raises(TimebutlerRateLimitError):
+                await client.get_projects()
+
+    async def test_retries_both_legs_of_get_workdays(self) -> None:
+        """Verify each of the two requests made by get_workdays is retried independently."""
+        client = self._client(max_attempts=2)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/workdays", status=500)
+            mocked.post("https://app.timebutler.com/api/v1/workdays", status=200, body=WORKDAYS_CSV)
+            mocked.post("https://app.timebutler.com/api/v1/users", status=429)
+            mocked.post("https://app.timebutler.com/api/v1/users", status=200, body=USERS_CSV)
+            result = await client.get_workdays()
+
+        assert [s.employee_number for s in result.schedules] == ["00123"]
+
+    def test_backoff_grows_exponentially_and_is_capped(self) -> None:
+        """Verify the computed backoff without jitter."""
+        policy = RetryPolicy(initial_backoff=1, backoff_multiplier=2, max_backoff=5, jitter=0)
+
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_backoff_jitter_stays_within_bounds(self) -> None:
+        """Verify jitter only ever shortens the delay by at most the configured fraction."""
+        policy = RetryPolicy(initial_backoff=10, jitter=0.5)
+
+        for _ in range(100):
+            assert 5 <= policy.backoff(1) <= 10
@@ -0,0 +1,80 @@
+"""Tests for diff_snapshots()"""
+
+from datetime import date
+
+import pytest
+
+from timebutler_client import FieldChange, InvalidEmployee, diff_snapshots
+
+from .test_absences import EXPECTED_ABSENCES
+from .test_users import EXPECTED_USERS
+from .test_worktime import EXPECTED_ENTRIES
+
+
+class TestDiffSnapshots:
+    """Tests for diff_snapshots()"""
+
+    def test_identical_snapshots_have_no_changes(self) -> None:
+        """Verify comparing a snapshot with an equal copy reports nothing."""
+        diff = diff_snapshots(EXPECTED_ABSENCES, [absence.model_copy() for absence in EXPECTED_ABSENCES])
+
+        assert not diff.has_changes
+        assert not diff.inserted and not diff.updated and not diff.deleted
+
+    def test_inserted_updated_and_deleted_absences(self) -> None:
+        """Verify absences are matched by ID and the changed fields are listed."""
+        moved = EXPECTED_ABSENCES[1].model_copy(update={"to_date": date(2026, 8, 6), "state": "Requested"})
+        new_absence = EXPECTED_ABSENCES[0].model_copy(update={"id": 1})
+        new = [new_absence, moved, *EXPECTED_ABSENCES[2:]]
+
+        diff = diff_snapshots(EXPECTED_ABSENCES, new)
+
+        assert diff.inserted == [new_absence]
+        assert diff.deleted == [EXPECTED_ABSENCES[0]]
+        assert len(diff.updated) == 1
+        update = diff.updated[0]
+        assert update.key == moved.id
+        assert update.old == EXPECTED_ABSENCES[1]
+        assert update.new == moved
+        assert update.changes == [
+            FieldChange(field="to_date", old=date(2026, 8, 7), new=date(2026, 8, 6)),
+            FieldChange(field="state", old="Approved", new="Requested"),
+        ]
+
+    def test_users_are_keyed_by_user_id(self) -> None:
+        """Verify users are matched by user_id, not by position."""
+        renamed = EXPECTED_USERS[0].model_copy(update={"last_name": "Meier"})
+
+        diff = diff_snapshots(EXPECTED_USERS, [*reversed(EXPECTED_USERS[1:]), renamed])
+
+        assert not diff.inserted and not diff.deleted
+        assert [update.key for update in diff.updated] == [EXPECTED_USERS[0].user_id]
+        assert diff.updated[0].changes == [FieldChange(field="last_name", old="Müller", new="Meier")]
+
+    def test_worktime_entries_from_empty_snapshot(self) -> None:
+        """Verify all entries are inserted when the old snapshot is empty."""
+        diff = diff_snapshots([], EXPECTED_ENTRIES)
+
+        assert diff.inserted == EXPECTED_ENTRIES
+        assert not diff.updated and not diff.deleted
+
+    def test_custom_key(self) -> None:
+        """Verify other models can be diffed with an explicit key."""
+        old = [InvalidEmployee(user_id=1, first_name="A", last_name="B", raw_employee_number="")]
+        new = [InvalidEmployee(user_id=1, first_name="A", last_name="C", raw_employee_number="")]
+
+        diff = diff_snapshots(old, new, key="user_id")
+
+        assert diff.updated[0].changes == [FieldChange(field="last_name", old="B", new="C")]
+
+    def test_unknown_model_without_key_is_rejected(self) -> None:
+        """Verify a model without a known natural key needs key=..."""
+        employee = InvalidEmployee(user_id=1, first_name="A", last_name="B", raw_employee_number="")
+
+        with pytest.raises(ValueError, match="No natural key"):
+            diff_snapshots([employee], [])
+
+    def test_duplicate_keys_are_rejected(self) -> None:
+        """Verify a snapshot with a key twice raises ValueError."""
+        with pytest.raises(ValueError, match="Duplicate key"):
+            diff_snapshots([EXPECTED_ENTRIES[0], EXPECTED_ENTRIES[0]], [])
@@ -0,0 +1,153 @@
+"""Tests for the instrumentation hooks of TimebutlerClient and HistogramInstrumentation"""
+
+import math
+
+import pytest
+from aioresponses import aioresponses
+
+from benchmarks.mock_server import MockServerConfig, MockTimebutlerServer
+from timebutler_client import (
+    HistogramInstrumentation,
+    Instrumentation,
+    ParseTimings,
+    RequestTimings,
+    RetryPolicy,
+    TimebutlerClient,
+    TimebutlerParseError,
+)
+from timebutler_client.instrumentation import Histogram
+
+from .test_client import PROJECTS_CSV, USERS_CSV, WORKDAYS_CSV
+
+
+class _Recorder(Instrumentation):
+    """Keeps every reported timing."""
+
+    def __init__(self) -> None:
+        self.requests: list[RequestTimings] = []
+        self.parses: list[ParseTimings] = []
+
+    def on_request(self, timings: RequestTimings) -> None:
+        self.requests.append(timings)
+
+    def on_parse(self, timings: ParseTimings) -> None:
+        self.parses.append(timings)
+
+
+class TestClientInstrumentation:
+    """Tests for the timings TimebutlerClient reports"""
+
+    async def test_phases_over_real_transport(self) -> None:
+        """Verify connect, TTFB, download and parse timings are reported, and the second call reuses the connection."""
+        recorder = _Recorder()
+        async with MockTimebutlerServer(MockServerConfig(rows={"worktime": 40})) as server:
+            async with TimebutlerClient(
+                api_key="test-api-key", base_url=server.base_url, instrumentation=recorder
+            ) as client:
+                await client.get_worktime(2026, 1)
+                await client.get_worktime(2026, 2)
+
+        first, second = recorder.requests
+        assert (first.endpoint, first.attempt, first.status, first.error) == ("worktime", 1, 200, None)
+        assert first.connection_reused is False and first.connect_seconds is not None
+        assert second.connection_reused is True and second.connect_seconds is None
+        assert first.ttfb_seconds is not None and first.download_seconds is not None
+        assert first.body_bytes == second.body_bytes > 0
+        assert [(p.endpoint, p.rows, p.error) for p in recorder.parses] == [("worktime", 40, None)] * 2
+        assert all(p.parse_seconds >= 0 for p in recorder.parses)
+
+    async def test_retried_attempts_are_reported_each(self) -> None:
+        """Verify every attempt of a retried call is reported with its status and Retry-After."""
+        recorder = _Recorder()
+        client = TimebutlerClient(
+            api_key="test-api-key",
+            retry_policy=RetryPolicy(initial_backoff=0, jitter=0, respect_retry_after=False),
+            instrumentation=recorder,
+        )
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "3"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=503, body="down")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        assert [(r.attempt, r.status, r.error, r.retry_after) for r in recorder.requests] == [
+            (1, 429, "TimebutlerRateLimitError", 3),
+            (2, 503, "TimebutlerServerError", None),
+            (3, 200, None, None),
+        ]
+        assert recorder.requests[2].body_bytes == len(PROJECTS_CSV.encode())
+        assert [p.rows for p in recorder.parses] == [1]
+
+    async def test_parse_error_is_reported(self) -> None:
+        """Verify a response that fails to parse is reported with the error."""
+        recorder = _Recorder()
+        client = TimebutlerClient(api_key="test-api-key", instrumentation=recorder)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body="Name\nno id")
+            with pytest.raises(TimebutlerParseError):
+                await client.get_projects()
+
+        assert [(p.endpoint, p.rows, p.error) for p in recorder.parses] == [("projects", 0, "TimebutlerParseError")]
+
+    async def test_get_workdays_reports_both_endpoints(self) -> None:
+        """Verify the two requests and parses of get_workdays are reported under their endpoints."""
+        recorder = _Recorder()
+        client = TimebutlerClient(api_key="test-api-key", instrumentation=recorder)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/workdays", status=200, body=WORKDAYS_CSV)
+            mocked.post("https://app.timebutler.com/api/v1/users", status=200, body=USERS_CSV)
+            await client.get_workdays()
+
+        assert sorted(r.endpoint for r in recorder.requests) == ["users", "workdays"]
+        assert sorted((p.endpoint, p.rows) for p in recorder.parses) == [("users", 1), ("workdays", 1)]
+
+    async def test_histograms_aggregate_calls(self) -> None:
+        """Verify HistogramInstrumentation observes every metric per endpoint and exports them."""
+        instrumentation = HistogramInstrumentation()
+        async with MockTimebutlerServer(MockServerConfig(rows={"projects": 25})) as server:
+            async with TimebutlerClient(
+                api_key="test-api-key", base_url=server.base_url, instrumentation=instrumentation
+            ) as client:
+                for _ in range(3):
+                    await client.get_projects()
+
+        assert instrumentation.histogram("projects", "ttfb_seconds").count == 3
+        assert instrumentation.histogram("projects", "connect_seconds").count == 1
+        assert instrumentation.histogram("projects", "rows").sum == 75
+        exported = instrumentation.to_dict()
+        assert set(exported["projects"]) >= {"body_bytes", "download_seconds", "parse_seconds", "rows"}
+        assert exported["projects"]["rows"]["buckets"]["100.0"] == 3
+
+
+class TestHistogram:
+    """Tests for Histogram"""
+
+    def test_buckets_are_cumulative(self) -> None:
+        """Verify values land in the first bucket whose bound they don't exceed."""
+        histogram = Histogram([1, 2, 5])
+        for value in (0.5, 1, 1.5, 4, 7):
+            histogram.observe(value)
+
+        assert histogram.buckets == [(1, 2), (2, 3), (5, 4), (math.inf, 5)]
+        assert (histogram.count, histogram.sum) == (5, 14)
+        assert histogram.to_dict()["buckets"] == {"1": 2, "2": 3, "5": 4, "+Inf": 5}
+
+    def test_quantile_interpolates_within_bucket(self) -> None:
+        """Verify quantiles are estimated like Prometheus' histogram_quantile."""
+        histogram = Histogram([10, 20])
+        for value in (1, 2, 15, 16):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 10
+        assert histogram.quantile(0.75) == 15
+        assert math.isnan(Histogram([1]).quantile(0.5))
+
+    def test_bounds_must_ascend(self) -> None:
+        """Verify empty or unordered bounds are rejected."""
+        with pytest.raises(ValueError):
+            Histogram([])
+        with pytest.raises(ValueError):
+            Histogram([2, 1])
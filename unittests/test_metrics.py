@@ -0,0 +1,98 @@
+"""Tests for PrometheusMetrics"""
+
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from timebutler_client import PrometheusMetrics, RetryPolicy, TimebutlerClient, TimebutlerParseError
+from timebutler_client.instrumentation import ParseTimings, RequestTimings
+
+from .test_client import PROJECTS_CSV
+
+
+def _samples(text: str) -> dict[str, str]:
+    """The sample lines of a rendering, as {metric with labels: value}."""
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+
+
+class TestPrometheusMetrics:
+    """Tests for PrometheusMetrics"""
+
+    async def test_counts_retried_call(self) -> None:
+        """Verify a call retried after a 429 and a 503 is counted per attempt, status class and endpoint."""
+        metrics = PrometheusMetrics()
+        client = TimebutlerClient(
+            api_key="test-api-key",
+            retry_policy=RetryPolicy(initial_backoff=0, jitter=0, respect_retry_after=False),
+            instrumentation=metrics,
+        )
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "30"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=503, body="down")
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        samples = _samples(metrics.render())
+        assert samples['timebutler_client_requests_total{endpoint="projects",status_class="2xx"}'] == "1"
+        assert samples['timebutler_client_requests_total{endpoint="projects",status_class="4xx"}'] == "1"
+        assert samples['timebutler_client_requests_total{endpoint="projects",status_class="5xx"}'] == "1"
+        assert samples['timebutler_client_retries_total{endpoint="projects"}'] == "2"
+        assert samples['timebutler_client_rate_limited_total{endpoint="projects"}'] == "1"
+        assert samples['timebutler_client_retry_after_seconds_bucket{endpoint="projects",le="10"}'] == "0"
+        assert samples['timebutler_client_retry_after_seconds_bucket{endpoint="projects",le="30"}'] == "1"
+        assert samples['timebutler_client_retry_after_seconds_sum{endpoint="projects"}'] == "30"
+        assert samples['timebutler_client_received_bytes_total{endpoint="projects"}'] == str(len(PROJECTS_CSV.encode()))
+        assert samples['timebutler_client_parsed_rows_total{endpoint="projects"}'] == "1"
+        assert samples['timebutler_client_request_duration_seconds_count{endpoint="projects"}'] == "3"
+        assert samples['timebutler_client_parse_duration_seconds_bucket{endpoint="projects",le="+Inf"}'] == "1"
+
+    async def test_counts_parse_errors(self) -> None:
+        """Verify responses failing with TimebutlerParseError are counted, but not their rows."""
+        metrics = PrometheusMetrics()
+        client = TimebutlerClient(api_key="test-api-key", instrumentation=metrics)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body="Name\nno id")
+            with pytest.raises(TimebutlerParseError):
+                await client.get_projects()
+
+        samples = _samples(metrics.render())
+        assert samples['timebutler_client_parse_errors_total{endpoint="projects"}'] == "1"
+        assert 'timebutler_client_parsed_rows_total{endpoint="projects"}' not in samples
+
+    def test_connection_errors_have_their_own_status_class(self) -> None:
+        """Verify attempts without a response are counted as "error" and not observed as duration."""
+        metrics = PrometheusMetrics(namespace="tb")
+        metrics.on_request(RequestTimings(endpoint="users", attempt=1, status=None, error="ClientConnectorError"))
+
+        samples = _samples(metrics.render())
+        assert samples['tb_requests_total{endpoint="users",status_class="error"}'] == "1"
+        assert not any(name.startswith("tb_request_duration_seconds_count") for name in samples)
+
+    def test_render_is_valid_exposition_format(self) -> None:
+        """Verify every metric family has HELP and TYPE lines, and label values are escaped."""
+        metrics = PrometheusMetrics()
+        metrics.on_parse(ParseTimings(endpoint='odd "name"\\', rows=3, parse_seconds=0.75))
+
+        text = metrics.render()
+
+        assert text.endswith("\n")
+        assert 'timebutler_client_parsed_rows_total{endpoint="odd \\"name\\"\\\\"} 3' in text
+        assert 'timebutler_client_parse_duration_seconds_sum{endpoint="odd \\"name\\"\\\\"} 0.75' in text
+        families = [line.split()[2] for line in text.splitlines() if line.startswith("# TYPE")]
+        helps = [line.split()[2] for line in text.splitlines() if line.startswith("# HELP")]
+        assert families == helps and len(families) == 9
+
+    def test_write_textfile_replaces_file(self, tmp_path: Path) -> None:
+        """Verify the rendering is written to the target, without temporary files left behind."""
+        metrics = PrometheusMetrics()
+        metrics.on_request(RequestTimings(endpoint="users", attempt=1, status=200, ttfb_seconds=0.1, body_bytes=10))
+        target = tmp_path / "timebutler.prom"
+        target.write_text("stale")
+
+        metrics.write_textfile(target)
+
+        assert target.read_text(encoding="utf-8") == metrics.render()
+        assert [path.name for path in tmp_path.iterdir()] == ["timebutler.prom"]
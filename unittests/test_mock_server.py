@@ -0,0 +1,107 @@
+"""End-to-end tests of TimebutlerClient over a real HTTP transport, against the local mock server."""
+
+import asyncio
+
+import pytest
+
+from benchmarks.load_test import percentile, run_load_test
+from benchmarks.mock_server import MockServerConfig, MockTimebutlerServer
+from timebutler_client import (
+    RetryPolicy,
+    TimebutlerClient,
+    TimebutlerRateLimitError,
+    TimebutlerServerError,
+)
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+
+class TestMockServer:
+    """Tests for the client against MockTimebutlerServer"""
+
+    async def test_sequential_calls_reuse_one_connection(self) -> None:
+        """Verify the pooled session of the client keeps one connection alive across calls."""
+        config = MockServerConfig(rows={"worktime": 50, "users": 60, "workdays": 150})
+        async with MockTimebutlerServer(config) as server:
+            async with TimebutlerClient(api_key="test-api-key", base_url=server.base_url) as client:
+                entries = await client.get_worktime(2026, 1)
+                users = await client.get_users()
+                workdays = await client.get_workdays(users)
+
+        assert len(entries) == 50
+        assert len(users) == 59  # one user has an unusable employee number
+        assert workdays.schedules[0].valid_from == UNLIMITED_DATE
+        assert server.stats.requests.total() == 3
+        assert len(server.stats.connections) == 1
+
+    async def test_rate_limit_carries_retry_after(self) -> None:
+        """Verify a 429 response is raised with the server's Retry-After."""
+        async with MockTimebutlerServer(MockServerConfig(rate_limited_ratio=1, retry_after=7)) as server:
+            client = TimebutlerClient(api_key="test-api-key", base_url=server.base_url)
+            with pytest.raises(TimebutlerRateLimitError) as exc_info:
+                await client.get_projects()
+
+        assert exc_info.value.retry_after == 7
+
+    async def test_server_errors_are_retried(self) -> None:
+        """Verify 5xx responses are retried until the attempts are used up."""
+        config = MockServerConfig(server_error_ratio=1, server_error_status=502)
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0, jitter=0)
+        async with MockTimebutlerServer(config) as server:
+            client = TimebutlerClient(api_key="test-api-key", base_url=server.base_url, retry_policy=policy)
+            with pytest.raises(TimebutlerServerError) as exc_info:
+                await client.get_services()
+
+        assert exc_info.value.status_code == 502
+        assert server.stats.statuses == {502: 3}
+
+    async def test_slow_server_times_out(self) -> None:
+        """Verify the client's total timeout applies to the real transport."""
+        async with MockTimebutlerServer(MockServerConfig(latency=0.3)) as server:
+            client = TimebutlerClient(api_key="test-api-key", base_url=server.base_url, timeout=0.05)
+            with pytest.raises(TimeoutError):
+                await client.get_projects()
+
+    async def test_max_concurrency_limits_requests_in_flight(self) -> None:
+        """Verify max_concurrency caps the requests the server sees at the same time."""
+        async with MockTimebutlerServer(MockServerConfig(latency=0.02)) as server:
+            async with TimebutlerClient(
+                api_key="test-api-key", base_url=server.base_url, max_concurrency=2, coalesce_requests=False
+            ) as client:
+                await asyncio.gather(*(client.get_services() for _ in range(6)))
+
+        assert server.stats.requests["services"] == 6
+        assert server.stats.max_in_flight == 2
+
+    async def test_throttled_download_is_streamed(self) -> None:
+        """Verify a body sent in chunks at a limited bandwidth is parsed completely."""
+        config = MockServerConfig(rows={"worktime": 3_000}, bytes_per_second=10_000_000)
+        async with MockTimebutlerServer(config) as server:
+            client = TimebutlerClient(api_key="test-api-key", base_url=server.base_url)
+            entries = [entry async for entry in client.iter_worktime(2026, 1)]
+
+        assert len(entries) == 3_000
+
+    async def test_load_test_reports_latencies(self) -> None:
+        """Verify the load test harness records one latency per successful call and retries injected 429s."""
+        config = MockServerConfig(rows={"worktime": 20}, rate_limited_ratio=0.3, retry_after=0)
+        policy = RetryPolicy(max_attempts=10, initial_backoff=0, jitter=0)
+
+        result = await run_load_test(
+            config, requests=20, concurrency=4, endpoints=["worktime", "projects"], retry_policy=policy
+        )
+
+        assert not result.errors
+        assert result.calls == 20
+        assert result.server.statuses[429] > 0
+        assert percentile(sorted(result.latencies["worktime"]), 0.99) > 0
+
+
+class TestPercentile:
+    """Tests for the percentiles of the load test report"""
+
+    def test_nearest_rank(self) -> None:
+        """Verify percentiles pick an actual value by nearest rank."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert [percentile(values, fraction) for fraction in (0.5, 0.95, 0.99, 1)] == [50, 95, 99, 100]
+        assert percentile([3.0], 0.5) == 3.0
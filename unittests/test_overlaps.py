@@ -0,0 +1,122 @@
+"""Tests for find_overlapping_worktime() and find_worktime_during_absences()"""
+
+from datetime import date, time, timedelta
+from itertools import combinations
+from typing import Any
+
+from timebutler_client import Absence, WorktimeEntry, find_overlapping_worktime, find_worktime_during_absences
+
+from .test_worktime import EXPECTED_ENTRIES
+
+
+def _entry(entry_id: int, day: date, start: time, end: time, user_id: int = 1, **kwargs: Any) -> WorktimeEntry:
+    return WorktimeEntry(
+        **{
+            "id": entry_id,
+            "user_id": user_id,
+            "employee_number": f"{user_id:05d}",
+            "date": day,
+            "start_time": start,
+            "end_time": end,
+            "working_time_seconds": 0,
+            "state": "Done",
+            **kwargs,
+        }
+    )
+
+
+def _absence(absence_id: int, from_date: date, to_date: date, employee_number: str = "00001", **kwargs: Any) -> Absence:
+    return Absence(
+        **{
+            "id": absence_id,
+            "from_date": from_date,
+            "to_date": to_date,
+            "employee_number": employee_number,
+            "state": "Approved",
+            **kwargs,
+        }
+    )
+
+
+DAY = date(2026, 1, 5)
+
+
+class TestFindOverlappingWorktime:
+    """Tests for find_overlapping_worktime()"""
+
+    def test_sample_data_has_no_overlaps(self) -> None:
+        """Verify back-to-back entries (10:00-10:30 followed by 10:30-17:15) are not reported."""
+        assert not find_overlapping_worktime(EXPECTED_ENTRIES)
+
+    def test_overlapping_pairs_are_reported(self) -> None:
+        """Verify all overlapping pairs of a user are found, with the overlap length."""
+        long = _entry(1, DAY, time(8, 0), time(17, 0))
+        inner = _entry(2, DAY, time(9, 0), time(10, 0))
+        late = _entry(3, DAY, time(16, 30), time(18, 0))
+        other_user = _entry(4, DAY, time(9, 0), time(10, 0), user_id=2)
+
+        overlaps = find_overlapping_worktime([late, other_user, inner, long])
+
+        assert [(o.first.id, o.second.id, o.overlap) for o in overlaps] == [
+            (1, 2, timedelta(hours=1)),
+            (1, 3, timedelta(minutes=30)),
+        ]
+
+    def test_entries_past_midnight(self) -> None:
+        """Verify an entry ending before its start runs into the next day."""
+        night = _entry(1, DAY, time(22, 0), time(2, 0))
+        early = _entry(2, DAY + timedelta(days=1), time(1, 0), time(3, 0))
+        next_evening = _entry(3, DAY + timedelta(days=1), time(22, 0), time(23, 0))
+
+        overlaps = find_overlapping_worktime([night, early, next_evening])
+
+        assert [(o.first.id, o.second.id, o.overlap) for o in overlaps] == [(1, 2, timedelta(hours=1))]
+
+    def test_matches_pairwise_comparison(self) -> None:
+        """Verify the sweep finds exactly the pairs a quadratic comparison finds."""
+        entries = [
+            _entry(
+                entry_id,
+                DAY + timedelta(days=entry_id % 3),
+                time(entry_id * 7 % 20, 0),
+                time(entry_id * 7 % 20 + 3, 30),
+            )
+            for entry_id in range(1, 40)
+        ]
+
+        def _overlaps(a: WorktimeEntry, b: WorktimeEntry) -> bool:
+            return a.date == b.date and a.start_time < b.end_time and b.start_time < a.end_time
+
+        expected = {frozenset((a.id, b.id)) for a, b in combinations(entries, 2) if _overlaps(a, b)}
+
+        actual = {frozenset((o.first.id, o.second.id)) for o in find_overlapping_worktime(entries)}
+
+        assert expected and actual == expected
+
+
+class TestFindWorktimeDuringAbsences:
+    """Tests for find_worktime_during_absences()"""
+
+    def test_entries_on_absent_days_are_reported(self) -> None:
+        """Verify entries inside an absence's inclusive date range are found, per employee."""
+        vacation = _absence(1, date(2026, 1, 5), date(2026, 1, 7))
+        sick = _absence(2, date(2026, 1, 7), date(2026, 1, 7))
+        entries = [
+            _entry(1, date(2026, 1, 4), time(9), time(10)),
+            _entry(2, date(2026, 1, 5), time(9), time(10)),
+            _entry(3, date(2026, 1, 7), time(9), time(10)),
+            _entry(4, date(2026, 1, 8), time(9), time(10)),
+            _entry(5, date(2026, 1, 5), time(9), time(10), user_id=2),
+        ]
+
+        conflicts = find_worktime_during_absences(entries, [sick, vacation])
+
+        assert [(c.entry.id, c.absence.id) for c in conflicts] == [(2, 1), (3, 1), (3, 2)]
+
+    def test_half_days_are_skipped_by_default(self) -> None:
+        """Verify half-day absences only count with include_half_days=True."""
+        half_day = _absence(1, DAY, DAY, half_day=True, morning=True)
+        entry = _entry(1, DAY, time(13), time(17))
+
+        assert not find_worktime_during_absences([entry], [half_day])
+        assert len(find_worktime_during_absences([entry], [half_day], include_half_days=True)) == 1
@@ -1,6 +1,7 @@
 """Tests for TimebutlerClient.get_projects()"""
 
 from datetime import date
+from typing import Literal
 
 import pytest
 from aioresponses import aioresponses
@@ -221,3 +222,55 @@ class TestGetProjects:
 
         assert projects[0].is_active is True  # Active
         assert projects[4].is_active is False  # Inactive
+
+    async def test_get_projects_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/projects",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            result = await client.get_projects()
+
+        assert result == EXPECTED_PROJECTS
+        assert [r.model_dump() for r in result] == [e.model_dump() for e in EXPECTED_PROJECTS]
+
+    @pytest.mark.parametrize("parse_mode", ["strict", "fast"])
+    async def test_get_projects_ignores_cells_beyond_the_header(self, parse_mode: Literal["strict", "fast"]) -> None:
+        """Verify a surplus cell of an over-long row does not fill a column missing from the header in either mode."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode=parse_mode)
+        body = "ID of the project;Name;State;Budget in hours;Creation date\n34343;ABC1234;Active;0;23/08/2024;surplus"
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, headers=RESPONSE_HEADERS, body=body)
+
+            projects = await client.get_projects()
+
+        assert len(projects) == 1
+        assert projects[0].comments is None
+        assert projects[0].creation_date == date(2024, 8, 23)
+
+
+class TestIterProjects:
+    """Tests for TimebutlerClient.iter_projects()"""
+
+    async def test_iter_projects_yields_same_models_as_get_projects(self) -> None:
+        """Verify streaming yields the same Project models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/projects",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            actual = [project async for project in client.iter_projects()]
+
+        assert actual == EXPECTED_PROJECTS
@@ -0,0 +1,176 @@
+"""Tests for RateLimiter and its use by TimebutlerClient."""
+
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from timebutler_client import RateLimiter, RetryPolicy, TimebutlerClient, TimebutlerRateLimitError
+
+PROJECTS_CSV = """\
+ID of the project;Name;State;Budget in hours;Comments;Creation date
+12345;Internal;Active;0;;01/01/2025"""
+
+
+class TestRateLimiter:
+    """Tests for the token bucket itself."""
+
+    async def test_burst_is_available_immediately(self) -> None:
+        """Verify up to `burst` tokens can be acquired without waiting."""
+        limiter = RateLimiter(rate=1, burst=5)
+
+        started = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.monotonic() - started < 0.5
+
+    async def test_acquire_waits_once_bucket_is_empty(self) -> None:
+        """Verify acquisitions beyond the burst are spread out according to the rate."""
+        limiter = RateLimiter(rate=50, burst=1)
+
+        started = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09  # 5 refills at 20ms each, with some tolerance
+
+    async def test_concurrent_acquirers_share_the_bucket(self) -> None:
+        """Verify concurrent tasks are throttled by the same bucket."""
+        limiter = RateLimiter(rate=50, burst=2)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(7)))
+
+        assert time.monotonic() - started >= 0.09
+
+    def test_adaptive_rate_shrinks_and_recovers(self) -> None:
+        """Verify an adaptive limiter halves its rate on 429 and recovers on success."""
+        limiter = RateLimiter(rate=10, adaptive=True, min_rate=2, recovery_step=1)
+
+        limiter.on_rate_limited()
+        assert limiter.rate == 5
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        assert limiter.rate == 2  # clamped at min_rate
+
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.rate == 10  # never above the configured rate
+
+    def test_non_adaptive_rate_is_constant(self) -> None:
+        """Verify a non-adaptive limiter keeps its rate on 429."""
+        limiter = RateLimiter(rate=10)
+
+        limiter.on_rate_limited()
+
+        assert limiter.rate == 10
+
+    async def test_retry_after_pauses_the_bucket(self) -> None:
+        """Verify a reported Retry-After delays the next acquisition."""
+        limiter = RateLimiter(rate=1000, burst=10)
+
+        limiter.on_rate_limited(retry_after=0.1)
+        started = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "burst": 0}, {"rate": 1, "decrease_factor": 1}])
+    def test_rejects_invalid_configuration(self, kwargs: dict[str, float]) -> None:
+        """Verify invalid settings raise ValueError."""
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)  # type: ignore[arg-type]
+
+
+class TestClientThrottling:
+    """Tests for rate limiting and concurrency limiting inside TimebutlerClient."""
+
+    async def test_client_reports_429_to_limiter(self) -> None:
+        """Verify a 429 response shrinks the rate of an adaptive limiter shared with the client."""
+        limiter = RateLimiter(rate=100, burst=10, adaptive=True)
+        client = TimebutlerClient(api_key="test-api-key", rate_limiter=limiter)
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429)
+
+            with pytest.raises(TimebutlerRateLimitError):
+                await client.get_projects()
+
+        assert client.rate_limiter is limiter
+        assert limiter.rate == 50
+
+    async def test_retries_pass_through_the_limiter(self) -> None:
+        """Verify retried requests are throttled too, and success lets the rate recover."""
+        limiter = RateLimiter(rate=100, burst=10, adaptive=True, recovery_step=100)
+        client = TimebutlerClient(
+            api_key="test-api-key",
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(initial_backoff=0, jitter=0),
+        )
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429)
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            projects = await client.get_projects()
+
+        assert [p.id for p in projects] == [12345]
+        assert limiter.rate == 100
+
+    async def test_max_concurrency_bounds_requests_in_flight(self) -> None:
+        """Verify no more than max_concurrency requests run at the same time."""
+        client = TimebutlerClient(api_key="test-api-key", max_concurrency=2, coalesce_requests=False)
+        in_flight = 0
+        peak = 0
+
+        async def _slow_response(*_args: object, **_kwargs: object) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/projects",
+                status=200,
+                body=PROJECTS_CSV,
+                callback=_slow_response,
+                repeat=True,
+            )
+            async with client:
+                await asyncio.gather(*(client.get_projects() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_waiting_for_a_token_holds_no_concurrency_slot(self, stream: bool) -> None:
+        """Verify a request waits for its rate limiter token before it takes a concurrency slot."""
+        limiter = RateLimiter(rate=20, burst=1)
+        client = TimebutlerClient(
+            api_key="test-api-key", rate_limiter=limiter, max_concurrency=1, coalesce_requests=False
+        )
+        await limiter.acquire()  # empty the bucket, the next token is due in 50ms
+
+        async def _fetch() -> None:
+            if stream:
+                assert len([project async for project in client.iter_projects()]) == 1
+            else:
+                assert len(await client.get_projects()) == 1
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            async with client:
+                task = asyncio.create_task(_fetch())
+                await asyncio.sleep(0.01)
+                assert not task.done()
+                assert client._concurrency is not None  # pylint: disable=protected-access
+                assert not client._concurrency.locked()  # pylint: disable=protected-access
+                await task
+                assert not client._concurrency.locked()  # pylint: disable=protected-access
+
+    def test_rejects_invalid_max_concurrency(self) -> None:
+        """Verify max_concurrency below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            TimebutlerClient(api_key="test-api-key", max_concurrency=0)
@@ -0,0 +1,179 @@
+"""Tests for SQLiteResponseCache and its use by TimebutlerClient."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from aioresponses import aioresponses
+
+from timebutler_client import SQLiteResponseCache, TimebutlerClient
+
+from .test_worktime import EXPECTED_ENTRIES, SAMPLE_CSV
+
+WORKTIME_URL = "https://app.timebutler.com/api/v1/worktime"
+#: 2026-03-15 12:00 UTC
+NOW = datetime(2026, 3, 15, 12, tzinfo=UTC).timestamp()
+
+
+class _FakeClock:
+    """Manually advanced Unix time."""
+
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSQLiteResponseCache:
+    """Tests for the cache file itself."""
+
+    def test_stored_response_is_fresh_until_ttl(self) -> None:
+        """Verify get_fresh() serves a body younger than the TTL only."""
+        clock = _FakeClock()
+        cache = SQLiteResponseCache(":memory:", ttl=60, endpoint_ttl={"users": 3600}, clock=clock)
+
+        stored = cache.put("projects", None, "body")
+        cache.put("users", None, "users body")
+
+        assert stored.sha256 == "230d8358dc8e8890b4c58deeb62912ee2f20357ae92a5cc861b98e68fe31acb5"
+        assert stored.fetched_at == datetime(2026, 3, 15, 12, tzinfo=UTC)
+        assert cache.get_fresh("projects") == "body"
+        clock.now += 60
+        assert cache.get_fresh("projects") is None
+        assert cache.get("projects") == stored  # stale responses are still stored
+        assert cache.get_fresh("users") == "users body"
+
+    def test_keys_include_parameters_in_any_order(self) -> None:
+        """Verify responses are keyed by endpoint and sorted parameters."""
+        cache = SQLiteResponseCache(":memory:", clock=_FakeClock())
+
+        cache.put("worktime", {"year": "2026", "month": "1"}, "january")
+        cache.put("worktime", {"year": "2026", "month": "2"}, "february")
+
+        assert cache.get_fresh("worktime", {"month": "1", "year": "2026"}) == "january"
+        assert cache.get_fresh("worktime", {"month": "2", "year": "2026"}) == "february"
+        assert cache.get_fresh("worktime") is None
+
+    def test_closed_worktime_months_are_immutable(self) -> None:
+        """Verify months that ended longer ago than immutable_after never expire."""
+        clock = _FakeClock()
+        cache = SQLiteResponseCache(":memory:", ttl=60, immutable_after=timedelta(days=30), clock=clock)
+
+        january = cache.put("worktime", {"year": "2026", "month": "1"}, "january")  # ended 43 days ago
+        february = cache.put("worktime", {"year": "2026", "month": "2"}, "february")  # ended 15 days ago
+        clock.now += 86400 * 365
+
+        assert january.immutable
+        assert not february.immutable
+        assert cache.get_fresh("worktime", {"year": "2026", "month": "1"}) == "january"
+        assert cache.get_fresh("worktime", {"year": "2026", "month": "2"}) is None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Verify a new cache on the same file serves the stored responses."""
+        path = tmp_path / "cache.sqlite3"
+        first = SQLiteResponseCache(path, clock=_FakeClock())
+        first.put("services", None, "services body")
+        first.close()
+
+        second = SQLiteResponseCache(path, clock=_FakeClock())
+
+        assert second.get_fresh("services") == "services body"
+
+    def test_invalidate(self) -> None:
+        """Verify invalidate() deletes one endpoint or all of them."""
+        cache = SQLiteResponseCache(":memory:", clock=_FakeClock())
+        cache.put("projects", None, "projects body")
+        cache.put("services", None, "services body")
+
+        cache.invalidate("projects")
+        assert cache.get("projects") is None
+        assert cache.get("services") is not None
+        cache.invalidate()
+        assert cache.get("services") is None
+
+    def test_parse_reuses_result_for_same_body(self) -> None:
+        """Verify parse() only calls the parser for bodies it has not seen."""
+        cache = SQLiteResponseCache(":memory:", parsed_cache_size=2)
+        calls: list[str] = []
+
+        def _parse(body: str) -> list[str]:
+            calls.append(body)
+            return body.split(",")
+
+        first = cache.parse("kind", "a,b", _parse)
+        assert cache.parse("kind", "a,b", _parse) is first
+        cache.parse("other kind", "a,b", _parse)
+        cache.parse("kind", "c", _parse)  # evicts the least recently used result
+        cache.parse("kind", "a,b", _parse)
+
+        assert calls == ["a,b", "a,b", "c", "a,b"]
+
+
+class TestClientResponseCache:
+    """Tests for response_cache on TimebutlerClient."""
+
+    async def test_warm_start_serves_stored_response(self, tmp_path: Path) -> None:
+        """Verify a new client on the same cache file does not send a request."""
+        path = tmp_path / "cache.sqlite3"
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=SAMPLE_CSV)
+            cold = TimebutlerClient(api_key="test-api-key", response_cache=SQLiteResponseCache(path))
+            assert await cold.get_worktime(year=2026, month=1) == EXPECTED_ENTRIES
+
+            warm = TimebutlerClient(api_key="test-api-key", response_cache=SQLiteResponseCache(path))
+            assert await warm.get_worktime(year=2026, month=1) == EXPECTED_ENTRIES
+
+            assert len(next(iter(mocked.requests.values()))) == 1
+
+    async def test_unchanged_body_is_not_parsed_again(self) -> None:
+        """Verify a refetch after the TTL returning the same body reuses the parsed models."""
+        clock = _FakeClock()
+        client = TimebutlerClient(
+            api_key="test-api-key", response_cache=SQLiteResponseCache(":memory:", ttl=60, clock=clock)
+        )
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=SAMPLE_CSV, repeat=True)
+            first = await client.get_worktime(year=2026, month=1)
+            clock.now += 120
+            second = await client.get_worktime(year=2026, month=1)
+
+            assert len(next(iter(mocked.requests.values()))) == 2
+
+        assert second == first
+        assert second[0] is first[0]
+
+    async def test_parse_results_are_not_shared_between_parse_modes(self) -> None:
+        """Verify a strict and a fast client sharing a cache each get the models of their own parser."""
+        cache = SQLiteResponseCache(":memory:", clock=_FakeClock())
+        strict = TimebutlerClient(api_key="test-api-key", response_cache=cache)
+        fast = TimebutlerClient(api_key="test-api-key", response_cache=cache, parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=SAMPLE_CSV, repeat=True)
+            strict_entries = await strict.get_worktime(2026, 1)
+            fast_entries = await fast.get_worktime(2026, 1)
+            strict_again = await strict.get_worktime(2026, 1)
+
+        assert fast_entries == strict_entries == EXPECTED_ENTRIES
+        assert fast_entries[0] is not strict_entries[0]
+        assert strict_again[0] is strict_entries[0]
+
+    async def test_immutable_months_of_worktime_range_are_not_refetched(self) -> None:
+        """Verify get_worktime_range() serves closed months from the cache, even after the TTL."""
+        clock = _FakeClock()
+        cache = SQLiteResponseCache(":memory:", ttl=60, immutable_after=timedelta(days=30), clock=clock)
+        client = TimebutlerClient(api_key="test-api-key", response_cache=cache)
+        start, end = datetime(2026, 1, 1).date(), datetime(2026, 2, 28).date()
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=200, body=SAMPLE_CSV, repeat=True)
+            await client.get_worktime_range(start, end)
+            clock.now += 3600
+            await client.get_worktime_range(start, end)
+
+            months = [call.kwargs["data"]["month"] for call in next(iter(mocked.requests.values()))]
+
+        assert months.count("1") == 1
+        assert months.count("2") == 2
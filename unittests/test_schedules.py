@@ -0,0 +1,83 @@
+"""Tests for ScheduleIndex"""
+
+from datetime import date
+
+from timebutler_client import ScheduleIndex, WorkdaySchedule, WorkdaysResult
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+from .test_workdays import EXPECTED_SCHEDULES
+
+
+def _schedule(user_id: int, valid_from: date, minutes: int) -> WorkdaySchedule:
+    return WorkdaySchedule(
+        user_id=user_id,
+        valid_from=valid_from,
+        employee_number="00001",
+        monday_minutes=minutes,
+        tuesday_minutes=minutes,
+        wednesday_minutes=minutes,
+        thursday_minutes=minutes,
+        friday_minutes=minutes,
+    )
+
+
+class TestScheduleIndex:
+    """Tests for ScheduleIndex"""
+
+    def test_schedule_in_effect_is_resolved(self) -> None:
+        """Verify each date resolves to the latest schedule starting on or before it."""
+        index = ScheduleIndex.from_result(
+            WorkdaysResult(schedules=list(reversed(EXPECTED_SCHEDULES)), invalid_employees=[])
+        )
+
+        assert index.schedule_at(928812, date(2019, 12, 31)) is None
+        assert index.schedule_at(928812, date(2020, 1, 1)) == EXPECTED_SCHEDULES[0]
+        assert index.schedule_at(928812, date(2024, 2, 29)) == EXPECTED_SCHEDULES[0]
+        assert index.schedule_at(928812, date(2024, 3, 1)) == EXPECTED_SCHEDULES[1]
+        assert index.schedule_at(928812, date(2099, 1, 1)) == EXPECTED_SCHEDULES[1]
+        assert index.schedule_at(1, date(2024, 3, 1)) is None
+
+    def test_minutes_follow_the_weekday(self) -> None:
+        """Verify minutes_at() picks the weekday's minutes of the schedule in effect."""
+        index = ScheduleIndex(EXPECTED_SCHEDULES)
+
+        assert index.minutes_at(928812, date(2024, 3, 1)) == 240  # Friday, new schedule
+        assert index.minutes_at(928812, date(2024, 2, 23)) == 480  # Friday, old schedule
+        assert index.minutes_at(928812, date(2024, 3, 2)) == 0  # Saturday
+        assert index.minutes_at(928812, date(2019, 1, 7)) == 0  # before the first schedule
+        assert index.minutes_at(1, date(2024, 3, 1)) == 0  # unknown user
+
+    def test_vector_lookups_match_single_lookups(self) -> None:
+        """Verify schedules_at() and minutes_on() agree with the scalar lookups."""
+        index = ScheduleIndex(EXPECTED_SCHEDULES)
+        days = [date(2024, 2, 26 + offset) if offset < 4 else date(2024, 3, offset - 3) for offset in range(10)]
+
+        assert index.schedules_at(928812, days) == [index.schedule_at(928812, day) for day in days]
+        assert index.minutes_on(928812, days) == [index.minutes_at(928812, day) for day in days]
+        assert index.minutes_on(1, days) == [0] * 10
+        assert index.schedules_at(1, days) == [None] * 10
+
+    def test_unlimited_start_covers_all_earlier_dates(self) -> None:
+        """Verify a schedule valid from 'unlimited' applies to any date before the next entry."""
+        index = ScheduleIndex([_schedule(1, date(2025, 1, 1), 240), _schedule(1, UNLIMITED_DATE, 480)])
+
+        assert index.minutes_at(1, date(1899, 12, 29)) == 480
+        assert index.minutes_at(1, date(2024, 12, 31)) == 480
+        assert index.minutes_at(1, date(2025, 1, 1)) == 240
+
+    def test_duplicate_start_dates_keep_the_last_entry(self) -> None:
+        """Verify the later of two entries with the same valid_from wins."""
+        index = ScheduleIndex([_schedule(1, date(2025, 1, 1), 240), _schedule(1, date(2025, 1, 1), 300)])
+
+        assert index.history(1) == [_schedule(1, date(2025, 1, 1), 300)]
+
+    def test_container_protocol(self) -> None:
+        """Verify len(), in and iteration work on user IDs."""
+        index = ScheduleIndex(EXPECTED_SCHEDULES)
+
+        assert len(index) == 3
+        assert 322219 in index
+        assert 1 not in index
+        assert sorted(index) == [300224, 322219, 928812]
+        assert index.history(928812) == EXPECTED_SCHEDULES[:2]
+        assert index.history(1) == []
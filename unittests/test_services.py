@@ -226,3 +226,40 @@ class TestGetServices:
 
         assert services[0].billable is True  # Development - billable
         assert services[2].billable is False  # Internal - not billable
+
+    async def test_get_services_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/services",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV_WITH_DATA,
+            )
+
+            result = await client.get_services()
+
+        assert result == EXPECTED_SERVICES
+        assert [r.model_dump() for r in result] == [e.model_dump() for e in EXPECTED_SERVICES]
+
+
+class TestIterServices:
+    """Tests for TimebutlerClient.iter_services()"""
+
+    async def test_iter_services_yields_same_models_as_get_services(self) -> None:
+        """Verify streaming yields the same Service models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/services",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV_WITH_DATA,
+            )
+
+            actual = [service async for service in client.iter_services()]
+
+        assert actual == EXPECTED_SERVICES
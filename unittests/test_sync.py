@@ -0,0 +1,165 @@
+"""Tests for WorktimeSync"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from timebutler_client import TimebutlerClient, TimebutlerServerError, WorktimeSync, WorktimeSyncState
+
+from .test_worktime import RESPONSE_HEADERS, WORKTIME_HEADER
+
+WORKTIME_URL = "https://app.timebutler.com/api/v1/worktime"
+TODAY = date(2026, 3, 15)
+
+
+class _FakeWorktime:
+    """Serves /worktime from a mutable set of rows and records the requested months."""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, tuple[date, str, int]] = {}  # entry ID -> (date, state, working seconds)
+        self.requested: list[tuple[int, int]] = []
+
+    def add(self, entry_id: int, day: date, state: str = "Done", seconds: int = 3600) -> None:
+        self.rows[entry_id] = (day, state, seconds)
+
+    def __call__(self, *_args: Any, **kwargs: Any) -> CallbackResult:
+        data = kwargs["data"]
+        year, month = int(data["year"]), int(data["month"])
+        self.requested.append((year, month))
+        lines = [
+            f"{entry_id};1;00001;{day:%d/%m/%Y};09:00;10:00;{seconds};0;{state};0;0;;false"
+            for entry_id, (day, state, seconds) in self.rows.items()
+            if (day.year, day.month) == (year, month)
+        ]
+        return CallbackResult(status=200, headers=RESPONSE_HEADERS, body="\n".join([WORKTIME_HEADER, *lines]))
+
+
+class TestWorktimeSync:
+    """Tests for WorktimeSync.sync()"""
+
+    async def test_first_sync_fetches_every_month_and_reports_all_as_added(self) -> None:
+        """Verify a sync without state fetches the whole range."""
+        server = _FakeWorktime()
+        server.add(1, date(2026, 1, 5))
+        server.add(2, date(2026, 3, 2))
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"))
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            result = await sync.sync(date(2026, 1, 1), today=TODAY)
+
+        assert sorted(server.requested) == [(2026, 1), (2026, 2), (2026, 3)]
+        assert sorted(result.added) == [1, 2]
+        assert not result.changed and not result.removed
+        assert result.refreshed_months == ["2026-01", "2026-02", "2026-03"]
+        assert [entry.id for entry in result.entries] == [1, 2]
+
+    async def test_final_months_are_skipped_and_changes_detected(self) -> None:
+        """Verify only recent months are refetched and added/changed/removed IDs are reported."""
+        server = _FakeWorktime()
+        server.add(1, date(2025, 12, 1))
+        server.add(2, date(2026, 2, 10))
+        server.add(3, date(2026, 3, 2))
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"), recent_months=1)
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            await sync.sync(date(2025, 12, 1), today=TODAY)
+            server.requested.clear()
+            server.add(1, date(2025, 12, 1), seconds=7200)  # too old to be noticed
+            server.add(2, date(2026, 2, 10), seconds=7200)
+            del server.rows[3]
+            server.add(4, date(2026, 3, 3))
+            result = await sync.sync(date(2025, 12, 1), today=TODAY)
+
+        assert sorted(server.requested) == [(2026, 2), (2026, 3)]
+        assert result.skipped_months == ["2025-12", "2026-01"]
+        assert result.added == [4]
+        assert result.changed == [2]
+        assert result.removed == [3]
+        assert result.has_changes
+
+    async def test_months_with_pending_entries_are_refreshed(self) -> None:
+        """Verify a month is refetched as long as it contains entries in a non-final state."""
+        server = _FakeWorktime()
+        server.add(1, date(2025, 10, 1), state="Requested")
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"), recent_months=0)
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            await sync.sync(date(2025, 10, 1), date(2025, 10, 31), today=TODAY)
+            server.add(1, date(2025, 10, 1), state="Done")
+            approved = await sync.sync(date(2025, 10, 1), date(2025, 10, 31), today=TODAY)
+            unchanged = await sync.sync(date(2025, 10, 1), date(2025, 10, 31), today=TODAY)
+
+        assert approved.changed == [1]
+        assert unchanged.refreshed_months == []
+        assert unchanged.skipped_months == ["2025-10"]
+        assert not unchanged.has_changes
+
+    async def test_entry_moved_to_another_month_is_changed(self) -> None:
+        """Verify an entry whose date moves between refreshed months is reported as changed, not added and removed."""
+        server = _FakeWorktime()
+        server.add(1, date(2026, 2, 27))
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"))
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            await sync.sync(date(2026, 2, 1), today=TODAY)
+            server.add(1, date(2026, 3, 2))
+            result = await sync.sync(date(2026, 2, 1), today=TODAY)
+
+        assert result.changed == [1]
+        assert not result.added and not result.removed
+
+    async def test_per_user_months_are_tracked_separately(self) -> None:
+        """Verify user_ids sends one request per user and month with its own state key."""
+        server = _FakeWorktime()
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"))
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            result = await sync.sync(date(2026, 3, 1), user_ids=[7, 8], today=TODAY)
+
+        assert result.refreshed_months == ["2026-03/7", "2026-03/8"]
+        assert set(sync.state.months) == {"2026-03/7", "2026-03/8"}
+
+    async def test_failed_sync_leaves_state_untouched(self) -> None:
+        """Verify the state is only updated if all requests succeed."""
+        sync = WorktimeSync(TimebutlerClient(api_key="test-api-key"))
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, status=503, body="unavailable", repeat=True)
+            with pytest.raises(TimebutlerServerError):
+                await sync.sync(date(2026, 3, 1), today=TODAY)
+
+        assert not sync.state.months
+
+    async def test_state_survives_save_and_load(self, tmp_path: Path) -> None:
+        """Verify a saved state lets the next run skip final months."""
+        server = _FakeWorktime()
+        server.add(1, date(2025, 11, 3))
+        path = tmp_path / "sync.json"
+
+        with aioresponses() as mocked:
+            mocked.post(WORKTIME_URL, callback=server, repeat=True)
+            first = WorktimeSync(TimebutlerClient(api_key="test-api-key"), WorktimeSyncState.load(path))
+            await first.sync(date(2025, 11, 1), date(2025, 11, 30), today=TODAY)
+            first.state.save(path)
+            second = WorktimeSync(TimebutlerClient(api_key="test-api-key"), WorktimeSyncState.load(path))
+            result = await second.sync(date(2025, 11, 1), date(2025, 11, 30), today=TODAY)
+
+        assert server.requested == [(2025, 11)]
+        assert result.skipped_months == ["2025-11"]
+        assert second.state == first.state
+
+    def test_invalid_arguments_are_rejected(self) -> None:
+        """Verify negative recent_months and zero concurrency raise ValueError."""
+        client = TimebutlerClient(api_key="test-api-key")
+        with pytest.raises(ValueError):
+            WorktimeSync(client, recent_months=-1)
+        with pytest.raises(ValueError):
+            WorktimeSync(client, concurrency=0)
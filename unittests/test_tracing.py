@@ -0,0 +1,126 @@
+"""Tests for the OpenTelemetry spans of TimebutlerClient"""
+
+import pytest
+from aioresponses import aioresponses
+
+pytest.importorskip("opentelemetry.sdk")
+
+# pylint: disable=wrong-import-position
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import NoOpTracer, StatusCode
+
+from timebutler_client import HistogramInstrumentation, RetryPolicy, TimebutlerClient
+
+from .test_client import PROJECTS_CSV, USERS_CSV, WORKDAYS_CSV
+from .test_worktime import SAMPLE_CSV as WORKTIME_CSV
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    """An exporter that keeps the finished spans in memory."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def client(exporter: InMemorySpanExporter) -> TimebutlerClient:
+    """A client whose tracer exports to `exporter`."""
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return TimebutlerClient(api_key="test-api-key", tracer=provider.get_tracer("test"))
+
+
+def _by_name(spans: tuple[ReadableSpan, ...]) -> dict[str, ReadableSpan]:
+    return {span.name: span for span in spans}
+
+
+class TestTracing:
+    """Tests for the spans of TimebutlerClient calls"""
+
+    async def test_call_has_request_and_parse_children(
+        self, client: TimebutlerClient, exporter: InMemorySpanExporter
+    ) -> None:
+        """Verify a get_* call is a span with the HTTP attempt and the parse as children, annotated but without auth."""
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/worktime", status=200, body=WORKTIME_CSV)
+            await client.get_worktime(2026, 1)
+
+        spans = _by_name(exporter.get_finished_spans())
+        call, request, parse = spans["TimebutlerClient.get_worktime"], spans["POST /worktime"], spans["parse worktime"]
+        assert call.parent is None
+        assert request.parent is not None and request.parent.span_id == call.context.span_id
+        assert parse.parent is not None and parse.parent.span_id == call.context.span_id
+        assert call.attributes == {
+            "timebutler.endpoint": "worktime",
+            "timebutler.params.year": "2026",
+            "timebutler.params.month": "1",
+        }
+        assert request.attributes is not None and parse.attributes is not None
+        assert request.attributes["http.response.status_code"] == 200
+        assert request.attributes["http.response.body.size"] == len(WORKTIME_CSV.encode())
+        assert parse.attributes["timebutler.rows"] == 7
+        assert parse.attributes["timebutler.body.size"] == len(WORKTIME_CSV.encode())
+        assert not any(
+            "auth" in key or "test-api-key" in str(value)
+            for span in spans.values()
+            for key, value in (span.attributes or {}).items()
+        )
+
+    async def test_get_workdays_fetches_are_siblings(
+        self, client: TimebutlerClient, exporter: InMemorySpanExporter
+    ) -> None:
+        """Verify the concurrent /workdays and /users fetches of get_workdays are children of its span."""
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/workdays", status=200, body=WORKDAYS_CSV)
+            mocked.post("https://app.timebutler.com/api/v1/users", status=200, body=USERS_CSV)
+            await client.get_workdays()
+
+        spans = _by_name(exporter.get_finished_spans())
+        call_id = spans["TimebutlerClient.get_workdays"].context.span_id
+        users_id = spans["TimebutlerClient.get_users"].context.span_id
+        parents = {name: span.parent.span_id if span.parent else None for name, span in spans.items()}
+        assert parents == {
+            "TimebutlerClient.get_workdays": None,
+            "POST /workdays": call_id,
+            "TimebutlerClient.get_users": call_id,
+            "POST /users": users_id,
+            "parse users": users_id,
+            "parse workdays": call_id,
+        }
+
+    async def test_retried_attempts_are_spans(self, exporter: InMemorySpanExporter) -> None:
+        """Verify every attempt is a span next to the instrumentation; failed ones carry their status and error."""
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        instrumentation = HistogramInstrumentation()
+        client = TimebutlerClient(
+            api_key="test-api-key",
+            retry_policy=RetryPolicy(initial_backoff=0, jitter=0, respect_retry_after=False),
+            instrumentation=instrumentation,
+            tracer=provider.get_tracer("test"),
+        )
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=429, headers={"Retry-After": "3"})
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            await client.get_projects()
+
+        first, second = [span for span in exporter.get_finished_spans() if span.name == "POST /projects"]
+        assert first.status.status_code == StatusCode.ERROR
+        assert first.attributes is not None and second.attributes is not None
+        assert first.attributes["http.response.status_code"] == 429
+        assert first.attributes["error.type"] == "TimebutlerRateLimitError"
+        assert first.attributes["timebutler.retry_after"] == 3
+        assert second.attributes["http.request.resend_count"] == 1
+        assert instrumentation.histogram("projects", "rows").count == 1
+
+    async def test_non_recording_tracer(self) -> None:
+        """Verify a tracer without an SDK behind it works and records nothing."""
+        client = TimebutlerClient(api_key="test-api-key", tracer=NoOpTracer())
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/projects", status=200, body=PROJECTS_CSV)
+            projects = await client.get_projects()
+
+        assert len(projects) == 1
@@ -220,6 +220,43 @@ class TestGetUsers:
 
         assert result == []
 
+    async def test_get_users_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/users",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            result = await client.get_users()
+
+        assert result == EXPECTED_USERS
+        assert [r.model_dump() for r in result] == [e.model_dump() for e in EXPECTED_USERS]
+
+
+class TestIterUsers:
+    """Tests for TimebutlerClient.iter_users()"""
+
+    async def test_iter_users_yields_same_models_as_get_users(self) -> None:
+        """Verify streaming yields the same User models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/users",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            actual = [user async for user in client.iter_users()]
+
+        assert actual == EXPECTED_USERS
+
 
 class TestUserComputedProperties:
     """Tests for User computed properties."""
@@ -1,6 +1,7 @@
 """Tests for TimebutlerClient.get_workdays()"""
 
 from datetime import date, timedelta
+from typing import Literal
 
 import pytest
 from aioresponses import aioresponses
@@ -11,8 +12,10 @@ from timebutler_client import (
     TimebutlerParseError,
     TimebutlerRateLimitError,
     TimebutlerServerError,
+    User,
     WorkdaySchedule,
     WorkdaysResult,
+    fast_parsing,
 )
 
 # pylint: disable=line-too-long
@@ -258,6 +261,72 @@ User ID;Last name;First name;Employee number;E-mail address;Phone;Mobile phone;C
         assert len(user_928812_entries) == 2
         assert all(s.employee_number == "00123" for s in user_928812_entries)
 
+    async def test_get_workdays_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            _mock_both(mocked)
+            result = await client.get_workdays()
+
+        assert result.schedules == EXPECTED_SCHEDULES
+        assert [s.model_dump() for s in result.schedules] == [e.model_dump() for e in EXPECTED_SCHEDULES]
+
+
+class TestGetWorkdaysReusingUsers:
+    """Tests for get_workdays()/iter_workdays() without a second /users request."""
+
+    @pytest.mark.parametrize("parse_mode", ["strict", "fast"])
+    async def test_prefetched_users_skip_users_request(self, parse_mode: Literal["strict", "fast"]) -> None:
+        """Verify passing users fetches only /workdays and skips schedules of users not in the list."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode=parse_mode)
+        users = [user for user in _users_from_csv(SAMPLE_USERS_CSV) if user.user_id != 300224]
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/workdays",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_WORKDAYS_CSV,
+                repeat=True,
+            )
+            result = await client.get_workdays(users=users)
+            streamed = [schedule async for schedule in client.iter_workdays(users=users)]
+
+            assert [key[1].path for key in mocked.requests] == ["/api/v1/workdays"]
+
+        assert result.schedules == EXPECTED_SCHEDULES[:3]
+        assert result.invalid_employees == []
+        assert streamed == EXPECTED_SCHEDULES[:3]
+
+    async def test_cached_users_are_reused(self) -> None:
+        """Verify get_workdays() takes users from the cache filled by get_users()."""
+        client = TimebutlerClient(api_key="test-api-key", cache_ttl={"users": 600})
+
+        with aioresponses() as mocked:
+            _mock_both(mocked)
+            mocked.post(
+                "https://app.timebutler.com/api/v1/workdays",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_WORKDAYS_CSV,
+            )
+            await client.get_users()
+            result = await client.get_workdays()
+            streamed = [schedule async for schedule in client.iter_workdays()]
+
+            requests_per_path = {key[1].path: len(calls) for key, calls in mocked.requests.items()}
+            assert requests_per_path == {"/api/v1/users": 1, "/api/v1/workdays": 2}
+
+        assert result.schedules == EXPECTED_SCHEDULES
+        assert streamed == EXPECTED_SCHEDULES
+
+
+def _users_from_csv(csv_text: str) -> list[User]:
+    """Parse a /users CSV the way get_users() does."""
+    users, _ = fast_parsing.parse_users_csv(csv_text)
+    return users
+
 
 class TestWorkdayScheduleComputedProperties:
     """Tests for WorkdaySchedule computed properties."""
@@ -312,3 +381,17 @@ class TestWorkdayScheduleComputedProperties:
             friday_minutes=480,
         )
         assert schedule.weekly_duration == timedelta(hours=40)
+
+
+class TestIterWorkdays:
+    """Tests for TimebutlerClient.iter_workdays()"""
+
+    async def test_iter_workdays_yields_same_schedules_as_get_workdays(self) -> None:
+        """Verify streaming yields the same WorkdaySchedule models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            _mock_both(mocked)
+            actual = [schedule async for schedule in client.iter_workdays()]
+
+        assert actual == EXPECTED_SCHEDULES
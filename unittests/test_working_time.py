@@ -0,0 +1,208 @@
+"""Tests for the optional expected vs. actual working time calculation in timebutler_client.working_time"""
+
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from timebutler_client import Absence, ScheduleIndex, WorkdaySchedule, WorktimeEntry, WorktimeTable
+from timebutler_client.models.workdays import UNLIMITED_DATE
+
+from .test_workdays import EXPECTED_SCHEDULES
+
+np = pytest.importorskip("numpy")
+working_time = pytest.importorskip("timebutler_client.working_time")
+
+START = date(2026, 1, 5)  # a Monday
+END = date(2026, 1, 11)
+
+
+def _schedule(user_id: int, valid_from: date, minutes: int, employee_number: str = "00001") -> WorkdaySchedule:
+    return WorkdaySchedule(
+        user_id=user_id,
+        valid_from=valid_from,
+        employee_number=employee_number,
+        monday_minutes=minutes,
+        tuesday_minutes=minutes,
+        wednesday_minutes=minutes,
+        thursday_minutes=minutes,
+        friday_minutes=minutes,
+    )
+
+
+def _absence(absence_id: int, from_date: date, to_date: date, **kwargs: Any) -> Absence:
+    return Absence(
+        **{
+            "id": absence_id,
+            "from_date": from_date,
+            "to_date": to_date,
+            "employee_number": "00001",
+            "user_id": 1,
+            "state": "Approved",
+            **kwargs,
+        }
+    )
+
+
+def _entry(entry_id: int, day: date, minutes: int, user_id: int = 1, state: str = "Done") -> WorktimeEntry:
+    return WorktimeEntry(
+        id=entry_id,
+        user_id=user_id,
+        employee_number="00001",
+        date=day,
+        start_time=time(8, 0),
+        end_time=time(17, 0),
+        working_time_seconds=minutes * 60,
+        pause_seconds=0,
+        state=state,
+        project_id=0,
+        service_id=0,
+    )
+
+
+class TestCalculateWorkingTime:
+    """Tests for calculate_working_time()"""
+
+    def test_expected_absent_and_worked_minutes_per_day(self) -> None:
+        """Verify the three matrices for a week with a vacation day, a half day and recorded work."""
+        balance = working_time.calculate_working_time(
+            [_schedule(1, UNLIMITED_DATE, 480)],
+            [
+                _absence(1, date(2026, 1, 6), date(2026, 1, 6)),
+                _absence(2, date(2026, 1, 7), date(2026, 1, 7), half_day=True, morning=True),
+            ],
+            [_entry(1, date(2026, 1, 5), 500), _entry(2, date(2026, 1, 7), 200), _entry(3, date(2026, 1, 7), 30)],
+            START,
+            END,
+        )
+
+        assert balance.user_ids.tolist() == [1]
+        assert balance.periods[0] == np.datetime64("2026-01-05")
+        assert balance.expected_minutes[0].tolist() == [480, 480, 480, 480, 480, 0, 0]
+        assert balance.absent_minutes[0].tolist() == [0, 480, 240, 0, 0, 0, 0]
+        assert balance.worked_minutes[0].tolist() == [500, 0, 230, 0, 0, 0, 0]
+        assert balance.balance_minutes[0].tolist() == [20, 0, -10, -480, -480, 0, 0]
+
+    def test_expected_minutes_match_schedule_index(self) -> None:
+        """Verify the vectorized schedule lookup agrees with ScheduleIndex, including schedule changes."""
+        start, end = date(2024, 2, 1), date(2024, 3, 31)
+        balance = working_time.calculate_working_time(EXPECTED_SCHEDULES, [], [], start, end)
+        index = ScheduleIndex(EXPECTED_SCHEDULES)
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+        for user_id in index:
+            assert balance.expected_minutes[balance.user_index(user_id)].tolist() == index.minutes_on(user_id, days)
+
+    def test_hourly_and_overlapping_absences(self) -> None:
+        """Verify hours are spread over the absence's days and overlaps never exceed the target."""
+        balance = working_time.calculate_working_time(
+            [_schedule(1, date(2020, 1, 1), 480)],
+            [
+                _absence(1, date(2026, 1, 5), date(2026, 1, 6), hours=Decimal("3")),
+                _absence(2, date(2026, 1, 8), date(2026, 1, 9)),
+                _absence(3, date(2026, 1, 9), date(2026, 1, 9), half_day=True),
+                _absence(4, date(2026, 1, 8), date(2026, 1, 8), hours=Decimal("2")),
+            ],
+            [],
+            START,
+            END,
+        )
+
+        assert balance.absent_minutes[0].tolist() == [90, 90, 0, 480, 480, 0, 0]
+
+    def test_hourly_absence_across_weekend(self) -> None:
+        """Verify hours of an absence spanning a weekend are spread over its working days only."""
+        schedules = [_schedule(1, date(2020, 1, 1), 480)]
+        friday_to_monday = (date(2026, 1, 9), date(2026, 1, 12))
+
+        by_api = working_time.calculate_working_time(
+            schedules,
+            [_absence(1, *friday_to_monday, hours=Decimal("16"), workdays=Decimal("2"))],
+            [],
+            date(2026, 1, 9),
+            date(2026, 1, 12),
+        )
+        by_schedule = working_time.calculate_working_time(
+            schedules, [_absence(1, *friday_to_monday, hours=Decimal("8"))], [], date(2026, 1, 9), date(2026, 1, 12)
+        )
+
+        assert by_api.absent_minutes[0].tolist() == [480, 0, 0, 480]
+        assert by_schedule.absent_minutes[0].tolist() == [240, 0, 0, 240]
+
+    def test_absence_states_and_ranges_are_respected(self) -> None:
+        """Verify unapproved absences are ignored by default and long absences are clipped to the range."""
+        schedules = [_schedule(1, date(2020, 1, 1), 480)]
+        absences = [
+            _absence(1, date(2025, 12, 1), date(2026, 1, 5)),
+            _absence(2, date(2026, 1, 6), date(2026, 1, 6), state="Requested"),
+        ]
+
+        default = working_time.calculate_working_time(schedules, absences, [], START, END)
+        all_states = working_time.calculate_working_time(schedules, absences, [], START, END, absence_states=None)
+
+        assert default.absent_minutes[0].tolist() == [480, 0, 0, 0, 0, 0, 0]
+        assert all_states.absent_minutes[0].tolist() == [480, 480, 0, 0, 0, 0, 0]
+
+    def test_absence_without_user_id_is_matched_by_employee_number(self) -> None:
+        """Verify absences with user_id 0 are assigned via the schedules' employee numbers."""
+        balance = working_time.calculate_working_time(
+            [_schedule(1, date(2020, 1, 1), 480, "00001"), _schedule(2, date(2020, 1, 1), 480, "00002")],
+            [_absence(1, START, START, user_id=0, employee_number="00002")],
+            [],
+            START,
+            END,
+        )
+
+        assert balance.absent_minutes[balance.user_index(1)].sum() == 0
+        assert balance.absent_minutes[balance.user_index(2)].sum() == 480
+
+    def test_worktime_table_gives_the_same_result_as_entries(self) -> None:
+        """Verify the column-wise path for WorktimeTable, including state filtering, matches the entry path."""
+        entries = [
+            _entry(1, date(2026, 1, 5), 60),
+            _entry(2, date(2026, 1, 5), 30, state="Requested"),
+            _entry(3, date(2026, 1, 9), 90, user_id=2),
+            _entry(4, date(2026, 1, 12), 45),  # outside the range
+        ]
+        schedules = [_schedule(1, date(2020, 1, 1), 480)]
+
+        for states in (None, ["Done"]):
+            from_entries = working_time.calculate_working_time(
+                schedules, [], entries, START, END, worktime_states=states
+            )
+            from_table = working_time.calculate_working_time(
+                schedules, [], WorktimeTable.from_entries(entries), START, END, worktime_states=states
+            )
+            assert from_table.user_ids.tolist() == from_entries.user_ids.tolist() == [1, 2]
+            assert from_table.worked_minutes.tolist() == from_entries.worked_minutes.tolist()
+        assert from_table.worked_minutes.sum() == 150
+
+    def test_weekly_and_monthly_periods(self) -> None:
+        """Verify days are summed per Monday-based week and per calendar month."""
+        schedules = [_schedule(1, date(2020, 1, 1), 480)]
+        entries = [_entry(1, date(2025, 12, 31), 60), _entry(2, date(2026, 1, 2), 120)]
+
+        weekly = working_time.calculate_working_time(
+            schedules, [], entries, date(2025, 12, 27), date(2026, 1, 4), period="week"
+        )
+        monthly = working_time.calculate_working_time(
+            schedules, [], entries, date(2025, 12, 27), date(2026, 1, 4), period="month"
+        )
+
+        assert weekly.periods.tolist() == [date(2025, 12, 22), date(2025, 12, 29)]
+        assert weekly.expected_minutes[0].tolist() == [0, 5 * 480]
+        assert weekly.worked_minutes[0].tolist() == [0, 180]
+        assert monthly.periods.astype(str).tolist() == ["2025-12", "2026-01"]
+        assert monthly.expected_minutes[0].tolist() == [3 * 480, 2 * 480]
+        assert monthly.worked_minutes[0].tolist() == [60, 120]
+
+    def test_unknown_user_and_invalid_range(self) -> None:
+        """Verify user_index() raises KeyError for unknown users and end < start raises ValueError."""
+        balance = working_time.calculate_working_time([], [], [], START, END)
+
+        assert balance.expected_minutes.shape == (0, 7)
+        with pytest.raises(KeyError):
+            balance.user_index(1)
+        with pytest.raises(ValueError):
+            working_time.calculate_working_time([], [], [], END, START)
@@ -1,9 +1,10 @@
 """Tests for TimebutlerClient.get_worktime()"""
 
 from datetime import date, time, timedelta
+from typing import Any
 
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 
 from timebutler_client import (
     TimebutlerAuthenticationError,
@@ -12,7 +13,9 @@ from timebutler_client import (
     TimebutlerRateLimitError,
     TimebutlerServerError,
     WorktimeEntry,
+    fast_parsing,
 )
+from timebutler_client.models.worktime import _parse_hhmm_string, _parse_hhmm_time
 
 # pylint: disable=line-too-long
 SAMPLE_CSV = """\
@@ -26,6 +29,8 @@ ID of the work time entry;User ID;Employee number;Date (dd/mm/yyyy);Start time (
 28910229;998877;00123;07/01/2026;10:30;17:15;21600;2700;Done;23456;0; ;false"""
 # pylint: enable=line-too-long
 
+WORKTIME_HEADER = "ID of the work time entry;User ID;Employee number;Date (dd/mm/yyyy);Start time (hh:mm);End time (hh:mm);Working time in seconds;Pause in seconds;State;ID of the project;ID of the service;Comments;Auto stopped"
+
 RESPONSE_HEADERS = {
     "date": "Fri, 16 Jan 2026 07:55:20 GMT",
     "content-type": "text/csv;charset=UTF-8",
@@ -314,6 +319,192 @@ class TestGetWorktime:
 
         assert result == []
 
+    async def test_get_worktime_fast_parse_mode_returns_same_models(self) -> None:
+        """Verify the fast parse mode produces the same models as the strict one."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            result = await client.get_worktime()
+
+        assert result == EXPECTED_ENTRIES
+        assert [r.model_dump() for r in result] == [e.model_dump() for e in EXPECTED_ENTRIES]
+
+    def test_fast_parsed_models_do_not_share_state(self) -> None:
+        """Verify every fast-parsed model has its own fields and fields-set, like model_construct() gives it."""
+        first, second = fast_parsing.parse_worktime_csv(SAMPLE_CSV)[:2]
+
+        assert first.model_fields_set == WorktimeEntry.model_construct(**first.model_dump()).model_fields_set
+        first.model_fields_set.discard("comments")
+        assert "comments" in second.model_fields_set
+        assert first.__dict__ is not second.__dict__
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param("not;valid;csv\nmissing;required;fields", id="missing columns"),
+            pytest.param(WORKTIME_HEADER + "\n1;2;00003;2026-01-05;07:00;08:00;3600;0;Done;0;0;;false", id="iso date"),
+            pytest.param(WORKTIME_HEADER + "\n1;2;00003;05/01/2026;7h;08:00;3600;0;Done;0;0;;false", id="bad time"),
+            pytest.param(
+                WORKTIME_HEADER + "\n1;2;00003;05/01/2026;07:00;08:00;an hour;0;Done;0;0;;false", id="bad int"
+            ),
+        ],
+    )
+    async def test_get_worktime_fast_parse_mode_raises_on_malformed_csv(self, body: str) -> None:
+        """Verify the fast parse mode still raises TimebutlerParseError on malformed data."""
+        client = TimebutlerClient(api_key="test-api-key", parse_mode="fast")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=body,
+            )
+
+            with pytest.raises(TimebutlerParseError):
+                await client.get_worktime()
+
+
+def _worktime_by_month(*_args: Any, **kwargs: Any) -> CallbackResult:
+    """Answer a /worktime request with two entries on the 1st and 20th of the requested month (user 1, or as filtered)."""
+    data = kwargs["data"]
+    month, year = int(data["month"]), int(data["year"])
+    user_id = int(data.get("userid", 1))
+    rows = [
+        f"{year * 10000 + month * 100 + day}{user_id};{user_id};00001;{day:02d}/{month:02d}/{year};09:00;10:00;3600;0;Done;0;0;;false"
+        for day in (1, 20)
+    ]
+    return CallbackResult(status=200, headers=RESPONSE_HEADERS, body="\n".join([WORKTIME_HEADER, *rows]))
+
+
+class TestGetWorktimeRange:
+    """Tests for TimebutlerClient.get_worktime_range()"""
+
+    async def test_requests_every_month_in_range_and_filters_by_date(self) -> None:
+        """Verify one request is sent per month and entries outside the range are dropped."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/worktime", callback=_worktime_by_month, repeat=True)
+            actual = await client.get_worktime_range(date(2025, 11, 15), date(2026, 1, 10))
+
+            calls = next(iter(mocked.requests.values()))
+            requested = {(c.kwargs["data"]["year"], c.kwargs["data"]["month"]) for c in calls}
+
+        assert requested == {("2025", "11"), ("2025", "12"), ("2026", "1")}
+        assert [entry.date for entry in actual] == [
+            date(2025, 11, 20),
+            date(2025, 12, 1),
+            date(2025, 12, 20),
+            date(2026, 1, 1),
+        ]
+
+    async def test_requests_every_user_per_month(self) -> None:
+        """Verify the request grid covers every month/user combination."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post("https://app.timebutler.com/api/v1/worktime", callback=_worktime_by_month, repeat=True)
+            actual = await client.get_worktime_range(
+                date(2026, 1, 1), date(2026, 2, 28), user_ids=[7, 8], concurrency=2
+            )
+
+            calls = next(iter(mocked.requests.values()))
+            requested = sorted((c.kwargs["data"]["month"], c.kwargs["data"]["userid"]) for c in calls)
+
+        assert requested == [("1", "7"), ("1", "8"), ("2", "7"), ("2", "8")]
+        assert [(entry.date.month, entry.user_id) for entry in actual] == [
+            (1, 7),
+            (1, 7),
+            (1, 8),
+            (1, 8),
+            (2, 7),
+            (2, 7),
+            (2, 8),
+            (2, 8),
+        ]
+
+    async def test_deduplicates_entries_by_id(self) -> None:
+        """Verify entries returned by several requests are only included once."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+                repeat=True,
+            )
+            actual = await client.get_worktime_range(date(2026, 1, 1), date(2026, 1, 31), user_ids=[998877, 998877])
+
+        assert actual == EXPECTED_ENTRIES
+
+    async def test_raises_on_invalid_arguments(self) -> None:
+        """Verify ValueError is raised for a reversed range or invalid concurrency."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with pytest.raises(ValueError, match="End date must not be before start date"):
+            await client.get_worktime_range(date(2026, 2, 1), date(2026, 1, 1))
+
+        with pytest.raises(ValueError, match="Concurrency must be at least 1"):
+            await client.get_worktime_range(date(2026, 1, 1), date(2026, 1, 31), concurrency=0)
+
+
+class TestIterWorktime:
+    """Tests for TimebutlerClient.iter_worktime()"""
+
+    async def test_iter_worktime_yields_same_models_as_get_worktime(self) -> None:
+        """Verify streaming yields the same WorktimeEntry models as the list-based method."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            actual = [entry async for entry in client.iter_worktime(year=2026, month=1)]
+
+            calls = next(iter(mocked.requests.values()))
+            request_data = calls[0].kwargs.get("data", {})
+            assert request_data["year"] == "2026"
+            assert request_data["month"] == "1"
+
+        assert actual == EXPECTED_ENTRIES
+
+    async def test_iter_worktime_raises_on_invalid_month(self) -> None:
+        """Verify ValueError is raised for invalid month."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with pytest.raises(ValueError, match="Month must be between 1 and 12"):
+            async for _ in client.iter_worktime(month=13):
+                pass
+
+    async def test_iter_worktime_raises_on_rate_limit(self) -> None:
+        """Verify TimebutlerRateLimitError is raised on 429 before anything is yielded."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=429,
+                headers={"Retry-After": "60"},
+            )
+
+            with pytest.raises(TimebutlerRateLimitError):
+                async for _ in client.iter_worktime():
+                    pass
+
 
 class TestWorktimeEntryComputedProperties:
     """Tests for WorktimeEntry computed properties."""
@@ -414,3 +605,31 @@ class TestWorktimeEntryComputedProperties:
             state="Done",
         )
         assert entry.employee_number_numeric == 123
+
+
+class TestHHMMTimeParsing:
+    """Tests for the HH:MM parser behind HHMMTime."""
+
+    def test_parses_zero_padded_time(self) -> None:
+        """Verify the usual zero-padded layout is parsed."""
+        assert _parse_hhmm_time("07:05") == time(7, 5)
+
+    def test_parses_time_without_zero_padding(self) -> None:
+        """Verify times without zero padding are still accepted, as strptime does."""
+        assert _parse_hhmm_time("7:05") == time(7, 5)
+
+    @pytest.mark.parametrize("value", ["24:00", "12:60", "12-30", "ab:cd", ""])
+    def test_rejects_invalid_times(self, value: str) -> None:
+        """Verify invalid times raise ValueError with a helpful message."""
+        with pytest.raises(ValueError, match="Time must be in HH:MM format"):
+            _parse_hhmm_time(value)
+
+    def test_repeated_times_are_served_from_cache(self) -> None:
+        """Verify each distinct time string is only converted once."""
+        _parse_hhmm_string.cache_clear()
+
+        for _ in range(3):
+            _parse_hhmm_time("13:37")
+
+        info = _parse_hhmm_string.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
@@ -0,0 +1,127 @@
+"""Tests for WorktimeTable and TimebutlerClient.get_worktime_table()"""
+
+from datetime import date, time
+
+import pytest
+from aioresponses import aioresponses
+
+from timebutler_client import TimebutlerClient, TimebutlerParseError, WorktimeEntry, WorktimeTable
+
+from .test_worktime import EXPECTED_ENTRIES, RESPONSE_HEADERS, SAMPLE_CSV, WORKTIME_HEADER
+
+
+class TestGetWorktimeTable:
+    """Tests for TimebutlerClient.get_worktime_table()"""
+
+    async def test_get_worktime_table_matches_get_worktime(self) -> None:
+        """Verify the table materializes the same entries as the model-based parser."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=SAMPLE_CSV,
+            )
+
+            table = await client.get_worktime_table(year=2026, month=1)
+
+            calls = next(iter(mocked.requests.values()))
+            request_data = calls[0].kwargs.get("data", {})
+            assert request_data["year"] == "2026"
+            assert request_data["month"] == "1"
+
+        assert len(table) == len(EXPECTED_ENTRIES)
+        assert table.to_entries() == EXPECTED_ENTRIES
+        assert sum(table.working_time_seconds) == sum(e.working_time_seconds for e in EXPECTED_ENTRIES)
+        assert list(table.date_ordinals) == [e.date.toordinal() for e in EXPECTED_ENTRIES]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param("not;valid;csv\nmissing;required;fields", id="missing columns"),
+            pytest.param(WORKTIME_HEADER + "\n1;2;ABC;05/01/2026;07:00;08:00;3600;0;Done;0;0;;false", id="employee"),
+            pytest.param(WORKTIME_HEADER + "\n1;2;00003;2026-01-05;07:00;08:00;3600;0;Done;0;0;;false", id="date"),
+            pytest.param(WORKTIME_HEADER + "\n1;2;00003;05/01/2026;07:00;25:00;3600;0;Done;0;0;;false", id="time"),
+        ],
+    )
+    async def test_get_worktime_table_raises_on_malformed_csv(self, body: str) -> None:
+        """Verify TimebutlerParseError is raised on malformed data."""
+        client = TimebutlerClient(api_key="test-api-key")
+
+        with aioresponses() as mocked:
+            mocked.post(
+                "https://app.timebutler.com/api/v1/worktime",
+                status=200,
+                headers=RESPONSE_HEADERS,
+                body=body,
+            )
+
+            with pytest.raises(TimebutlerParseError):
+                await client.get_worktime_table()
+
+
+class TestWorktimeTable:
+    """Tests for the WorktimeTable container."""
+
+    def test_round_trips_entries(self) -> None:
+        """Verify entries survive conversion into and out of the columnar form."""
+        entry = WorktimeEntry(
+            id=1,
+            user_id=2,
+            employee_number="00042",
+            date=date(2026, 3, 1),
+            start_time=time(23, 15),
+            end_time=time(23, 59),
+            working_time_seconds=2640,
+            state="In process",
+            comments="late shift",
+            auto_stopped=True,
+        )
+
+        table = WorktimeTable.from_entries([entry, *EXPECTED_ENTRIES])
+
+        assert table[0] == entry
+        assert table.to_entries() == [entry, *EXPECTED_ENTRIES]
+        assert table.comments(0) == "late shift"
+        assert table.comments(1) is None
+        assert table.employee_number(0) == "00042"
+        assert table.state(0) == "In process"
+
+    def test_supports_negative_indices_and_slices(self) -> None:
+        """Verify sequence semantics for negative indices and slices."""
+        table = WorktimeTable.from_entries(EXPECTED_ENTRIES)
+
+        assert table[-1] == EXPECTED_ENTRIES[-1]
+        assert isinstance(table[1:4], WorktimeTable)
+        assert table[1:4].to_entries() == EXPECTED_ENTRIES[1:4]
+        assert table[::-2].to_entries() == EXPECTED_ENTRIES[::-2]
+        with pytest.raises(IndexError):
+            _ = table[len(EXPECTED_ENTRIES)]
+
+    def test_stores_repeated_strings_once(self) -> None:
+        """Verify repeated employee numbers and states are dictionary-encoded."""
+        table = WorktimeTable.from_entries(EXPECTED_ENTRIES)
+
+        assert table.employee_number_codes()[1] == ["00123"]
+        assert table.state_codes()[1] == ["Done"]
+
+    def test_employee_number_codes(self) -> None:
+        """Verify the encoded employee number column maps every row to its value and is read-only."""
+        entries = [EXPECTED_ENTRIES[0], EXPECTED_ENTRIES[0].model_copy(update={"employee_number": "00042"})]
+        table = WorktimeTable.from_entries([*entries, entries[0]])
+
+        codes, values = table.employee_number_codes()
+
+        assert [values[code] for code in codes] == ["00123", "00042", "00123"]
+        assert codes.readonly and codes.format == "i"
+
+    def test_state_codes(self) -> None:
+        """Verify the encoded state column maps every row to its state."""
+        entries = [EXPECTED_ENTRIES[0], EXPECTED_ENTRIES[0].model_copy(update={"state": "In process"})]
+        table = WorktimeTable.from_entries(entries)
+
+        codes, values = table.state_codes()
+
+        assert [values[code] for code in codes] == ["Done", "In process"]